@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the MDX fixer scripts.
+
+Each benchmark compares the previous implementation of a transform with the
+current one on the content/ corpus and prints the speedup.
+
+Usage: python scripts/benchmark-mdx-fixers.py [benchmark ...]
+"""
+
+import base64
+import os
+import re
+import sys
+import tempfile
+import time
+
+from mdx_fixers import charmap
+from mdx_fixers.bench import format_comparison, load_corpus, peak_allocations, time_corpus
+from mdx_fixers.frontmatter import HeaderTransform
+from mdx_fixers.normalize import Normalizer, normalized
+from mdx_fixers.rules import COLLAPSE_BLANK_LINES, STRIP_NON_ASCII, STRIP_TRAILING_WHITESPACE
+from mdx_fixers.runner import process_file
+from mdx_fixers.scripts import load_script
+
+
+def legacy_icon_replace(mapping):
+    """The old icon loop: one re.sub (and one full rescan) per icon name."""
+    patterns = [(rf'<{name}[^>]*/?>', emoji) for name, emoji in mapping.items()]
+
+    def replace(content):
+        for pattern, emoji in patterns:
+            content = re.sub(pattern, emoji, content, flags=re.IGNORECASE)
+        return content
+
+    return replace
+
+
+def benchmark_icons(corpus):
+    """Sequential per-icon re.sub vs the single-pass IconTranslator."""
+    texts = [text for _, text in corpus]
+    for script in ('fix-mdx-blog-formatting', 'fix-mdx-blog-formatting-v2'):
+        module = load_script(script)
+        legacy = legacy_icon_replace(module.ICON_MAPPINGS)
+        baseline = time_corpus(legacy, texts)
+        candidate = time_corpus(module.icon_translator.translate, texts)
+        print(format_comparison(f"icons ({script})", baseline, candidate))
+
+
+CALLOUT_COLORS = ['yellow', 'red', 'blue', 'green', 'gray']
+
+
+def synthetic_callout_page(count=500):
+    """A page with count distinct callout boxes separated by prose."""
+    blocks = []
+    for i in range(count):
+        color = CALLOUT_COLORS[i % len(CALLOUT_COLORS)]
+        blocks.append(
+            f'Paragraph {i} of explanatory prose before the callout.\n\n'
+            f'<div className="bg-{color}-50 border-l-4 p-6">\n'
+            f'  <div className="flex items-start gap-3">\n'
+            f'    <h3 className="text-lg font-bold">Callout {i}</h3>\n'
+            f'    <div className="leading-relaxed">Body text for callout {i}.</div>\n'
+            f'  </div>\n'
+            f'</div>\n'
+        )
+    return '\n'.join(blocks)
+
+
+def legacy_container_conversion(module):
+    """The old hero/callout/grid loops: one content.replace per match."""
+    conversions = [
+        (module.HERO_PATTERN, module.convert_hero_section),
+        (module.CALLOUT_PATTERN, module.convert_callout_box),
+        (module.GRID_PATTERN, module.convert_grid_to_list),
+    ]
+
+    def convert(content):
+        for pattern, converter in conversions:
+            for match in pattern.finditer(content):
+                content = content.replace(match.group(0), converter(match.group(0)))
+        return content
+
+    return convert
+
+
+def benchmark_callouts(corpus):
+    """Per-match content.replace vs single-pass substitution on a 500-callout page."""
+    module = load_script('fix-mdx-blog-formatting')
+    legacy = legacy_container_conversion(module)
+
+    def single_pass(content):
+        content = module.HERO_PATTERN.sub(lambda m: module.convert_hero_section(m.group(0)), content)
+        content = module.CALLOUT_PATTERN.sub(lambda m: module.convert_callout_box(m.group(0)), content)
+        return module.GRID_PATTERN.sub(lambda m: module.convert_grid_to_list(m.group(0)), content)
+
+    page = synthetic_callout_page(500)
+    if legacy(page) != single_pass(page):
+        print("  warning: legacy and single-pass output differ on the synthetic page")
+    baseline = time_corpus(legacy, [page])
+    candidate = time_corpus(single_pass, [page])
+    print(format_comparison("callouts (500 on one page)", baseline, candidate))
+
+    texts = [text for _, text in corpus]
+    baseline = time_corpus(legacy, texts)
+    candidate = time_corpus(single_pass, texts)
+    print(format_comparison("callouts (content/ corpus)", baseline, candidate))
+
+
+def synthetic_image_article(megabytes=5):
+    """An article with a multi-megabyte inline base64 image."""
+    image = base64.b64encode(os.urandom(megabytes * 750_000)).decode('ascii')
+    return (
+        '---\n'
+        'title: "Article with an inline image"\n'
+        'date: "2024-01-01"\n'
+        'category: "Security Analysis"\n'
+        '---\n\n'
+        '# Article\n\n'
+        f'![diagram](data:image/png;base64,{image})\n'
+    )
+
+
+def benchmark_headers(corpus):
+    """Whole-file vs header-only date updates on 5 MB articles."""
+    update_blog_dates = load_script('update-blog-dates')
+    article = synthetic_image_article(5)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(10):
+            path = os.path.join(directory, f'article-{i}.mdx')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(article)
+            paths.append(path)
+
+        def time_updates(transform_for):
+            start = time.perf_counter()
+            for i, path in enumerate(paths):
+                process_file(path, transform_for(i))
+            return time.perf_counter() - start
+
+        def header_only(date_str):
+            return HeaderTransform(lambda frontmatter: update_blog_dates.set_blog_date(frontmatter, date_str))
+
+        def whole_file(date_str):
+            # A plain function, so the runner reads and writes the full text
+            transform = header_only(date_str)
+            return lambda content: transform(content)
+
+        # Same-length date: the header is overwritten in place
+        baseline = time_updates(lambda i: whole_file('2025-01-02'))
+        candidate = time_updates(lambda i: header_only('2025-01-03'))
+        print(format_comparison("header edit, same length (10 x 5 MB)", baseline, candidate))
+
+        # Longer value: new header plus a block copy of the body
+        baseline = time_updates(lambda i: whole_file('2025-01-04 00:00'))
+        candidate = time_updates(lambda i: header_only('2025-01-05 00:00:00'))
+        print(format_comparison("header edit, new length (10 x 5 MB)", baseline, candidate))
+
+
+def legacy_normalize(content):
+    """The old fixer endings: one full copy per step that changes something."""
+    content = content.replace('\r\n', '\n').replace('\r', '\n')
+    content = STRIP_TRAILING_WHITESPACE.pattern.sub('', content)
+    return COLLAPSE_BLANK_LINES.pattern.sub('\n\n', content)
+
+
+def untidy(text, seed=0):
+    """text with trailing spaces and extra blank lines on some lines, deterministically."""
+    suffixes = ['', '', '', ' ', '  ', '\t', '\n\n']
+    return '\n'.join(line + suffixes[(i + seed) % len(suffixes)] for i, line in enumerate(text.split('\n')))
+
+
+def format_allocations(label, baseline, candidate):
+    """Format a one-line mean/max peak allocation comparison, in KB."""
+    return (f"{label:<40} baseline {baseline[0] / 1024:9.1f} KB   "
+            f"new {candidate[0] / 1024:9.1f} KB   (max {baseline[1] / 1024:.0f} -> {candidate[1] / 1024:.0f} KB)")
+
+
+def benchmark_normalize(corpus):
+    """Chained CRLF/trailing-whitespace/blank-line steps vs the streaming Normalizer stage."""
+    normalizer = Normalizer()
+    texts = [untidy(text) for _, text in corpus]
+    if any(legacy_normalize(text) != normalizer(text) for text in texts):
+        print("  warning: legacy and streaming output differ on the corpus")
+    print(format_comparison("normalize, text (time)", time_corpus(legacy_normalize, texts), time_corpus(normalizer, texts)))
+
+    # Through the runner, where a @normalized fixer's final stage is
+    # streamed into the file instead of being built as another string
+    fixer = load_script('fix-final-mdx-issues').fix_final_mdx_content
+    stage_only = normalized()(str)
+
+    def legacy_fixer(content):
+        return legacy_normalize(fixer.func(content))
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f'page-{i}.mdx') for i in range(len(texts))]
+
+        def allocations(transform):
+            for path, text in zip(paths, texts):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+            return peak_allocations(lambda path: process_file(path, transform), paths)
+
+        print(format_allocations("normalize stage, file (peak)", allocations(legacy_normalize), allocations(stage_only)))
+        print(format_allocations("fix-final-mdx-issues, file (peak)", allocations(legacy_fixer), allocations(fixer)))
+
+
+def legacy_fold_quotes(content):
+    """The old fix_unicode_quotes: one str.replace per quote character."""
+    for old, new in charmap.QUOTES.items():
+        content = content.replace(old, new)
+    return content
+
+
+def legacy_clean_characters(content):
+    """Quote folding followed by the old [^\\x00-\\x7F]+ rule, as two steps."""
+    return STRIP_NON_ASCII.pattern.sub('', legacy_fold_quotes(content))
+
+
+def benchmark_charmap(corpus):
+    """Chained str.replace and re.sub character clean-ups vs one CharMap pass."""
+    texts = [text for _, text in corpus]
+    comparisons = [
+        ("strip non-ASCII", lambda content: STRIP_NON_ASCII.pattern.sub('', content), charmap.STRIP_NON_ASCII),
+        ("fold quotes", legacy_fold_quotes, charmap.FOLD_QUOTES),
+        ("fold quotes + strip non-ASCII", legacy_clean_characters, charmap.CharMap()),
+    ]
+    for label, legacy, candidate in comparisons:
+        if any(legacy(text) != candidate(text) for text in texts):
+            print(f"  warning: {label}: legacy and CharMap output differ on the corpus")
+        print(format_comparison(label, time_corpus(legacy, texts), time_corpus(candidate, texts)))
+
+
+BENCHMARKS = {
+    'icons': benchmark_icons,
+    'callouts': benchmark_callouts,
+    'headers': benchmark_headers,
+    'normalize': benchmark_normalize,
+    'charmap': benchmark_charmap,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmark(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(BENCHMARKS)}")
+        sys.exit(1)
+
+    corpus = load_corpus()
+    total_bytes = sum(len(text.encode('utf-8')) for _, text in corpus)
+    print(f"Corpus: {len(corpus)} files, {total_bytes / 1e6:.1f} MB\n")
+
+    for name in names:
+        BENCHMARKS[name](corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the MDX fixer transforms on synthetic corpora.
+
+Synthetic pages (see mdx_fixers/synthetic.py) are generated one at a time,
+so even the 100k-page corpus never sits in memory. Every named pipeline
+step, plus the default fused pipeline, is timed over each corpus size and
+reported in MB/s and files/s. Results are saved as JSON; --compare checks
+them against an earlier run and exits non-zero on a throughput regression.
+
+Examples:
+  python scripts/benchmark-mdx-suite.py
+  python scripts/benchmark-mdx-suite.py --sizes 100,1000,10000,100000
+  python scripts/benchmark-mdx-suite.py --transforms comprehensive,lazy-lines --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from mdx_fixers.bench import measure_throughput
+from mdx_fixers.cache import REPO_ROOT
+from mdx_fixers.pipeline import STEPS, Pipeline, resolve_step
+from mdx_fixers.synthetic import synthetic_corpus
+
+DEFAULT_SIZES = '100,1000'
+RESULTS_DIR = REPO_ROOT / '.cache' / 'benchmarks'
+FORMAT_VERSION = 1
+
+
+def git_commit():
+    """The current commit hash, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def parse_sizes(value):
+    sizes = []
+    for size in value.split(','):
+        size = size.strip().lower()
+        if size.endswith('k'):
+            sizes.append(int(size[:-1]) * 1000)
+        elif size:
+            sizes.append(int(size))
+    return sizes
+
+
+def build_transforms(names):
+    """Return (name, transform) pairs; 'pipeline' is the default fused chain."""
+    transforms = []
+    for name in names:
+        if name == 'pipeline':
+            transform = Pipeline()
+            for step in transform.transforms:
+                step.resolve()
+        else:
+            transform = resolve_step(name)
+            transform.resolve()
+        transforms.append((name, transform))
+    return transforms
+
+
+def run_suite(transforms, sizes, seed):
+    results = []
+    for size in sizes:
+        print(f"\n📄 {size} synthetic pages (seed {seed})")
+        print(f"  {'transform':<26} {'MB/s':>9} {'files/s':>11} {'seconds':>9}")
+        for name, transform in transforms:
+            # Some transforms print warnings per page; keep them out of the table
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                stats = measure_throughput(transform, synthetic_corpus(size, seed))
+            stats = dict(stats, transform=name, spec=repr(transform))
+            results.append(stats)
+
+            errors = f"   ⚠️  {stats['errors']} errors" if stats['errors'] else ""
+            print(f"  {name:<26} {stats['mb_per_s'] or 0:9.2f} "
+                  f"{stats['files_per_s'] or 0:11.1f} {stats['seconds']:9.3f}{errors}")
+    return results
+
+
+def compare_results(baseline, results, tolerance):
+    """
+    Print the change in MB/s against a baseline report and return the
+    (transform, pages) pairs that got slower by more than tolerance.
+    """
+    previous = {(r['transform'], r['pages']): r for r in baseline.get('results', [])}
+    regressions = []
+
+    print(f"\n📊 Compared with {baseline.get('git_commit') or 'baseline'} "
+          f"(tolerance {tolerance:.0%})")
+    for result in results:
+        key = (result['transform'], result['pages'])
+        before = previous.get(key)
+        if not before or not before.get('mb_per_s') or not result['mb_per_s']:
+            continue
+        change = result['mb_per_s'] / before['mb_per_s'] - 1
+        marker = "❌" if change < -tolerance else "✅"
+        print(f"  {marker} {key[0]:<26} {key[1]:>7} pages  "
+              f"{before['mb_per_s']:8.2f} -> {result['mb_per_s']:8.2f} MB/s ({change:+.0%})")
+        if change < -tolerance:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--sizes',
+        default=DEFAULT_SIZES,
+        help=f"comma-separated corpus sizes in pages, e.g. 100,1k,10k,100k (default: {DEFAULT_SIZES})"
+    )
+    parser.add_argument(
+        '--transforms',
+        default=None,
+        help="comma-separated step names to time (default: every step plus 'pipeline')"
+    )
+    parser.add_argument('--seed', type=int, default=0, help="seed for the synthetic corpus (default: 0)")
+    parser.add_argument(
+        '--output',
+        default=None,
+        help="JSON file to write the results to (default: .cache/benchmarks/mdx-suite-<time>.json)"
+    )
+    parser.add_argument('--compare', default=None, help="earlier JSON report to compare throughput against")
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help="slowdown allowed by --compare before it fails, as a fraction (default: 0.2)"
+    )
+    args = parser.parse_args()
+
+    names = args.transforms.split(',') if args.transforms else list(STEPS) + ['pipeline']
+    try:
+        sizes = parse_sizes(args.sizes)
+        transforms = build_transforms(name.strip() for name in names if name.strip())
+    except (ValueError, AttributeError, FileNotFoundError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    report = {
+        'version': FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'git_commit': git_commit(),
+        'seed': args.seed,
+        'results': run_suite(transforms, sizes, args.seed),
+    }
+
+    if args.output:
+        output = args.output
+    else:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output = RESULTS_DIR / f"mdx-suite-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    print(f"\n💾 Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare_results(baseline, report['results'], args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,31 @@
 #!/usr/bin/env python3
 import re
-import sys
+
+from mdx_fixers.cli import add_path_arguments, build_parser, fix_files
+from mdx_fixers.masking import CodeMask
 
 def fix_all_indented_text(content):
     """Fix all indented text that might confuse MDX parser."""
     
+    # Code blocks and inline code are left alone; only prose is rewritten
+    mask = CodeMask(content)
+    
     # Fix indented paragraphs after lists
-    content = re.sub(r'(\n- [^\n]+)\n  ([A-Z][^\n]+)', r'\1\n\n\2', content)
+    mask = mask.sub(r'(\n- [^\n]+)\n  ([A-Z][^\n]+)', r'\1\n\n\2')
     
     # Fix indented paragraphs after headers
-    content = re.sub(r'(^#+ [^\n]+)\n  ([A-Z][^\n]+)', r'\1\n\n\2', content, flags=re.MULTILINE)
+    mask = mask.sub(r'(^#+ [^\n]+)\n  ([A-Z][^\n]+)', r'\1\n\n\2', flags=re.MULTILINE)
     
     # Fix general indented text
-    content = re.sub(r'\n  ([A-Z][^\n]{20,})', r'\n\n\1', content)
+    mask = mask.sub(r'\n  ([A-Z][^\n]{20,})', r'\n\n\1')
     
-    return content
+    return mask.text
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python fix-all-indented-text.py <file.mdx>")
-        sys.exit(1)
-    
-    filepath = sys.argv[1]
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    fixed_content = fix_all_indented_text(content)
-    
-    if fixed_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
-        print(f"Fixed all indented text in {filepath}")
-    else:
-        print(f"No indented text issues found in {filepath}")
\ No newline at end of file
+    parser = add_path_arguments(build_parser("Fix indented text that confuses the MDX parser."))
+    fix_files(
+        parser.parse_args(),
+        fix_all_indented_text,
+        "Fixed all indented text in {}",
+        "No indented text issues found in {}"
+    )
@@ -6,7 +6,31 @@ Script to fix blog formatting issues by replacing custom components with standar
 import os
 import re
 
-def fix_blog_formatting():
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.frontmatter import HeaderTransform
+from mdx_fixers.runner import run_corpus
+
+def fix_blog_content(content):
+    """Apply every blog formatting fix to one file."""
+    
+    # Fix frontmatter
+    content = fix_frontmatter(content)
+    
+    # Fix HeroSection components
+    content = fix_hero_section(content)
+    
+    # Fix Badge components
+    content = fix_badge_components(content)
+    
+    # Fix Button components
+    content = fix_button_components(content)
+    
+    # Fix CalloutBox components
+    content = fix_callout_box_components(content)
+    
+    return content
+
+def fix_blog_formatting(jobs=None, cache=None, frontmatter_only=False):
     blog_dir = "content/blog"
     
     # List of files that need fixing
@@ -18,68 +42,51 @@ def fix_blog_formatting():
         "ai-security-financial-services-regulatory-requirements.mdx"
     ]
     
+    paths = []
     for filename in files_to_fix:
         filepath = os.path.join(blog_dir, filename)
         if not os.path.exists(filepath):
             print(f"File not found: {filepath}")
             continue
-            
-        print(f"Fixing {filename}...")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix frontmatter
-        content = fix_frontmatter(content)
-        
-        # Fix HeroSection components
-        content = fix_hero_section(content)
-        
-        # Fix Badge components
-        content = fix_badge_components(content)
-        
-        # Fix Button components
-        content = fix_button_components(content)
-        
-        # Fix CalloutBox components
-        content = fix_callout_box_components(content)
-        
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"✅ Fixed {filename}")
+        paths.append(filepath)
+    
+    # Frontmatter fixes alone only need each file's header
+    transform = fix_frontmatter if frontmatter_only else fix_blog_content
+    return run_corpus(paths, transform, jobs=jobs, cache=cache)
 
-def fix_frontmatter(content):
+# Non-standard categories and the website category they map to
+CATEGORY_REPLACEMENTS = {
+    'Industry Deep Dive': 'Industry Applications',
+    'Governance & Strategy': 'Compliance & Governance',
+    'Technical Deep Dive': 'Technical Research',
+    'Implementation Guide': 'Implementation Guides',
+    'Security Analysis': 'AI Security',
+    'Red Team Operations': 'Red Team Testing',
+    'Enterprise Strategy': 'Compliance & Governance',
+    'Threat Intelligence': 'AI Security',
+    'Financial Security': 'Industry Applications',
+    'Critical Infrastructure': 'Industry Applications',
+    'Program Development': 'Implementation Guides',
+    'Future Threats': 'AI Security'
+}
+
+def edit_frontmatter(frontmatter):
     """Fix frontmatter to match website standards"""
     
     # Replace non-standard frontmatter fields
-    replacements = {
-        'publishDate:': 'date:',
-        'readingTime:': 'readTime:',
-        'authorRole:': '# authorRole:',
-        'category: "Industry Deep Dive"': 'category: "Industry Applications"',
-        'category: "Governance & Strategy"': 'category: "Compliance & Governance"',
-        'category: "Technical Deep Dive"': 'category: "Technical Research"',
-        'category: "Implementation Guide"': 'category: "Implementation Guides"',
-        'category: "Security Analysis"': 'category: "AI Security"',
-        'category: "Red Team Operations"': 'category: "Red Team Testing"',
-        'category: "Enterprise Strategy"': 'category: "Compliance & Governance"',
-        'category: "Threat Intelligence"': 'category: "AI Security"',
-        'category: "Financial Security"': 'category: "Industry Applications"',
-        'category: "Critical Infrastructure"': 'category: "Industry Applications"',
-        'category: "Program Development"': 'category: "Implementation Guides"',
-        'category: "Future Threats"': 'category: "AI Security"'
-    }
-    
-    for old, new in replacements.items():
-        content = content.replace(old, new)
+    frontmatter.rename('publishDate', 'date')
+    frontmatter.rename('readingTime', 'readTime')
+    frontmatter.comment_out('authorRole')
     
-    # Add missing fields if they don't exist
-    if 'featured:' not in content:
-        content = content.replace('toc: true', 'featured: false\ntoc: true')
+    category = frontmatter.get('category')
+    if category in CATEGORY_REPLACEMENTS:
+        frontmatter.set('category', CATEGORY_REPLACEMENTS[category])
     
-    return content
+    # Add missing fields if they don't exist
+    if 'featured' not in frontmatter and frontmatter.get('toc') is True:
+        frontmatter.set('featured', False, before='toc')
+
+fix_frontmatter = HeaderTransform(edit_frontmatter)
 
 def fix_hero_section(content):
     """Replace HeroSection components with standard div structure"""
@@ -242,5 +249,12 @@ def fix_callout_box_components(content):
     return content
 
 if __name__ == "__main__":
-    fix_blog_formatting()
+    parser = build_parser(__doc__)
+    parser.add_argument(
+        '--frontmatter-only',
+        action='store_true',
+        help="only fix frontmatter fields, without reading article bodies"
+    )
+    args = parser.parse_args()
+    fix_blog_formatting(args.jobs, open_cache(args), args.frontmatter_only)
     print("✅ All blog formatting issues have been fixed!") 
\ No newline at end of file
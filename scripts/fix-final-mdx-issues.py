@@ -3,49 +3,52 @@
 Final script to fix remaining MDX issues
 """
 
-import os
 import re
 
-def fix_final_mdx_issues():
+from mdx_fixers.charmap import STRIP_NON_ASCII
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.normalize import normalized
+from mdx_fixers.rules import (
+    BLANK_LINE_AFTER_DIV, BLANK_LINE_BEFORE_DIV, UNWRAP_CODE_DIV_CLOSE, UNWRAP_CODE_DIV_OPEN,
+)
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
+@normalized(blank_lines=False)
+def fix_final_mdx_content(content):
+    """Fix the remaining backtick, spacing and character issues."""
+    
+    # Fix 1: Remove problematic backticks that are causing JSX parsing errors
+    content = re.sub(r'`(\d+[^`]*=.*?)`', r'\1', content)
+    # (spelled so that a lone backtick doesn't make it backtrack
+    # cubically; it matches exactly what `(\d+[^`]*[^\w\s][^`]*)` did)
+    content = re.sub(r'`(\d+[^`]*`[^`]*|\d+[\w\s]*[^\w\s`][^`]*)`', r'\1', content)
+    
+    # Fix 2: Remove any remaining problematic backticks around JSX
+    content = UNWRAP_CODE_DIV_OPEN(content)
+    content = UNWRAP_CODE_DIV_CLOSE(content)
+    
+    # Fix 3: Ensure proper spacing around JSX elements
+    content = BLANK_LINE_BEFORE_DIV(content)
+    content = BLANK_LINE_AFTER_DIV(content)
+    
+    # Fix 4: Remove any invalid characters
+    content = STRIP_NON_ASCII(content)
+    
+    # Fixes 5 and 6: line endings and trailing whitespace are normalised
+    # by the final stage (see @normalized)
+    
+    return content
+
+def fix_final_mdx_issues(jobs=None, cache=None):
     blog_dir = "content/blog"
     
     # Get all MDX files
-    mdx_files = [f for f in os.listdir(blog_dir) if f.endswith('.mdx')]
-    
-    for filename in mdx_files:
-        filepath = os.path.join(blog_dir, filename)
-        print(f"Fixing final issues in {filename}...")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix 1: Remove problematic backticks that are causing JSX parsing errors
-        content = re.sub(r'`(\d+[^`]*=.*?)`', r'\1', content)
-        content = re.sub(r'`(\d+[^`]*[^\w\s][^`]*)`', r'\1', content)
-        
-        # Fix 2: Remove any remaining problematic backticks around JSX
-        content = re.sub(r'`(<div[^>]*>)`', r'\1', content)
-        content = re.sub(r'`(</div>)`', r'\1', content)
-        
-        # Fix 3: Ensure proper spacing around JSX elements
-        content = re.sub(r'(\n)(<div)', r'\1\n\2', content)
-        content = re.sub(r'(</div>)(\n)', r'\1\n\n\2', content)
-        
-        # Fix 4: Remove any invalid characters
-        content = re.sub(r'[^\x00-\x7F]+', '', content)
-        
-        # Fix 5: Ensure proper line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Fix 6: Remove any trailing whitespace
-        content = re.sub(r'[ \t]+$', '', content, flags=re.MULTILINE)
-        
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"✅ Fixed final issues in {filename}")
+    mdx_files = find_mdx_files(blog_dir)
+    
+    print(f"Fixing final issues in {len(mdx_files)} files...")
+    return run_corpus(mdx_files, fix_final_mdx_content, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    fix_final_mdx_issues()
-    print("✅ All final MDX issues have been fixed!") 
\ No newline at end of file
+    args = build_parser(__doc__).parse_args()
+    fix_final_mdx_issues(args.jobs, open_cache(args))
+    print("✅ All final MDX issues have been fixed!") 
@@ -3,52 +3,52 @@
 Script to fix hydration errors in MDX files
 """
 
-import os
 import re
 
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.rules import COLLAPSE_WHITESPACE_LINES
+from mdx_fixers.runner import find_mdx_files, run_corpus
 
-def fix_hydration_errors():
-    blog_dir = "content/blog"
 
-    # Get all MDX files
-    mdx_files = [f for f in os.listdir(blog_dir) if f.endswith('.mdx')]
+def fix_hydration_content(content):
+    """Fix nested and empty paragraph tags that break hydration."""
 
-    for filename in mdx_files:
-        filepath = os.path.join(blog_dir, filename)
-        print(f"Fixing hydration errors in {filename}...")
+    # Fix 1: Remove nested p tags - replace <p><p> with <p>
+    content = re.sub(r'<p>\s*<p>', '<p>', content)
+    content = re.sub(r'</p>\s*</p>', '</p>', content)
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+    # Fix 2: Remove empty p tags
+    content = re.sub(r'<p>\s*</p>', '', content)
 
-        # Fix 1: Remove nested p tags - replace <p><p> with <p>
-        content = re.sub(r'<p>\s*<p>', '<p>', content)
-        content = re.sub(r'</p>\s*</p>', '</p>', content)
+    # Fix 3: Fix any remaining nested paragraph structures
+    # Replace <p><div> with <div>
+    content = re.sub(r'<p>\s*<div', '<div', content)
+    # Replace </div></p> with </div>
+    content = re.sub(r'</div>\s*</p>', '</div>', content)
 
-        # Fix 2: Remove empty p tags
-        content = re.sub(r'<p>\s*</p>', '', content)
+    # Fix 4: Remove any standalone p tags that might cause issues
+    content = re.sub(r'<p>\s*</p>', '', content)
 
-        # Fix 3: Fix any remaining nested paragraph structures
-        # Replace <p><div> with <div>
-        content = re.sub(r'<p>\s*<div', '<div', content)
-        # Replace </div></p> with </div>
-        content = re.sub(r'</div>\s*</p>', '</div>', content)
+    # Fix 5: Ensure proper spacing around divs
+    content = re.sub(r'</div>\s*<div', '</div>\n\n<div', content)
 
-        # Fix 4: Remove any standalone p tags that might cause issues
-        content = re.sub(r'<p>\s*</p>', '', content)
+    # Fix 6: Remove any empty lines that might cause issues
+    content = COLLAPSE_WHITESPACE_LINES(content)
 
-        # Fix 5: Ensure proper spacing around divs
-        content = re.sub(r'</div>\s*<div', '</div>\n\n<div', content)
+    return content
 
-        # Fix 6: Remove any empty lines that might cause issues
-        content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
 
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+def fix_hydration_errors(jobs=None, cache=None):
+    blog_dir = "content/blog"
+
+    # Get all MDX files
+    mdx_files = find_mdx_files(blog_dir)
 
-        print(f"✅ Fixed {filename}")
+    print(f"Fixing hydration errors in {len(mdx_files)} files...")
+    return run_corpus(mdx_files, fix_hydration_content, jobs=jobs, cache=cache)
 
 
 if __name__ == "__main__":
-    fix_hydration_errors()
+    args = build_parser(__doc__).parse_args()
+    fix_hydration_errors(args.jobs, open_cache(args))
     print("✅ All hydration errors have been fixed!")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import re
-import sys
+
+from mdx_fixers.cli import add_path_arguments, build_parser, fix_files
 
 def fix_indented_content(content):
     """Fix indented content after headers that causes MDX parsing issues."""
@@ -14,20 +15,10 @@ def fix_indented_content(content):
     return content
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python fix-indented-content.py <file.mdx>")
-        sys.exit(1)
-    
-    filepath = sys.argv[1]
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    fixed_content = fix_indented_content(content)
-    
-    if fixed_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
-        print(f"Fixed indented content in {filepath}")
-    else:
-        print(f"No indented content issues found in {filepath}")
\ No newline at end of file
+    parser = add_path_arguments(build_parser("Fix indented content after headers in MDX files."))
+    fix_files(
+        parser.parse_args(),
+        fix_indented_content,
+        "Fixed indented content in {}",
+        "No indented content issues found in {}"
+    )
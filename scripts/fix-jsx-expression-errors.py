@@ -3,47 +3,52 @@
 Script to fix JSX expression parsing errors in MDX files
 """
 
-import os
 import re
 
-def fix_jsx_expression_errors():
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.masking import CodeMask
+from mdx_fixers.normalize import normalized
+from mdx_fixers.rules import STRIP_NON_ASCII
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
+@normalized(trailing_whitespace=False, blank_lines=False)
+def fix_jsx_expression_content(content):
+    """Escape numeric lines that MDX would parse as JSX expressions."""
+    
+    # Code blocks and inline code are left alone; only prose is rewritten
+    mask = CodeMask(content)
+    
+    # Fix 1: Escape lines that start with numbers and contain equals signs
+    # These are being interpreted as JSX expressions
+    mask = mask.sub(r'^(\d+[^=]*=.*)$', r'`\1`', flags=re.MULTILINE)
+    
+    # Fix 2: Escape lines that start with numbers and contain special characters
+    mask = mask.sub(r'^(\d+[^`]*[^\w\s][^`]*)$', r'`\1`', flags=re.MULTILINE)
+    
+    # Fix 3: Ensure proper spacing around problematic patterns
+    mask = mask.sub(r'(\n)(\d+[^`]*=.*?)(\n)', r'\1`\2`\3')
+    
+    # Fix 4: Handle specific problematic patterns
+    mask = mask.sub(r'(\n)(\d+\s+[^`]*=.*?)(\n)', r'\1`\2`\3')
+    
+    # Fix 5: Remove any invalid characters that might cause parsing issues
+    mask = mask.sub(STRIP_NON_ASCII.pattern, '')
+    content = mask.text
+    
+    # Fix 6: Line endings are normalised by the final stage (see @normalized)
+    
+    return content
+
+def fix_jsx_expression_errors(jobs=None, cache=None):
     blog_dir = "content/blog"
     
     # Get all MDX files
-    mdx_files = [f for f in os.listdir(blog_dir) if f.endswith('.mdx')]
-    
-    for filename in mdx_files:
-        filepath = os.path.join(blog_dir, filename)
-        print(f"Fixing JSX expression errors in {filename}...")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix 1: Escape lines that start with numbers and contain equals signs
-        # These are being interpreted as JSX expressions
-        content = re.sub(r'^(\d+[^=]*=.*)$', r'`\1`', content, flags=re.MULTILINE)
-        
-        # Fix 2: Escape lines that start with numbers and contain special characters
-        content = re.sub(r'^(\d+[^`]*[^\w\s][^`]*)$', r'`\1`', content, flags=re.MULTILINE)
-        
-        # Fix 3: Ensure proper spacing around problematic patterns
-        content = re.sub(r'(\n)(\d+[^`]*=.*?)(\n)', r'\1`\2`\3', content)
-        
-        # Fix 4: Handle specific problematic patterns
-        content = re.sub(r'(\n)(\d+\s+[^`]*=.*?)(\n)', r'\1`\2`\3', content)
-        
-        # Fix 5: Remove any invalid characters that might cause parsing issues
-        content = re.sub(r'[^\x00-\x7F]+', '', content)
-        
-        # Fix 6: Ensure proper line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"✅ Fixed JSX expression errors in {filename}")
+    mdx_files = find_mdx_files(blog_dir)
+    
+    print(f"Fixing JSX expression errors in {len(mdx_files)} files...")
+    return run_corpus(mdx_files, fix_jsx_expression_content, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    fix_jsx_expression_errors()
-    print("✅ All JSX expression errors have been fixed!") 
\ No newline at end of file
+    args = build_parser(__doc__).parse_args()
+    fix_jsx_expression_errors(args.jobs, open_cache(args))
+    print("✅ All JSX expression errors have been fixed!") 
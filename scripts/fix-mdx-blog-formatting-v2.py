@@ -4,11 +4,92 @@ Enhanced MDX blog files formatting fix - Version 2
 Converts JSX/HTML components to clean markdown with better handling of nested structures.
 """
 
-import os
 import re
 import sys
 from pathlib import Path
 
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.icons import IconTranslator
+from mdx_fixers.rules import (
+    BLANK_LINE_AFTER_HEADING, BLANK_LINE_AFTER_LIST, CLASSNAME_TO_CLASS, STRIP_IMPORTS,
+    STRIP_LEADING_BLANK_LINES,
+)
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
+# Icon components converted to emojis (comprehensive list)
+# Compiled once into a single matcher; the longest icon name wins
+ICON_MAPPINGS = {
+    'Shield': '🛡️',
+    'Lock': '🔒',
+    'Target': '🎯',
+    'Cpu': '💻',
+    'Database': '🗄️',
+    'AlertTriangle': '⚠️',
+    'CheckCircle': '✅',
+    'XCircle': '❌',
+    'Info': 'ℹ️',
+    'AlertCircle': '⚠️',
+    'Terminal': '💻',
+    'Code': '💻',
+    'FileText': '📄',
+    'Users': '👥',
+    'Building': '🏢',
+    'Brain': '🧠',
+    'Zap': '⚡',
+    'ChevronRight': '➡️',
+    'ArrowRight': '→',
+    'Clock': '🕐',
+    'Calendar': '📅',
+    'Mail': '✉️',
+    'Phone': '📞',
+    'Globe': '🌐',
+    'Search': '🔍',
+    'Settings': '⚙️',
+    'Tool': '🔧',
+    'Wrench': '🔧',
+    'Key': '🔑',
+    'Eye': '👁️',
+    'TrendingUp': '📈',
+    'TrendingDown': '📉',
+    'DollarSign': '💰',
+    'Activity': '📊',
+    'BarChart': '📊',
+    'PieChart': '📊',
+    'LineChart': '📈',
+    'Award': '🏆',
+    'Star': '⭐',
+    'Heart': '❤️',
+    'ThumbsUp': '👍',
+    'ThumbsDown': '👎',
+    'MessageCircle': '💬',
+    'MessageSquare': '💬',
+    'Send': '📤',
+    'Download': '📥',
+    'Upload': '📤',
+    'Bookmark': '🔖',
+    'Flag': '🚩',
+    'MapPin': '📍',
+    'Home': '🏠',
+    'Package': '📦',
+    'Box': '📦',
+    'Folder': '📁',
+    'File': '📄',
+    'Layers': '📚',
+    'Filter': '🔽',
+    'Sliders': '🎛️',
+    'Gauge': '🎯',
+    'CheckSquare': '☑️',
+    'Square': '⬜',
+    'Circle': '⭕',
+    'HelpCircle': '❓',
+    'Plus': '➕',
+    'Minus': '➖',
+    'X': '❌',
+    'Check': '✓'
+}
+
+icon_translator = IconTranslator(ICON_MAPPINGS)
+
 def clean_jsx_divs(content):
     """Remove all JSX div containers and clean up their content."""
     
@@ -83,84 +164,13 @@ def process_mdx_file_v2(content):
     """Process MDX content with enhanced formatting fixes."""
     
     # Remove import statements
-    content = re.sub(r'^import\s+.*?;?\s*$', '', content, flags=re.MULTILINE)
+    content = STRIP_IMPORTS(content)
     
     # Remove empty lines at the beginning (after removing imports)
-    content = re.sub(r'^(\s*\n)+', '', content)
-    
-    # Convert icon components to emojis (comprehensive list)
-    icon_mappings = {
-        r'<Shield[^>]*/?>' : '🛡️',
-        r'<Lock[^>]*/?>' : '🔒',
-        r'<Target[^>]*/?>' : '🎯',
-        r'<Cpu[^>]*/?>' : '💻',
-        r'<Database[^>]*/?>' : '🗄️',
-        r'<AlertTriangle[^>]*/?>' : '⚠️',
-        r'<CheckCircle[^>]*/?>' : '✅',
-        r'<XCircle[^>]*/?>' : '❌',
-        r'<Info[^>]*/?>' : 'ℹ️',
-        r'<AlertCircle[^>]*/?>' : '⚠️',
-        r'<Terminal[^>]*/?>' : '💻',
-        r'<Code[^>]*/?>' : '💻',
-        r'<FileText[^>]*/?>' : '📄',
-        r'<Users[^>]*/?>' : '👥',
-        r'<Building[^>]*/?>' : '🏢',
-        r'<Brain[^>]*/?>' : '🧠',
-        r'<Zap[^>]*/?>' : '⚡',
-        r'<ChevronRight[^>]*/?>' : '➡️',
-        r'<ArrowRight[^>]*/?>' : '→',
-        r'<Clock[^>]*/?>' : '🕐',
-        r'<Calendar[^>]*/?>' : '📅',
-        r'<Mail[^>]*/?>' : '✉️',
-        r'<Phone[^>]*/?>' : '📞',
-        r'<Globe[^>]*/?>' : '🌐',
-        r'<Search[^>]*/?>' : '🔍',
-        r'<Settings[^>]*/?>' : '⚙️',
-        r'<Tool[^>]*/?>' : '🔧',
-        r'<Wrench[^>]*/?>' : '🔧',
-        r'<Key[^>]*/?>' : '🔑',
-        r'<Eye[^>]*/?>' : '👁️',
-        r'<TrendingUp[^>]*/?>' : '📈',
-        r'<TrendingDown[^>]*/?>' : '📉',
-        r'<DollarSign[^>]*/?>' : '💰',
-        r'<Activity[^>]*/?>' : '📊',
-        r'<BarChart[^>]*/?>' : '📊',
-        r'<PieChart[^>]*/?>' : '📊',
-        r'<LineChart[^>]*/?>' : '📈',
-        r'<Award[^>]*/?>' : '🏆',
-        r'<Star[^>]*/?>' : '⭐',
-        r'<Heart[^>]*/?>' : '❤️',
-        r'<ThumbsUp[^>]*/?>' : '👍',
-        r'<ThumbsDown[^>]*/?>' : '👎',
-        r'<MessageCircle[^>]*/?>' : '💬',
-        r'<MessageSquare[^>]*/?>' : '💬',
-        r'<Send[^>]*/?>' : '📤',
-        r'<Download[^>]*/?>' : '📥',
-        r'<Upload[^>]*/?>' : '📤',
-        r'<Bookmark[^>]*/?>' : '🔖',
-        r'<Flag[^>]*/?>' : '🚩',
-        r'<MapPin[^>]*/?>' : '📍',
-        r'<Home[^>]*/?>' : '🏠',
-        r'<Package[^>]*/?>' : '📦',
-        r'<Box[^>]*/?>' : '📦',
-        r'<Folder[^>]*/?>' : '📁',
-        r'<File[^>]*/?>' : '📄',
-        r'<Layers[^>]*/?>' : '📚',
-        r'<Filter[^>]*/?>' : '🔽',
-        r'<Sliders[^>]*/?>' : '🎛️',
-        r'<Gauge[^>]*/?>' : '🎯',
-        r'<CheckSquare[^>]*/?>' : '☑️',
-        r'<Square[^>]*/?>' : '⬜',
-        r'<Circle[^>]*/?>' : '⭕',
-        r'<HelpCircle[^>]*/?>' : '❓',
-        r'<Plus[^>]*/?>' : '➕',
-        r'<Minus[^>]*/?>' : '➖',
-        r'<X[^>]*/?>' : '❌',
-        r'<Check[^>]*/?>' : '✓'
-    }
-    
-    for pattern, emoji in icon_mappings.items():
-        content = re.sub(pattern, emoji, content, flags=re.IGNORECASE)
+    content = STRIP_LEADING_BLANK_LINES(content)
+    
+    # Convert icon components to emojis in a single pass
+    content = icon_translator.translate(content)
     
     # Convert JSX headers first
     content = convert_jsx_headers(content)
@@ -178,16 +188,16 @@ def process_mdx_file_v2(content):
     content = clean_jsx_divs(content)
     
     # Convert className to class for any remaining elements
-    content = re.sub(r'className=', 'class=', content)
+    content = CLASSNAME_TO_CLASS(content)
     
     # Fix multiple consecutive line breaks
     content = re.sub(r'\n{4,}', '\n\n\n', content)
     
     # Fix spacing around headers
-    content = re.sub(r'(^#{1,6} .+)$\n(?=[^\n])', r'\1\n\n', content, flags=re.MULTILINE)
+    content = BLANK_LINE_AFTER_HEADING(content)
     
     # Fix list spacing
-    content = re.sub(r'(\n- .+)(\n)(?=\S)', r'\1\n\n', content)
+    content = BLANK_LINE_AFTER_LIST(content)
     
     # Clean up leading/trailing whitespace on lines
     lines = content.split('\n')
@@ -199,7 +209,7 @@ def process_mdx_file_v2(content):
     
     return content
 
-def main():
+def main(jobs=None, cache=None):
     """Main function to process all MDX files."""
     blog_dir = Path("/Users/scott/Documents/code/scthornton/perfecxion-site/content/blog")
     
@@ -208,7 +218,7 @@ def main():
         sys.exit(1)
     
     # Get all MDX files
-    mdx_files = list(blog_dir.glob("*.mdx"))
+    mdx_files = find_mdx_files(blog_dir)
     
     if not mdx_files:
         print("No MDX files found in the blog directory")
@@ -216,34 +226,8 @@ def main():
     
     print(f"Found {len(mdx_files)} MDX files to process")
     
-    success_count = 0
-    error_count = 0
-    
-    for mdx_file in mdx_files:
-        try:
-            print(f"Processing: {mdx_file.name}")
-            
-            # Read the file
-            with open(mdx_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Process the content
-            processed_content = process_mdx_file_v2(content)
-            
-            # Write back the processed content
-            with open(mdx_file, 'w', encoding='utf-8') as f:
-                f.write(processed_content)
-            
-            success_count += 1
-            print(f"  ✓ Successfully processed {mdx_file.name}")
-            
-        except Exception as e:
-            error_count += 1
-            print(f"  ✗ Error processing {mdx_file.name}: {str(e)}")
-    
-    print(f"\nProcessing complete:")
-    print(f"  - Success: {success_count} files")
-    print(f"  - Errors: {error_count} files")
+    run_corpus(mdx_files, process_mdx_file_v2, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = build_parser(__doc__).parse_args()
+    main(args.jobs, open_cache(args))
\ No newline at end of file
@@ -4,214 +4,227 @@ Fix MDX blog files formatting issues by converting JSX/HTML components to clean
 This script removes imports, converts JSX components to markdown, and ensures proper rendering.
 """
 
-import os
 import re
 import sys
 from pathlib import Path
 
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.icons import IconTranslator
+from mdx_fixers.rules import (
+    BLANK_LINE_AFTER_HEADING, BLANK_LINE_AFTER_LIST, CLASSNAME_TO_CLASS, COLLAPSE_BLANK_LINES,
+    STRIP_IMPORTS, STRIP_LEADING_BLANK_LINES,
+)
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
+# Icon components converted to emojis
+# Compiled once into a single matcher; the longest icon name wins
+ICON_MAPPINGS = {
+    'Shield': '🛡️',
+    'Lock': '🔒',
+    'Target': '🎯',
+    'Cpu': '💻',
+    'Database': '🗄️',
+    'AlertTriangle': '⚠️',
+    'CheckCircle': '✅',
+    'XCircle': '❌',
+    'Info': 'ℹ️',
+    'AlertCircle': '⚠️',
+    'Terminal': '💻',
+    'Code': '💻',
+    'FileText': '📄',
+    'Users': '👥',
+    'Building': '🏢',
+    'Brain': '🧠',
+    'Zap': '⚡',
+    'ChevronRight': '➡️',
+    'ArrowRight': '→',
+    'Clock': '🕐',
+    'Calendar': '📅',
+    'Mail': '✉️',
+    'Phone': '📞',
+    'Globe': '🌐',
+    'Search': '🔍',
+    'Settings': '⚙️',
+    'Tool': '🔧',
+    'Wrench': '🔧',
+    'Key': '🔑',
+    'Eye': '👁️',
+    'TrendingUp': '📈',
+    'TrendingDown': '📉',
+    'DollarSign': '💰',
+    'Activity': '📊',
+    'BarChart': '📊',
+    'PieChart': '📊',
+    'LineChart': '📈',
+    'Star': '⭐',
+    'Heart': '❤️',
+    'ThumbsUp': '👍',
+    'ThumbsDown': '👎',
+    'MessageCircle': '💬',
+    'MessageSquare': '💬',
+    'Send': '📤',
+    'Download': '📥',
+    'Upload': '📤',
+    'Cloud': '☁️',
+    'CloudOff': '🌫️',
+    'Wifi': '📶',
+    'WifiOff': '📵',
+    'Battery': '🔋',
+    'Camera': '📷',
+    'Video': '📹',
+    'Mic': '🎤',
+    'Volume': '🔊',
+    'VolumeX': '🔇',
+    'Play': '▶️',
+    'Pause': '⏸️',
+    'Stop': '⏹️',
+    'FastForward': '⏩',
+    'Rewind': '⏪',
+    'RefreshCw': '🔄',
+    'RotateCw': '🔄',
+    'Save': '💾',
+    'Trash': '🗑️',
+    'Edit': '✏️',
+    'Copy': '📋',
+    'Clipboard': '📋',
+    'Link': '🔗',
+    'ExternalLink': '🔗',
+    'Share': '🔗',
+    'Bookmark': '🔖',
+    'Flag': '🚩',
+    'MapPin': '📍',
+    'Navigation': '🧭',
+    'Compass': '🧭',
+    'Home': '🏠',
+    'Package': '📦',
+    'Box': '📦',
+    'Archive': '🗂️',
+    'Folder': '📁',
+    'File': '📄',
+    'Paperclip': '📎',
+    'Printer': '🖨️',
+    'HardDrive': '💿',
+    'Server': '🖥️',
+    'Monitor': '🖥️',
+    'Smartphone': '📱',
+    'Tablet': '📱',
+    'Watch': '⌚',
+    'Headphones': '🎧',
+    'Speaker': '🔊',
+    'Bluetooth': '📶',
+    'Rss': '📡',
+    'Radio': '📻',
+    'Tv': '📺',
+    'Film': '🎬',
+    'Image': '🖼️',
+    'Aperture': '📷',
+    'Sun': '☀️',
+    'Moon': '🌙',
+    'CloudRain': '🌧️',
+    'CloudSnow': '🌨️',
+    'Wind': '💨',
+    'Droplet': '💧',
+    'Umbrella': '☂️',
+    'Coffee': '☕',
+    'Briefcase': '💼',
+    'ShoppingBag': '🛍️',
+    'ShoppingCart': '🛒',
+    'CreditCard': '💳',
+    'Gift': '🎁',
+    'Bell': '🔔',
+    'BellOff': '🔕',
+    'Hash': '#️⃣',
+    'AtSign': '@',
+    'Percent': '%',
+    'Plus': '➕',
+    'Minus': '➖',
+    'X': '❌',
+    'Check': '✓',
+    'Circle': '⭕',
+    'Square': '⬜',
+    'Triangle': '🔺',
+    'Hexagon': '⬡',
+    'Octagon': '🛑',
+    'HelpCircle': '❓',
+    'Layers': '📚',
+    'Filter': '🔽',
+    'Sliders': '🎛️',
+    'Gauge': '🎯',
+    'Thermometer': '🌡️',
+    'Crosshair': '🎯',
+    'Anchor': '⚓',
+    'Feather': '🪶',
+    'Award': '🏅',
+    'GitBranch': '🌿',
+    'GitCommit': '📌',
+    'GitMerge': '🔀',
+    'GitPullRequest': '🔄',
+    'Github': '🐙',
+    'Gitlab': '🦊',
+    'Twitter': '🐦',
+    'Facebook': '📘',
+    'Instagram': '📷',
+    'Linkedin': '💼',
+    'Youtube': '📺',
+    'Twitch': '🎮',
+    'Slack': '💬',
+    'Chrome': '🌐',
+    'Figma': '🎨',
+    'Framer': '🖼️'
+}
+
+icon_translator = IconTranslator(ICON_MAPPINGS)
+
+# Div containers converted to markdown sections
+HERO_PATTERN = re.compile(
+    r'<div className="bg-gradient-to-r[^"]*"[^>]*>.*?</div>\s*</div>\s*</div>', re.DOTALL
+)
+CALLOUT_PATTERN = re.compile(
+    r'<div className="bg-(?:yellow|red|blue|green|gray)-\d+[^"]*"[^>]*>.*?</div>\s*</div>\s*</div>', re.DOTALL
+)
+GRID_PATTERN = re.compile(r'<div className="grid[^"]*"[^>]*>.*?</div>(?:\s*</div>)*', re.DOTALL)
+
 def process_mdx_file(content):
     """Process MDX content to fix formatting issues."""
     
     # Remove import statements
-    content = re.sub(r'^import\s+.*?;?\s*$', '', content, flags=re.MULTILINE)
+    content = STRIP_IMPORTS(content)
     
     # Remove empty lines at the beginning (after removing imports)
-    content = re.sub(r'^(\s*\n)+', '', content)
+    content = STRIP_LEADING_BLANK_LINES(content)
     
-    # Convert icon components to emojis
-    icon_mappings = {
-        r'<Shield[^>]*/?>' : '🛡️',
-        r'<Lock[^>]*/?>' : '🔒',
-        r'<Target[^>]*/?>' : '🎯',
-        r'<Cpu[^>]*/?>' : '💻',
-        r'<Database[^>]*/?>' : '🗄️',
-        r'<AlertTriangle[^>]*/?>' : '⚠️',
-        r'<CheckCircle[^>]*/?>' : '✅',
-        r'<XCircle[^>]*/?>' : '❌',
-        r'<Info[^>]*/?>' : 'ℹ️',
-        r'<AlertCircle[^>]*/?>' : '⚠️',
-        r'<Terminal[^>]*/?>' : '💻',
-        r'<Code[^>]*/?>' : '💻',
-        r'<FileText[^>]*/?>' : '📄',
-        r'<Users[^>]*/?>' : '👥',
-        r'<Building[^>]*/?>' : '🏢',
-        r'<Brain[^>]*/?>' : '🧠',
-        r'<Zap[^>]*/?>' : '⚡',
-        r'<ChevronRight[^>]*/?>' : '➡️',
-        r'<ArrowRight[^>]*/?>' : '→',
-        r'<Clock[^>]*/?>' : '🕐',
-        r'<Calendar[^>]*/?>' : '📅',
-        r'<Mail[^>]*/?>' : '✉️',
-        r'<Phone[^>]*/?>' : '📞',
-        r'<Globe[^>]*/?>' : '🌐',
-        r'<Search[^>]*/?>' : '🔍',
-        r'<Settings[^>]*/?>' : '⚙️',
-        r'<Tool[^>]*/?>' : '🔧',
-        r'<Wrench[^>]*/?>' : '🔧',
-        r'<Key[^>]*/?>' : '🔑',
-        r'<Eye[^>]*/?>' : '👁️',
-        r'<TrendingUp[^>]*/?>' : '📈',
-        r'<TrendingDown[^>]*/?>' : '📉',
-        r'<DollarSign[^>]*/?>' : '💰',
-        r'<Activity[^>]*/?>' : '📊',
-        r'<BarChart[^>]*/?>' : '📊',
-        r'<PieChart[^>]*/?>' : '📊',
-        r'<LineChart[^>]*/?>' : '📈',
-        r'<Award[^>]*/?>' : '🏆',
-        r'<Star[^>]*/?>' : '⭐',
-        r'<Heart[^>]*/?>' : '❤️',
-        r'<ThumbsUp[^>]*/?>' : '👍',
-        r'<ThumbsDown[^>]*/?>' : '👎',
-        r'<MessageCircle[^>]*/?>' : '💬',
-        r'<MessageSquare[^>]*/?>' : '💬',
-        r'<Send[^>]*/?>' : '📤',
-        r'<Download[^>]*/?>' : '📥',
-        r'<Upload[^>]*/?>' : '📤',
-        r'<Cloud[^>]*/?>' : '☁️',
-        r'<CloudOff[^>]*/?>' : '🌫️',
-        r'<Wifi[^>]*/?>' : '📶',
-        r'<WifiOff[^>]*/?>' : '📵',
-        r'<Battery[^>]*/?>' : '🔋',
-        r'<Camera[^>]*/?>' : '📷',
-        r'<Video[^>]*/?>' : '📹',
-        r'<Mic[^>]*/?>' : '🎤',
-        r'<Volume[^>]*/?>' : '🔊',
-        r'<VolumeX[^>]*/?>' : '🔇',
-        r'<Play[^>]*/?>' : '▶️',
-        r'<Pause[^>]*/?>' : '⏸️',
-        r'<Stop[^>]*/?>' : '⏹️',
-        r'<FastForward[^>]*/?>' : '⏩',
-        r'<Rewind[^>]*/?>' : '⏪',
-        r'<RefreshCw[^>]*/?>' : '🔄',
-        r'<RotateCw[^>]*/?>' : '🔄',
-        r'<Save[^>]*/?>' : '💾',
-        r'<Trash[^>]*/?>' : '🗑️',
-        r'<Edit[^>]*/?>' : '✏️',
-        r'<Copy[^>]*/?>' : '📋',
-        r'<Clipboard[^>]*/?>' : '📋',
-        r'<Link[^>]*/?>' : '🔗',
-        r'<ExternalLink[^>]*/?>' : '🔗',
-        r'<Share[^>]*/?>' : '🔗',
-        r'<Bookmark[^>]*/?>' : '🔖',
-        r'<Flag[^>]*/?>' : '🚩',
-        r'<MapPin[^>]*/?>' : '📍',
-        r'<Navigation[^>]*/?>' : '🧭',
-        r'<Compass[^>]*/?>' : '🧭',
-        r'<Home[^>]*/?>' : '🏠',
-        r'<Package[^>]*/?>' : '📦',
-        r'<Box[^>]*/?>' : '📦',
-        r'<Archive[^>]*/?>' : '🗂️',
-        r'<Folder[^>]*/?>' : '📁',
-        r'<File[^>]*/?>' : '📄',
-        r'<Paperclip[^>]*/?>' : '📎',
-        r'<Printer[^>]*/?>' : '🖨️',
-        r'<HardDrive[^>]*/?>' : '💿',
-        r'<Server[^>]*/?>' : '🖥️',
-        r'<Monitor[^>]*/?>' : '🖥️',
-        r'<Smartphone[^>]*/?>' : '📱',
-        r'<Tablet[^>]*/?>' : '📱',
-        r'<Watch[^>]*/?>' : '⌚',
-        r'<Headphones[^>]*/?>' : '🎧',
-        r'<Speaker[^>]*/?>' : '🔊',
-        r'<Bluetooth[^>]*/?>' : '📶',
-        r'<Rss[^>]*/?>' : '📡',
-        r'<Radio[^>]*/?>' : '📻',
-        r'<Tv[^>]*/?>' : '📺',
-        r'<Film[^>]*/?>' : '🎬',
-        r'<Image[^>]*/?>' : '🖼️',
-        r'<Aperture[^>]*/?>' : '📷',
-        r'<Sun[^>]*/?>' : '☀️',
-        r'<Moon[^>]*/?>' : '🌙',
-        r'<CloudRain[^>]*/?>' : '🌧️',
-        r'<CloudSnow[^>]*/?>' : '🌨️',
-        r'<Wind[^>]*/?>' : '💨',
-        r'<Droplet[^>]*/?>' : '💧',
-        r'<Umbrella[^>]*/?>' : '☂️',
-        r'<Coffee[^>]*/?>' : '☕',
-        r'<Briefcase[^>]*/?>' : '💼',
-        r'<ShoppingBag[^>]*/?>' : '🛍️',
-        r'<ShoppingCart[^>]*/?>' : '🛒',
-        r'<CreditCard[^>]*/?>' : '💳',
-        r'<Gift[^>]*/?>' : '🎁',
-        r'<Bell[^>]*/?>' : '🔔',
-        r'<BellOff[^>]*/?>' : '🔕',
-        r'<MessageCircle[^>]*/?>' : '💬',
-        r'<Hash[^>]*/?>' : '#️⃣',
-        r'<AtSign[^>]*/?>' : '@',
-        r'<Percent[^>]*/?>' : '%',
-        r'<Plus[^>]*/?>' : '➕',
-        r'<Minus[^>]*/?>' : '➖',
-        r'<X[^>]*/?>' : '❌',
-        r'<Check[^>]*/?>' : '✓',
-        r'<Circle[^>]*/?>' : '⭕',
-        r'<Square[^>]*/?>' : '⬜',
-        r'<Triangle[^>]*/?>' : '🔺',
-        r'<Hexagon[^>]*/?>' : '⬡',
-        r'<Octagon[^>]*/?>' : '🛑',
-        r'<HelpCircle[^>]*/?>' : '❓',
-        r'<Layers[^>]*/?>' : '📚',
-        r'<Filter[^>]*/?>' : '🔽',
-        r'<Sliders[^>]*/?>' : '🎛️',
-        r'<Gauge[^>]*/?>' : '🎯',
-        r'<Thermometer[^>]*/?>' : '🌡️',
-        r'<Crosshair[^>]*/?>' : '🎯',
-        r'<Anchor[^>]*/?>' : '⚓',
-        r'<Feather[^>]*/?>' : '🪶',
-        r'<Award[^>]*/?>' : '🏅',
-        r'<GitBranch[^>]*/?>' : '🌿',
-        r'<GitCommit[^>]*/?>' : '📌',
-        r'<GitMerge[^>]*/?>' : '🔀',
-        r'<GitPullRequest[^>]*/?>' : '🔄',
-        r'<Github[^>]*/?>' : '🐙',
-        r'<Gitlab[^>]*/?>' : '🦊',
-        r'<Twitter[^>]*/?>' : '🐦',
-        r'<Facebook[^>]*/?>' : '📘',
-        r'<Instagram[^>]*/?>' : '📷',
-        r'<Linkedin[^>]*/?>' : '💼',
-        r'<Youtube[^>]*/?>' : '📺',
-        r'<Twitch[^>]*/?>' : '🎮',
-        r'<Slack[^>]*/?>' : '💬',
-        r'<Chrome[^>]*/?>' : '🌐',
-        r'<Figma[^>]*/?>' : '🎨',
-        r'<Framer[^>]*/?>' : '🖼️'
-    }
-    
-    for pattern, emoji in icon_mappings.items():
-        content = re.sub(pattern, emoji, content, flags=re.IGNORECASE)
+    # Convert icon components to emojis in a single pass
+    content = icon_translator.translate(content)
     
     # Convert complex div containers to markdown sections
+    # Each block type is converted in one pass that builds the output from
+    # slices, rather than a content.replace per match
     # Handle gradient hero sections
-    hero_pattern = r'<div className="bg-gradient-to-r[^"]*"[^>]*>.*?</div>\s*</div>\s*</div>'
-    for match in re.finditer(hero_pattern, content, re.DOTALL):
-        content = content.replace(match.group(0), convert_hero_section(match.group(0)))
+    content = HERO_PATTERN.sub(lambda m: convert_hero_section(m.group(0)), content)
     
     # Handle alert/callout boxes
-    callout_pattern = r'<div className="bg-(?:yellow|red|blue|green|gray)-\d+[^"]*"[^>]*>.*?</div>\s*</div>\s*</div>'
-    for match in re.finditer(callout_pattern, content, re.DOTALL):
-        content = content.replace(match.group(0), convert_callout_box(match.group(0)))
+    content = CALLOUT_PATTERN.sub(lambda m: convert_callout_box(m.group(0)), content)
     
     # Handle grid layouts
-    grid_pattern = r'<div className="grid[^"]*"[^>]*>.*?</div>(?:\s*</div>)*'
-    for match in re.finditer(grid_pattern, content, re.DOTALL):
-        content = content.replace(match.group(0), convert_grid_to_list(match.group(0)))
+    content = GRID_PATTERN.sub(lambda m: convert_grid_to_list(m.group(0)), content)
     
     # Convert remaining JSX self-closing tags to empty
     content = re.sub(r'<[A-Z][^>]*/>', '', content)
     
     # Convert className to class for any remaining divs
-    content = re.sub(r'className=', 'class=', content)
+    content = CLASSNAME_TO_CLASS(content)
     
     # Fix bold text that might have been affected
     content = re.sub(r'\*\*([^*]+)\*\*', r'**\1**', content)
     
     # Clean up excessive whitespace
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    content = COLLAPSE_BLANK_LINES(content)
     
     # Ensure proper spacing after headers
-    content = re.sub(r'(^#{1,6} .+)$\n(?=[^\n])', r'\1\n\n', content, flags=re.MULTILINE)
+    content = BLANK_LINE_AFTER_HEADING(content)
     
     # Fix list spacing
-    content = re.sub(r'(\n- .+)(\n)(?=\S)', r'\1\n\n', content)
+    content = BLANK_LINE_AFTER_LIST(content)
     
     return content
 
@@ -288,7 +301,7 @@ def convert_grid_to_list(match):
     
     return ""
 
-def main():
+def main(jobs=None, cache=None):
     """Main function to process all MDX files."""
     blog_dir = Path("/Users/scott/Documents/code/scthornton/perfecxion-site/content/blog")
     
@@ -297,7 +310,7 @@ def main():
         sys.exit(1)
     
     # Get all MDX files
-    mdx_files = list(blog_dir.glob("*.mdx"))
+    mdx_files = find_mdx_files(blog_dir)
     
     if not mdx_files:
         print("No MDX files found in the blog directory")
@@ -305,34 +318,8 @@ def main():
     
     print(f"Found {len(mdx_files)} MDX files to process")
     
-    success_count = 0
-    error_count = 0
-    
-    for mdx_file in mdx_files:
-        try:
-            print(f"Processing: {mdx_file.name}")
-            
-            # Read the file
-            with open(mdx_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Process the content
-            processed_content = process_mdx_file(content)
-            
-            # Write back the processed content
-            with open(mdx_file, 'w', encoding='utf-8') as f:
-                f.write(processed_content)
-            
-            success_count += 1
-            print(f"  ✓ Successfully processed {mdx_file.name}")
-            
-        except Exception as e:
-            error_count += 1
-            print(f"  ✗ Error processing {mdx_file.name}: {str(e)}")
-    
-    print(f"\nProcessing complete:")
-    print(f"  - Success: {success_count} files")
-    print(f"  - Errors: {error_count} files")
+    run_corpus(mdx_files, process_mdx_file, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = build_parser(__doc__).parse_args()
+    main(args.jobs, open_cache(args))
\ No newline at end of file
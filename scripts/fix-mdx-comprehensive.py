@@ -3,32 +3,20 @@ import re
 import sys
 from pathlib import Path
 
+from mdx_fixers.balancer import find_unbalanced
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.diagnostics import warn
+from mdx_fixers.rules import DEQUOTE_COMPONENTS
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
+CHECKED_COMPONENTS = {'FeatureCard', 'AlertBox', 'FeatureGrid', 'Timeline', 'ComparisonTable', 'StatsBox'}
+
 def fix_mdx_issues(content):
     """Fix various MDX parsing issues."""
     
-    # 1. Fix StatsBox with quotes in attributes - the pattern with nested quotes
-    content = re.sub(
-        r'<StatsBox stats="{\[(.*?)\]}" />',
-        lambda m: '<StatsBox stats={[' + m.group(1) + ']} />',
-        content,
-        flags=re.DOTALL
-    )
-    
-    # 2. Fix Timeline items with quotes
-    content = re.sub(
-        r'<Timeline items="{\[(.*?)\]}" />',
-        lambda m: '<Timeline items={[' + m.group(1) + ']} />',
-        content,
-        flags=re.DOTALL
-    )
-    
-    # 3. Fix ComparisonTable rows
-    content = re.sub(
-        r'<ComparisonTable\s+(.*?)rows="{\[(.*?)\]}"(.*?)/>',
-        lambda m: '<ComparisonTable ' + m.group(1) + 'rows={[' + m.group(2) + ']}' + m.group(3) + '/>',
-        content,
-        flags=re.DOTALL
-    )
+    # 1-3. Fix StatsBox stats, Timeline items and ComparisonTable rows with
+    # quotes in attributes
+    content = DEQUOTE_COMPONENTS(content)
     
     # 4. Fix FeatureCard with missing closing tags
     content = re.sub(
@@ -67,13 +55,10 @@ def fix_mdx_issues(content):
     # 10. Fix any unclosed tags by ensuring all opened tags are closed
     # This is a more complex operation, let's check for common patterns
     
-    # Count opening and closing tags for common components
-    components = ['FeatureCard', 'AlertBox', 'FeatureGrid', 'Timeline', 'ComparisonTable', 'StatsBox']
-    for comp in components:
-        opening = len(re.findall(f'<{comp}', content))
-        closing = len(re.findall(f'</{comp}>', content))
-        if opening > closing:
-            print(f"Warning: {comp} has {opening} opening tags but only {closing} closing tags")
+    # Report unclosed and orphan tags for common components; the runner
+    # prints them with the file's name
+    for issue in find_unbalanced(content, CHECKED_COMPONENTS):
+        warn(issue)
     
     # 11. Fix specific patterns that cause "unexpected end of file"
     # Ensure all self-closing tags are properly formatted
@@ -98,28 +83,7 @@ def fix_stats_box_content(stats_content):
     stats_content = re.sub(r'\s+', ' ', stats_content)
     return f'<StatsBox stats={{[{stats_content}]}} />'
 
-def process_file(file_path):
-    """Process a single MDX file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        content = fix_mdx_issues(content)
-        
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✓ Fixed: {file_path.name}")
-            return True
-        else:
-            print(f"  No changes: {file_path.name}")
-            return False
-    except Exception as e:
-        print(f"✗ Error processing {file_path.name}: {e}")
-        return False
-
-def main():
+def main(jobs=None, cache=None):
     """Process all MDX files in the blog directory."""
     blog_dir = Path("/Users/scott/Documents/code/scthornton/perfecxion-site/content/blog")
     
@@ -127,7 +91,7 @@ def main():
         print(f"Error: Directory {blog_dir} does not exist")
         sys.exit(1)
     
-    mdx_files = sorted(blog_dir.glob("*.mdx"))
+    mdx_files = find_mdx_files(blog_dir)
     
     if not mdx_files:
         print("No .mdx files found in the blog directory")
@@ -135,13 +99,8 @@ def main():
     
     print(f"Processing {len(mdx_files)} MDX files...\n")
     
-    fixed_count = 0
-    for file_path in mdx_files:
-        if process_file(file_path):
-            fixed_count += 1
-    
-    print(f"\n✓ Fixed {fixed_count} files")
-    print(f"  Total files processed: {len(mdx_files)}")
+    run_corpus(mdx_files, fix_mdx_issues, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = build_parser().parse_args()
+    main(args.jobs, open_cache(args))
\ No newline at end of file
@@ -3,32 +3,23 @@ import re
 import sys
 from pathlib import Path
 
+from mdx_fixers import changeset
+from mdx_fixers.balancer import balance_tags
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.normalize import normalized
+from mdx_fixers.rules import DEQUOTE_COMPONENTS
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
+# Components whose stray closing tags are cleaned up
+BALANCED_COMPONENTS = {'FeatureCard', 'AlertBox'}
+
+@normalized(newlines=False, trailing_whitespace=False)
 def fix_mdx_issues(content):
     """Fix various MDX parsing issues with precision."""
     
-    # 1. Fix StatsBox - the quotes around the curly braces are the issue
-    content = re.sub(
-        r'<StatsBox stats="{\[((?:[^][]|\[[^\]]*\])*)\]}" />',
-        r'<StatsBox stats={[\1]} />',
-        content,
-        flags=re.DOTALL
-    )
-    
-    # 2. Fix Timeline items
-    content = re.sub(
-        r'<Timeline items="{\[((?:[^][]|\[[^\]]*\])*)\]}" />',
-        r'<Timeline items={[\1]} />',
-        content,
-        flags=re.DOTALL
-    )
-    
-    # 3. Fix ComparisonTable rows
-    content = re.sub(
-        r'rows="{\[((?:[^][]|\[[^\]]*\])*)\]}"',
-        r'rows={[\1]}',
-        content,
-        flags=re.DOTALL
-    )
+    # 1-3. Fix StatsBox stats, Timeline items and ComparisonTable rows -
+    # the quotes around the curly braces are the issue
+    content = DEQUOTE_COMPONENTS(content)
     
     # 4. Fix FeatureCard self-closing with content after
     # Pattern: <FeatureCard ... /> followed by content and then </FeatureCard>
@@ -46,63 +37,23 @@ def fix_mdx_issues(content):
         content
     )
     
-    # 6. Fix doubled closing tags (from previous scripts)
-    content = re.sub(r'</FeatureCard>\s*</FeatureCard>', '</FeatureCard>', content)
-    content = re.sub(r'</AlertBox>\s*</AlertBox>', '</AlertBox>', content)
+    # 6. Fix doubled closing tags (from previous scripts) and AlertBox
+    # elements whose content ended up after their closing tag
+    content, _ = balance_tags(content, BALANCED_COMPONENTS)
     
     # 7. Fix broken inline patterns in zero-day file
     # Fix the specific pattern with <strong /> instead of <strong>
     content = re.sub(r'<strong\s*/>', '<strong>', content)
     
-    # 8. Ensure proper closing for all AlertBox elements
-    # Find AlertBox that have content after them but before closing tag
-    def fix_alertbox_content(match):
-        attrs = match.group(1)
-        content_text = match.group(2)
-        # If the content doesn't start with a tag, wrap it properly
-        if not content_text.strip().startswith('<'):
-            return f'<AlertBox {attrs}>\n{content_text.strip()}\n</AlertBox>'
-        return match.group(0)
-    
-    content = re.sub(
-        r'<AlertBox\s+([^>]+?)>\s*</AlertBox>\s*([^<]+?)\s*</AlertBox>',
-        fix_alertbox_content,
-        content,
-        flags=re.DOTALL
-    )
-    
-    # 9. Fix table formatting issues
+    # 8. Fix table formatting issues
     # Remove extra pipes in table separators
     content = re.sub(r'\|\s*\n\s*\n\s*-+\|\s*\n\s*\n\s*-+\|', '|----------|', content)
     
-    # 10. Clean up any remaining formatting issues
-    # Remove duplicate blank lines
-    content = re.sub(r'\n\n\n+', '\n\n', content)
+    # 9. Duplicate blank lines are collapsed by the final stage (see @normalized)
     
     return content
 
-def process_file(file_path):
-    """Process a single MDX file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        content = fix_mdx_issues(content)
-        
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✓ Fixed: {file_path.name}")
-            return True
-        else:
-            print(f"  No changes: {file_path.name}")
-            return False
-    except Exception as e:
-        print(f"✗ Error processing {file_path.name}: {e}")
-        return False
-
-def main():
+def main(jobs=None, cache=None):
     """Process all MDX files in the blog directory."""
     blog_dir = Path("/Users/scott/Documents/code/scthornton/perfecxion-site/content/blog")
     
@@ -130,19 +81,22 @@ def main():
         "zero-day-ai-vulnerabilities-detection-response.mdx"
     ]
     
-    print(f"Processing {len(problem_files)} problem MDX files...\n")
-    
-    fixed_count = 0
-    for filename in problem_files:
-        file_path = blog_dir / filename
-        if file_path.exists():
-            if process_file(file_path):
-                fixed_count += 1
-        else:
-            print(f"✗ File not found: {filename}")
-    
-    print(f"\n✓ Fixed {fixed_count} files")
-    print(f"  Total files processed: {len(problem_files)}")
+    if changeset.enabled():
+        # The change, not the list above, says which files need fixing
+        paths = find_mdx_files(blog_dir)
+    else:
+        print(f"Processing {len(problem_files)} problem MDX files...\n")
+        
+        paths = []
+        for filename in problem_files:
+            file_path = blog_dir / filename
+            if file_path.exists():
+                paths.append(file_path)
+            else:
+                print(f"✗ File not found: {filename}")
+    
+    run_corpus(paths, fix_mdx_issues, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = build_parser().parse_args()
+    main(args.jobs, open_cache(args))
\ No newline at end of file
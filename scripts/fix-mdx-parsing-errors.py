@@ -4,40 +4,104 @@ Advanced MDX Parsing Error Fixer
 Addresses specific parsing issues causing build failures.
 """
 
-import os
 import re
 import sys
 from pathlib import Path
 
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.frontmatter import join as join_frontmatter, split as split_frontmatter
+from mdx_fixers.lines import TEXT, LineMachine, Transition, indent, is_blank, transform_text
+from mdx_fixers.normalize import normalized
+from mdx_fixers.rules import BLANK_LINE_BEFORE_DIV, SPACE_AFTER_CLASSNAME
+from mdx_fixers.runner import find_mdx_files, run_corpus
+from mdx_fixers.tokenizer import (
+    CLOSE, OPEN, SELF_CLOSING, TAG_KINDS, is_component, make_tag, match_tags, render, text_token, tokenize,
+)
+
+def fix_jsx_tags(content):
+    """Put concatenated closing tags on their own line and self-close unclosed components."""
+    tokens = tokenize(content)
+    _, unmatched = match_tags(tokens)
+    unmatched = set(unmatched)
+    
+    fixed = []
+    for i, token in enumerate(tokens):
+        if not is_component(token.name):
+            fixed.append(token)
+            continue
+        
+        # <Icon className="..."> with no closing tag anywhere -> <Icon className="..." />
+        if token.kind == OPEN and token.attrs and i in unmatched:
+            token = make_tag(SELF_CLOSING, token.name, token.attrs)
+        
+        # ...></Card><div> -> ...>\n</Card>\n<div>
+        elif (token.kind == CLOSE and 0 < i < len(tokens) - 1
+                and tokens[i - 1].kind in TAG_KINDS and tokens[i + 1].kind in TAG_KINDS):
+            token = text_token(f'\n{token.text}\n')
+        
+        fixed.append(token)
+    
+    return render(fixed)
+
+LIST_ITEM_RE = re.compile(r'^\s*(?:[-*+]|\d+\.)\s')
+LIST_MARKER_RE = re.compile(r'^\s*[-*+\d]')
+
+def is_quote(line):
+    return line.strip().startswith('>')
+
+def quote_lazy_line(line, state):
+    return '> ' + line.lstrip()
+
+def start_list_item(line, state):
+    state.list_indent = indent(line)
+    return line
+
+def indent_lazy_line(line, state):
+    if indent(line) <= state.list_indent:
+        return ' ' * (state.list_indent + 2) + line.lstrip()
+    return line
+
+# A non-blank line inside a blockquote that doesn't start with '>'
+BLOCKQUOTE_LAZY_LINES = LineMachine({
+    TEXT: [Transition(is_quote, target='blockquote')],
+    'blockquote': [
+        Transition(is_quote),
+        Transition(is_blank, target=TEXT),
+        Transition(None, quote_lazy_line),
+    ],
+})
+
+# A non-blank line inside a list that isn't indented past the item marker
+LIST_LAZY_LINES = LineMachine({
+    TEXT: [Transition(LIST_ITEM_RE.match, start_list_item, 'list')],
+    'list': [
+        Transition(LIST_ITEM_RE.match, start_list_item),
+        Transition(is_blank, target=TEXT),
+        Transition(LIST_MARKER_RE.match),
+        Transition(None, indent_lazy_line),
+    ],
+})
+
+@normalized(newlines=False, trailing_whitespace=False)
 def fix_mdx_content(content):
     """Fix specific MDX parsing issues."""
     
-    # Step 1: Fix frontmatter separation - ensure proper spacing after ---
-    if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            frontmatter = parts[1]
-            body = parts[2]
-            # Ensure proper spacing after frontmatter
-            if not body.startswith('\n'):
-                body = '\n' + body
-            if not body.startswith('\n\n'):
-                body = '\n' + body
-            content = f"---{frontmatter}---{body}"
+    # Step 1: Fix frontmatter separation - ensure a blank line after ---
+    frontmatter, body = split_frontmatter(content)
+    if frontmatter is not None and not body.startswith('\n'):
+        content = join_frontmatter(frontmatter, '\n' + body)
     
     # Step 2: Fix malformed tags - remove extra '<' characters
     content = re.sub(r'<</([a-zA-Z][a-zA-Z0-9]*)', r'</\1', content)
     content = re.sub(r'<<([a-zA-Z][a-zA-Z0-9]*)', r'<\1', content)
     
-    # Step 3: Fix incomplete closing tags - ensure proper closure
-    content = re.sub(r'></([A-Z][a-zA-Z]*[^>]*)><', r'>\n</\1>\n<', content)
-    
-    # Step 4: Fix JSX self-closing tags that are missing the closing part
-    content = re.sub(r'(<[A-Z][a-zA-Z]* [^/>]*)(>)(?!</)', r'\1/>', content)
+    # Steps 3 and 4: Fix incomplete closing tags and JSX tags that are
+    # missing their self-closing slash, in one pass over the tags
+    content = fix_jsx_tags(content)
     
     # Step 5: Ensure blank lines around JSX blocks to separate from markdown
     # Add blank line before JSX that starts a line
-    content = re.sub(r'(\n)(<div[^>]*>)', r'\1\n\2', content)
+    content = BLANK_LINE_BEFORE_DIV(content)
     content = re.sub(r'(\n)(<[A-Z][a-zA-Z]*[^>]*>)', r'\1\n\2', content)
     
     # Add blank line after JSX that ends a block
@@ -46,72 +110,20 @@ def fix_mdx_content(content):
     
     # Step 6: Fix specific pattern issues
     # Fix broken JSX attribute syntax
-    content = re.sub(r'className="([^"]*)"([A-Za-z])', r'className="\1" \2', content)
+    content = SPACE_AFTER_CLASSNAME(content)
     
     # Step 7: Fix lazy line errors in containers - ensure proper indentation
     # This addresses markdown list/blockquote issues
-    lines = content.split('\n')
-    fixed_lines = []
-    in_blockquote = False
-    in_list = False
-    
-    for i, line in enumerate(lines):
-        # Detect blockquote context
-        if line.strip().startswith('>'):
-            in_blockquote = True
-        elif in_blockquote and line.strip() == '':
-            in_blockquote = False
-        elif in_blockquote and not line.startswith('>') and line.strip() != '':
-            # Fix lazy line in blockquote
-            line = '> ' + line.lstrip()
-        
-        # Detect list context
-        if re.match(r'^\s*[-*+]\s', line) or re.match(r'^\s*\d+\.\s', line):
-            in_list = True
-            list_indent = len(line) - len(line.lstrip())
-        elif in_list and line.strip() == '':
-            in_list = False
-        elif in_list and not re.match(r'^\s*[-*+\d]', line) and line.strip() != '':
-            # Fix lazy line in list - ensure proper indentation
-            if len(line) - len(line.lstrip()) <= list_indent:
-                line = ' ' * (list_indent + 2) + line.lstrip()
-        
-        fixed_lines.append(line)
-    
-    content = '\n'.join(fixed_lines)
+    content = transform_text(content, BLOCKQUOTE_LAZY_LINES, LIST_LAZY_LINES)
     
-    # Step 8: Clean up excessive whitespace
-    content = re.sub(r'\n\n\n+', '\n\n', content)
-    
-    # Step 9: Ensure file ends with newline (but not multiple)
+    # Step 8: Ensure file ends with newline (but not multiple)
     content = content.rstrip() + '\n'
     
+    # Step 9: Excessive blank lines are collapsed by the final stage (see @normalized)
+    
     return content
 
-def process_mdx_file(file_path):
-    """Process a single MDX file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
-        
-        # Apply fixes
-        fixed_content = fix_mdx_content(original_content)
-        
-        # Only write if content changed
-        if fixed_content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(fixed_content)
-            print(f"✅ Fixed: {file_path}")
-            return True
-        else:
-            print(f"⏭️  No changes needed: {file_path}")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error processing {file_path}: {str(e)}")
-        return False
-
-def main():
+def main(jobs=None, cache=None):
     """Main function to process all MDX files."""
     # Get the content directory
     content_dir = Path(__file__).parent.parent / 'content' / 'blog'
@@ -121,7 +133,7 @@ def main():
         sys.exit(1)
     
     # Get all MDX files
-    mdx_files = list(content_dir.glob('*.mdx'))
+    mdx_files = find_mdx_files(content_dir)
     
     if not mdx_files:
         print("❌ No MDX files found in content/blog/")
@@ -129,10 +141,8 @@ def main():
     
     print(f"🔧 Processing {len(mdx_files)} MDX files...")
     
-    success_count = 0
-    for mdx_file in mdx_files:
-        if process_mdx_file(mdx_file):
-            success_count += 1
+    results = run_corpus(mdx_files, fix_mdx_content, jobs=jobs, cache=cache)
+    success_count = sum(1 for r in results if not r.error)
     
     print(f"\n✅ Successfully processed {success_count}/{len(mdx_files)} files")
     
@@ -143,4 +153,5 @@ def main():
         print("⚠️  Some files had errors. Please check the output above.")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    args = build_parser(__doc__).parse_args()
+    main(args.jobs, open_cache(args))
\ No newline at end of file
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Run several MDX fixers as one fused pipeline.
+
+Each file is read once, passed through every step in memory and written
+back at most once, instead of once per fixer script.
+
+Examples:
+  python scripts/fix-mdx-pipeline.py
+  python scripts/fix-mdx-pipeline.py --steps comprehensive,anchor-tags,spread-syntax,table-separators,stray-brackets
+  python scripts/fix-mdx-pipeline.py --steps fix-mdx-final:fix_mdx_issues content/knowledge
+  python scripts/fix-mdx-pipeline.py --watch content
+"""
+
+import sys
+
+from mdx_fixers import dryrun
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.pipeline import DEFAULT_STEPS, STEPS, Pipeline
+from mdx_fixers.runner import find_mdx_files, run_corpus
+from mdx_fixers.watch import watch
+
+
+def list_steps():
+    print("Available steps:")
+    for name, (script, function) in STEPS.items():
+        default = " (default)" if name in DEFAULT_STEPS else ""
+        print(f"  {name:<20} {script}.py:{function}{default}")
+
+
+def main():
+    parser = build_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        'directory',
+        nargs='?',
+        default='content/blog',
+        help="directory of MDX files to fix (default: content/blog)"
+    )
+    parser.add_argument(
+        '--steps',
+        default=','.join(DEFAULT_STEPS),
+        help="comma-separated step names or script:function specs, applied in order"
+    )
+    parser.add_argument('--list', action='store_true', help="list the named steps and exit")
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help="keep running and fix MDX files anywhere under the directory each time they are saved"
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        list_steps()
+        return
+
+    try:
+        pipeline = Pipeline(step.strip() for step in args.steps.split(',') if step.strip())
+        # Load every step up front so a typo fails before any file is touched
+        for transform in pipeline.transforms:
+            transform.resolve()
+    except (ValueError, AttributeError, FileNotFoundError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.watch:
+        watch(args.directory, pipeline, jobs=args.jobs, cache=open_cache(args))
+        return
+
+    mdx_files = find_mdx_files(args.directory)
+    if not mdx_files:
+        print(f"❌ No MDX files found in {args.directory}")
+        sys.exit(1)
+
+    print(f"🔧 Running {pipeline} over {len(mdx_files)} files...")
+    results = run_corpus(mdx_files, pipeline, jobs=args.jobs, cache=open_cache(args))
+    # A dry run that finds work to do fails too, so CI can run it as a check
+    if any(r.error for r in results) or (dryrun.enabled() and any(r.changed for r in results)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@ import re
 import sys
 from pathlib import Path
 
+from mdx_fixers import changeset
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
 def fix_anchor_tags(content):
     """Fix self-closing anchor tags."""
     # Fix anchor tags with self-closing syntax
@@ -109,34 +113,16 @@ def fix_backtick_in_headings(content):
     content = re.sub(r'(#+)\s*`(\d+\.)', r'\1 \2', content)
     return content
 
-def process_file(file_path):
-    """Process a single MDX file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Apply all fixes
-        content = fix_anchor_tags(content)
-        content = fix_spread_syntax(content)
-        content = fix_unclosed_tags(content)
-        content = fix_table_separators(content)
-        content = fix_backtick_in_headings(content)
-        
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✓ Fixed: {file_path.name}")
-            return True
-        else:
-            print(f"  No changes: {file_path.name}")
-            return False
-    except Exception as e:
-        print(f"✗ Error processing {file_path.name}: {e}")
-        return False
+def fix_remaining_content(content):
+    """Apply all remaining-issue fixes to one file."""
+    content = fix_anchor_tags(content)
+    content = fix_spread_syntax(content)
+    content = fix_unclosed_tags(content)
+    content = fix_table_separators(content)
+    content = fix_backtick_in_headings(content)
+    return content
 
-def main():
+def main(jobs=None, cache=None):
     """Process all MDX files in the blog directory."""
     blog_dir = Path("/Users/scott/Documents/code/scthornton/perfecxion-site/content/blog")
     
@@ -170,19 +156,22 @@ def main():
         "zero-day-ai-vulnerabilities-detection-response.mdx"
     ]
     
-    print(f"Processing {len(problem_files)} MDX files with remaining issues...\n")
-    
-    fixed_count = 0
-    for filename in problem_files:
-        file_path = blog_dir / filename
-        if file_path.exists():
-            if process_file(file_path):
-                fixed_count += 1
-        else:
-            print(f"✗ File not found: {filename}")
-    
-    print(f"\n✓ Fixed {fixed_count} files")
-    print(f"  Total files processed: {len(problem_files)}")
+    if changeset.enabled():
+        # The change, not the list above, says which files need fixing
+        paths = find_mdx_files(blog_dir)
+    else:
+        print(f"Processing {len(problem_files)} MDX files with remaining issues...\n")
+        
+        paths = []
+        for filename in problem_files:
+            file_path = blog_dir / filename
+            if file_path.exists():
+                paths.append(file_path)
+            else:
+                print(f"✗ File not found: {filename}")
+    
+    run_corpus(paths, fix_remaining_content, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = build_parser().parse_args()
+    main(args.jobs, open_cache(args))
\ No newline at end of file
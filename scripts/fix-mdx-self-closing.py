@@ -3,44 +3,37 @@ import re
 import sys
 from pathlib import Path
 
+from mdx_fixers.balancer import balance_tags
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.rules import DEQUOTE_COMPONENTS
+from mdx_fixers.runner import find_mdx_files, run_corpus
+from mdx_fixers.tokenizer import CLOSE, OPEN, SELF_CLOSING, TEXT, make_tag, render, tokenize
+
+# Tags that are sometimes written self-closing even though they wrap content
+CONTENT_TAGS = {
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'span', 'p',
+    'strong', 'em', 'code', 'pre', 'blockquote', 'li', 'ul', 'ol',
+}
+
+# Components whose stray closing tags are cleaned up
+BALANCED_COMPONENTS = {'FeatureCard', 'AlertBox', 'Timeline', 'ComparisonTable', 'StatsBox'}
+
 def fix_self_closing_tags(content):
     """Fix self-closing tags that should have content."""
     
-    # Fix h1-h6 tags with self-closing syntax followed by content
-    for i in range(1, 7):
-        pattern = rf'<h{i}([^>]*?)\s*/>([^<]+)</h{i}>'
-        replacement = rf'<h{i}\1>\2</h{i}>'
-        content = re.sub(pattern, replacement, content)
-    
-    # Fix div tags with self-closing syntax followed by content
-    content = re.sub(
-        r'<div([^>]*?)\s*/>([^<]+)</div>',
-        r'<div\1>\2</div>',
-        content
-    )
-    
-    # Fix span tags with self-closing syntax followed by content
-    content = re.sub(
-        r'<span([^>]*?)\s*/>([^<]+)</span>',
-        r'<span\1>\2</span>',
-        content
-    )
-    
-    # Fix p tags with self-closing syntax followed by content
-    content = re.sub(
-        r'<p([^>]*?)\s*/>([^<]+)</p>',
-        r'<p\1>\2</p>',
-        content
-    )
-    
-    # Fix any other common tags with this pattern
-    tags = ['strong', 'em', 'code', 'pre', 'blockquote', 'li', 'ul', 'ol']
-    for tag in tags:
-        pattern = rf'<{tag}([^>]*?)\s*/>([^<]+)</{tag}>'
-        replacement = rf'<{tag}\1>\2</{tag}>'
-        content = re.sub(pattern, replacement, content)
-    
-    return content
+    # <h2 className="..." />Title</h2> -> <h2 className="...">Title</h2>
+    # A self-closing tag followed by text and a closing tag of the same
+    # name was meant to be an opening tag
+    tokens = tokenize(content)
+    fixed = list(tokens)
+    for i in range(len(tokens) - 2):
+        token = tokens[i]
+        if (token.kind == SELF_CLOSING and token.name in CONTENT_TAGS
+                and tokens[i + 1].kind == TEXT
+                and tokens[i + 2].kind == CLOSE and tokens[i + 2].name == token.name):
+            fixed[i] = make_tag(OPEN, token.name, token.attrs)
+    
+    return render(fixed)
 
 def fix_table_issues(content):
     """Fix table formatting issues."""
@@ -86,33 +79,8 @@ def fix_table_issues(content):
     return '\n'.join(fixed_lines)
 
 def fix_quotes_in_attributes(content):
-    """Fix remaining quote issues in component attributes."""
-    
-    # Fix StatsBox with any remaining quote issues
-    content = re.sub(
-        r'<StatsBox\s+stats="{\[(.*?)\]}"\s*/>',
-        lambda m: '<StatsBox stats={[' + m.group(1) + ']} />',
-        content,
-        flags=re.DOTALL
-    )
-    
-    # Fix Timeline items
-    content = re.sub(
-        r'<Timeline\s+items="{\[(.*?)\]}"\s*/>',
-        lambda m: '<Timeline items={[' + m.group(1) + ']} />',
-        content,
-        flags=re.DOTALL
-    )
-    
-    # Fix ComparisonTable
-    content = re.sub(
-        r'rows="{\[(.*?)\]}"',
-        lambda m: 'rows={[' + m.group(1) + ']}',
-        content,
-        flags=re.DOTALL
-    )
-    
-    return content
+    """Fix remaining quote issues in StatsBox, Timeline and ComparisonTable attributes."""
+    return DEQUOTE_COMPONENTS(content)
 
 def fix_unclosed_tags(content):
     """Ensure all opened tags are properly closed."""
@@ -125,38 +93,19 @@ def fix_unclosed_tags(content):
     )
     
     # Remove duplicate closing tags
-    for tag in ['FeatureCard', 'AlertBox', 'Timeline', 'ComparisonTable', 'StatsBox']:
-        content = re.sub(f'</{tag}>\\s*</{tag}>', f'</{tag}>', content)
+    content, _ = balance_tags(content, BALANCED_COMPONENTS)
     
     return content
 
-def process_file(file_path):
-    """Process a single MDX file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Apply all fixes
-        content = fix_self_closing_tags(content)
-        content = fix_table_issues(content)
-        content = fix_quotes_in_attributes(content)
-        content = fix_unclosed_tags(content)
-        
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✓ Fixed: {file_path.name}")
-            return True
-        else:
-            print(f"  No changes: {file_path.name}")
-            return False
-    except Exception as e:
-        print(f"✗ Error processing {file_path.name}: {e}")
-        return False
+def fix_mdx_self_closing_content(content):
+    """Apply all self-closing, table and attribute fixes to one file."""
+    content = fix_self_closing_tags(content)
+    content = fix_table_issues(content)
+    content = fix_quotes_in_attributes(content)
+    content = fix_unclosed_tags(content)
+    return content
 
-def main():
+def main(jobs=None, cache=None):
     """Process all MDX files in the blog directory."""
     blog_dir = Path("/Users/scott/Documents/code/scthornton/perfecxion-site/content/blog")
     
@@ -165,17 +114,12 @@ def main():
         sys.exit(1)
     
     # Get all MDX files
-    mdx_files = sorted(blog_dir.glob("*.mdx"))
+    mdx_files = find_mdx_files(blog_dir)
     
     print(f"Processing {len(mdx_files)} MDX files...\n")
     
-    fixed_count = 0
-    for file_path in mdx_files:
-        if process_file(file_path):
-            fixed_count += 1
-    
-    print(f"\n✓ Fixed {fixed_count} files")
-    print(f"  Total files processed: {len(mdx_files)}")
+    run_corpus(mdx_files, fix_mdx_self_closing_content, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = build_parser().parse_args()
+    main(args.jobs, open_cache(args))
\ No newline at end of file
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Serve the MDX fixers from one long-lived process.
+
+Programs that would run a fixer script once per file (the Node build, an
+editor hook) send JSON-lines requests instead, and pay for starting Python
+and compiling the rules only once. See mdx_fixers/server.py for the
+protocol.
+
+Examples:
+  python scripts/fix-mdx-server.py
+  python scripts/fix-mdx-server.py --socket .cache/mdx-fixers.sock
+  echo '{"steps": ["unicode-quotes"], "paths": ["content/blog/a.mdx"]}' | python scripts/fix-mdx-server.py
+"""
+
+import sys
+
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.pipeline import DEFAULT_STEPS
+from mdx_fixers.server import FixerServer
+
+
+def main():
+    parser = build_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        help="listen on a Unix socket at PATH instead of reading stdin and writing stdout"
+    )
+    parser.add_argument(
+        '--steps',
+        default=','.join(DEFAULT_STEPS),
+        help="comma-separated steps for requests that don't name their own (see fix-mdx-pipeline.py --list)"
+    )
+    args = parser.parse_args()
+
+    try:
+        server = FixerServer(args.jobs, open_cache(args), [step.strip() for step in args.steps.split(',') if step.strip()])
+    except (ValueError, AttributeError, FileNotFoundError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        if args.socket:
+            server.serve_socket(args.socket)
+        else:
+            server.serve_stdio()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import re
-import sys
+
+from mdx_fixers.cli import add_path_arguments, build_parser, fix_files
 
 def fix_mdx_structure(content):
     """Fix various MDX structural issues."""
@@ -115,20 +116,10 @@ def sanitize_input(user_input: str) -> str:
     return content
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python fix-mdx-structure-comprehensive.py <file.mdx>")
-        sys.exit(1)
-    
-    filepath = sys.argv[1]
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    fixed_content = fix_mdx_structure(content)
-    
-    if fixed_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
-        print(f"Fixed structural issues in {filepath}")
-    else:
-        print(f"No structural issues found in {filepath}")
\ No newline at end of file
+    parser = add_path_arguments(build_parser("Fix structural issues in MDX files."))
+    fix_files(
+        parser.parse_args(),
+        fix_mdx_structure,
+        "Fixed structural issues in {}",
+        "No structural issues found in {}"
+    )
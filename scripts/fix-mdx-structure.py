@@ -4,30 +4,58 @@ Comprehensive MDX Structure Fixer
 Addresses all structural parsing issues in MDX files that cause build failures.
 """
 
-import os
 import re
 import sys
 from pathlib import Path
 
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.frontmatter import join as join_frontmatter, split as split_frontmatter
+from mdx_fixers.rules import COLLAPSE_BLANK_LINES, SPACE_AFTER_CLASSNAME
+from mdx_fixers.runner import find_mdx_files, run_corpus
+from mdx_fixers.tokenizer import OPEN, TAG_KINDS, is_component, render, text_token, tokenize
+
+# HTML elements that start a block; components are always treated as blocks
+BLOCK_TAGS = {
+    'div', 'section', 'article', 'aside', 'header', 'footer', 'nav', 'figure',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'li', 'blockquote',
+    'pre', 'table', 'thead', 'tbody', 'tr', 'details', 'summary',
+}
+
+def is_block_tag(token):
+    return is_component(token.name) or token.name in BLOCK_TAGS
+
+def break_adjacent_tags(content):
+    """
+    Put concatenated block-level JSX tags on separate lines.
+    
+    Handles ></Lock><div>, <Icon className="..." /><span>,
+    </h3><div><div> and similar in one pass over the tags. Tags inside
+    code blocks and inline code are not touched.
+    """
+    tokens = tokenize(content)
+    fixed = []
+    for i, token in enumerate(tokens):
+        if fixed and token.kind in TAG_KINDS and tokens[i - 1].kind in TAG_KINDS:
+            previous = tokens[i - 1]
+            # After a closing or self-closing block tag, or before a block tag
+            if previous.kind != OPEN and (is_block_tag(previous) or is_block_tag(token)):
+                fixed.append(text_token('\n'))
+            # Between stacked opening block elements like <div><div>
+            elif (previous.kind == OPEN and token.kind == OPEN
+                    and previous.name in BLOCK_TAGS and token.name in BLOCK_TAGS):
+                fixed.append(text_token('\n'))
+        fixed.append(token)
+    return render(fixed)
+
 def fix_mdx_structure(content):
     """Fix all MDX structural issues that cause parsing errors."""
     
     # Step 1: Fix inline JSX concatenation by adding line breaks
-    # This handles patterns like: ></Lock><div> and similar
-    content = re.sub(r'></([A-Z][a-zA-Z]*)(>|/>|</)', r'></\1>\n<', content)
-    content = re.sub(r'></([a-z]+)><([A-Z][a-zA-Z]*)', r'></\1>\n<\2', content)
-    content = re.sub(r'></([a-z]+)><([a-z]+)', r'></\1>\n<\2', content)
-    
-    # Step 2: Fix self-closing tags followed by opening tags
-    content = re.sub(r'(/>)(<[A-Za-z])', r'\1\n\2', content)
-    
-    # Step 3: Break up complex nested structures on single lines
-    # Look for patterns like: ><h3...></h3><div...><div...>
-    content = re.sub(r'(</h[1-6]>)(<div[^>]*>)(<div[^>]*>)', r'\1\n\2\n\3', content)
-    content = re.sub(r'(</[^>]+>)(<h[1-6][^>]*>)', r'\1\n\2', content)
-    content = re.sub(r'(</[^>]+>)(<div[^>]*>)(<div[^>]*>)', r'\1\n\2\n\3', content)
+    # This handles patterns like: ></Lock><div>, /><span and
+    # ><h3...></h3><div...><div...>
+    content = break_adjacent_tags(content)
     
-    # Step 4: Ensure blank lines before and after JSX blocks
+    # Step 2: Ensure blank lines before and after JSX blocks
     # Add blank line before JSX that follows markdown
     content = re.sub(r'(\n[^<\n]+)\n(<div[^>]*>)', r'\1\n\n\2', content)
     content = re.sub(r'(\n[^<\n]+)\n(<[A-Z][a-zA-Z]*[^>]*>)', r'\1\n\n\2', content)
@@ -36,70 +64,30 @@ def fix_mdx_structure(content):
     content = re.sub(r'(</div>)\n(##[^#])', r'\1\n\n\2', content)
     content = re.sub(r'(</[^>]+>)\n(##[^#])', r'\1\n\n\2', content)
     
-    # Step 5: Fix specific problematic patterns found in the errors
-    # Fix the pattern: className="..."></Element><div>
-    content = re.sub(r'(className="[^"]*")></([A-Z][a-zA-Z]*[^>]*)><div>', r'\1">\n</\2>\n<div>', content)
+    # Step 3: Fix missing spaces in JSX attributes
+    content = SPACE_AFTER_CLASSNAME(content)
     
-    # Fix the pattern: ><Element ... /></Element><div>
-    content = re.sub(r'></([A-Z][a-zA-Z]*[^>]*)><div>', r'>\n</\1>\n<div>', content)
-    
-    # Step 6: Fix nested div structures that are too complex
-    # Break up lines with multiple opening div tags
-    content = re.sub(r'(<div[^>]*>)(<div[^>]*>)(<div[^>]*>)', r'\1\n\2\n\3', content)
-    
-    # Step 7: Fix missing spaces in JSX attributes
-    content = re.sub(r'className="([^"]*)"([A-Za-z])', r'className="\1" \2', content)
-    
-    # Step 8: Clean up excessive whitespace but preserve intentional structure
+    # Step 4: Clean up excessive whitespace but preserve intentional structure
     # Remove multiple consecutive empty lines (more than 2)
-    content = re.sub(r'\n\n\n+', '\n\n', content)
+    content = COLLAPSE_BLANK_LINES(content)
     
-    # Step 9: Fix specific icon patterns that cause issues
-    # Ensure proper line breaks around self-closing icon components
-    content = re.sub(r'(<[A-Z][a-zA-Z]* className="[^"]*"[^/>]*/>)(<[a-z]+)', r'\1\n<\2', content)
-    
-    # Step 10: Handle paragraph content mixed with JSX
+    # Step 5: Handle paragraph content mixed with JSX
     # Ensure paragraphs are properly separated from JSX
     content = re.sub(r'(<div[^>]*>[^<]+</div>)\n([A-Z][^<\n]+)', r'\1\n\n\2', content)
     
     return content.strip()
 
-def process_mdx_file(file_path):
-    """Process a single MDX file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract frontmatter
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            frontmatter = parts[1]
-            body = parts[2]
-        else:
-            frontmatter = ""
-            body = content
-        
-        # Fix the body structure
-        fixed_body = fix_mdx_structure(body)
-        
-        # Reconstruct the file
-        if frontmatter:
-            fixed_content = f"---{frontmatter}---{fixed_body}"
-        else:
-            fixed_content = fixed_body
-        
-        # Write back the fixed content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
-        
-        print(f"✅ Fixed: {file_path}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error processing {file_path}: {str(e)}")
-        return False
+def fix_mdx_file(content):
+    """Fix the body of a single MDX file, leaving its frontmatter alone."""
+    frontmatter, body = split_frontmatter(content)
+    
+    # Fix the body structure
+    fixed_body = fix_mdx_structure(body)
+    
+    # Reconstruct the file
+    return join_frontmatter(frontmatter, fixed_body)
 
-def main():
+def main(jobs=None, cache=None):
     """Main function to process all MDX files."""
     # Get the content directory
     content_dir = Path(__file__).parent.parent / 'content' / 'blog'
@@ -109,7 +97,7 @@ def main():
         sys.exit(1)
     
     # Get all MDX files
-    mdx_files = list(content_dir.glob('*.mdx'))
+    mdx_files = find_mdx_files(content_dir)
     
     if not mdx_files:
         print("❌ No MDX files found in content/blog/")
@@ -117,10 +105,8 @@ def main():
     
     print(f"🔧 Processing {len(mdx_files)} MDX files...")
     
-    success_count = 0
-    for mdx_file in mdx_files:
-        if process_mdx_file(mdx_file):
-            success_count += 1
+    results = run_corpus(mdx_files, fix_mdx_file, jobs=jobs, cache=cache)
+    success_count = sum(1 for r in results if not r.error)
     
     print(f"\n✅ Successfully processed {success_count}/{len(mdx_files)} files")
     
@@ -133,4 +119,5 @@ def main():
         print("⚠️  Some files had errors. Please check the output above.")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    args = build_parser(__doc__).parse_args()
+    main(args.jobs, open_cache(args))
\ No newline at end of file
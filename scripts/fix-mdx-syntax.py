@@ -6,44 +6,43 @@ Script to fix MDX syntax issues
 import os
 import re
 
-def fix_mdx_syntax():
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
+def fix_mdx_syntax_content(content):
+    """Convert JSX-only syntax to plain MDX in one file."""
+    
+    # Fix className -> class for MDX compatibility
+    content = re.sub(r'className="([^"]*)"', r'class="\1"', content)
+    
+    # Fix any remaining JSX-specific syntax
+    content = re.sub(r'<br />', r'<br>', content)
+    
+    # Fix invalid self-closing tags like <Component class="..." ></Component>
+    # Convert them to proper self-closing tags <Component class="..." />
+    content = re.sub(r'<([A-Z][a-zA-Z]+)\s+([^>]*)\s*></\1>', r'<\1 \2 />', content)
+    
+    return content
+
+def fix_typos_content(content):
+    """Fix specific typos found in the files"""
+    # Fix the font-semibent typo
+    return content.replace('font-semibent', 'font-semibold')
+
+def fix_mdx_syntax(jobs=None, cache=None):
     blog_dir = "content/blog"
     
     # Get all MDX files in the blog directory
     if not os.path.exists(blog_dir):
         print(f"Blog directory not found: {blog_dir}")
-        return
+        return []
         
-    files_to_fix = [f for f in os.listdir(blog_dir) if f.endswith('.mdx')]
+    files_to_fix = find_mdx_files(blog_dir)
     
-    for filename in files_to_fix:
-        filepath = os.path.join(blog_dir, filename)
-        if not os.path.exists(filepath):
-            print(f"File not found: {filepath}")
-            continue
-            
-        print(f"Fixing MDX syntax in {filename}...")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix className -> class for MDX compatibility
-        content = re.sub(r'className="([^"]*)"', r'class="\1"', content)
-        
-        # Fix any remaining JSX-specific syntax
-        content = re.sub(r'<br />', r'<br>', content)
-        
-        # Fix invalid self-closing tags like <Component class="..." ></Component>
-        # Convert them to proper self-closing tags <Component class="..." />
-        content = re.sub(r'<([A-Z][a-zA-Z]+)\s+([^>]*)\s*></\1>', r'<\1 \2 />', content)
-        
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"✅ Fixed MDX syntax in {filename}")
+    print(f"Fixing MDX syntax in {len(files_to_fix)} files...")
+    return run_corpus(files_to_fix, fix_mdx_syntax_content, jobs=jobs, cache=cache)
 
-def fix_typos():
+def fix_typos(jobs=None, cache=None):
     """Fix specific typos found in the files"""
     blog_dir = "content/blog"
     
@@ -52,26 +51,15 @@ def fix_typos():
         "advanced-prompt-engineering-security-defense-through-design.mdx"
     ]
     
-    for filename in typo_files:
-        filepath = os.path.join(blog_dir, filename)
-        if not os.path.exists(filepath):
-            continue
-            
-        print(f"Fixing typos in {filename}...")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix typo
-        content = content.replace('font-semibent', 'font-semibold')
-        
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"✅ Fixed typos in {filename}")
+    paths = [os.path.join(blog_dir, f) for f in typo_files]
+    paths = [p for p in paths if os.path.exists(p)]
+    
+    print(f"Fixing typos in {len(paths)} files...")
+    return run_corpus(paths, fix_typos_content, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    fix_mdx_syntax()
-    fix_typos()
-    print("✅ All MDX syntax issues have been fixed!") 
\ No newline at end of file
+    args = build_parser(__doc__).parse_args()
+    cache = open_cache(args)
+    fix_mdx_syntax(args.jobs, cache)
+    fix_typos(args.jobs, cache)
+    print("✅ All MDX syntax issues have been fixed!") 
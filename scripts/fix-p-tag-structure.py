@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import re
-import sys
+
+from mdx_fixers.cli import add_path_arguments, build_parser, fix_files
 
 def fix_p_tag_structure(content):
     """Fix self-closing p tags that should wrap content."""
@@ -14,20 +15,10 @@ def fix_p_tag_structure(content):
     return fixed_content
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python fix-p-tag-structure.py <file.mdx>")
-        sys.exit(1)
-    
-    filepath = sys.argv[1]
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    fixed_content = fix_p_tag_structure(content)
-    
-    if fixed_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
-        print(f"Fixed p tag structure in {filepath}")
-    else:
-        print(f"No p tag issues found in {filepath}")
\ No newline at end of file
+    parser = add_path_arguments(build_parser("Turn self-closing p tags that wrap content into real ones in MDX files."))
+    fix_files(
+        parser.parse_args(),
+        fix_p_tag_structure,
+        "Fixed p tag structure in {}",
+        "No p tag issues found in {}"
+    )
@@ -1,58 +1,50 @@
 #!/usr/bin/env python3
 
 import re
-import sys
-import os
 
-def fix_self_closing_components(file_path):
-    """Fix self-closing React component tags in MDX files."""
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original_content = content
-    
-    # Pattern to match self-closing component tags that need to be converted
-    # Matches patterns like <ComponentName className="..." >
-    # But not regular HTML tags like <div>, <p>, etc.
-    component_pattern = r'<([A-Z][A-Za-z]*)\s+([^>]*?)>\s*(?!\s*</\1>)'
-    
-    def replace_component(match):
-        component_name = match.group(1)
-        attributes = match.group(2).strip()
-        return f'<{component_name} {attributes}></{component_name}>'
-    
-    # Fix self-closing component tags
-    content = re.sub(component_pattern, replace_component, content)
-    
-    # Also fix self-closing <p> tags that should wrap content
-    # Pattern: <p className="..."> followed by content that's not properly wrapped
-    p_pattern = r'<p\s+([^>]*?)>\s*\n([^<]+?)(?=\n<|$)'
-    
-    def replace_p_tag(match):
-        attributes = match.group(1)
-        text_content = match.group(2).strip()
-        return f'<p {attributes}>\n{text_content}\n</p>'
-    
-    content = re.sub(p_pattern, replace_p_tag, content, flags=re.MULTILINE)
-    
-    if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"Fixed self-closing components in {file_path}")
-        return True
-    else:
-        print(f"No changes needed in {file_path}")
-        return False
+from mdx_fixers.cli import add_path_arguments, build_parser, fix_files
+from mdx_fixers.tokenizer import OPEN, TEXT, is_component, make_tag, match_tags, render, text_token, tokenize
+
+# The first non-blank line after an unclosed <p ...>, if it ends before the next tag
+P_BODY_PATTERN = re.compile(r'\s*\n([^\n]+?)(?=\n)')
+
+def fix_component_tags(content):
+    """Close component and <p> tags that are opened but never closed."""
+    
+    tokens = tokenize(content)
+    _, unmatched = match_tags(tokens)
+    
+    fixed = list(tokens)
+    for i in unmatched:
+        token = tokens[i]
+        if token.kind != OPEN or not token.attrs:
+            continue
+        
+        # Components like <Lock className="..." > that are never closed
+        # get an empty closing tag. Containers with a matching close tag
+        # are left alone.
+        if is_component(token.name):
+            fixed[i] = text_token(f'{token.text}</{token.name}>')
+            continue
+        
+        # <p className="..."> followed by a line of text that is never
+        # closed: wrap that line
+        following = tokens[i + 1] if i + 1 < len(tokens) else None
+        if token.name == 'p' and following is not None and following.kind == TEXT:
+            match = P_BODY_PATTERN.match(following.text)
+            if match and match.group(1).strip():
+                fixed[i] = make_tag(OPEN, 'p', token.attrs)
+                fixed[i + 1] = text_token(
+                    f'\n{match.group(1).strip()}\n</p>{following.text[match.end():]}'
+                )
+    
+    return render(fixed)
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python3 fix-self-closing-components.py <file_path>")
-        sys.exit(1)
-    
-    file_path = sys.argv[1]
-    if not os.path.exists(file_path):
-        print(f"File not found: {file_path}")
-        sys.exit(1)
-    
-    fix_self_closing_components(file_path)
\ No newline at end of file
+    parser = add_path_arguments(build_parser("Close component and p tags that are opened but never closed in MDX files."))
+    fix_files(
+        parser.parse_args(),
+        fix_component_tags,
+        "Fixed self-closing components in {}",
+        "No changes needed in {}"
+    )
@@ -1,57 +1,77 @@
 #!/usr/bin/env python3
 """
 Script to fix specific MDX parsing errors
+
+With --mmap only the byte-safe clean-up (fixes 6-8: non-ASCII characters,
+line endings, trailing whitespace) is applied, streaming each file through
+mmap in chunks, for pages too large to read whole.
 """
 
-import os
 import re
 
-def fix_specific_mdx_errors():
+from mdx_fixers.bytestream import (
+    ByteTransform, NormalizeNewlines, StripNonAscii, StripTrailingWhitespace,
+)
+from mdx_fixers.charmap import STRIP_NON_ASCII
+from mdx_fixers.cli import build_parser, open_cache
+from mdx_fixers.normalize import normalized
+from mdx_fixers.rules import (
+    BLANK_LINE_AFTER_DIV, BLANK_LINE_BEFORE_DIV, STRIP_TRAILING_BACKTICK,
+    UNWRAP_CODE_DIV_CLOSE, UNWRAP_CODE_DIV_OPEN, UNWRAP_CODE_TAG,
+)
+from mdx_fixers.runner import find_mdx_files, run_corpus
+
+@normalized(blank_lines=False)
+def fix_specific_mdx_content(content):
+    """Fix the specific backtick, spacing and character errors."""
+    
+    # Fix 1: Remove problematic backticks that are causing JSX parsing errors
+    content = UNWRAP_CODE_DIV_OPEN(content)
+    content = UNWRAP_CODE_DIV_CLOSE(content)
+    
+    # Fix 2: Remove any remaining problematic backticks around JSX elements
+    content = UNWRAP_CODE_TAG(content)
+    
+    # Fix 3: Fix specific problematic patterns
+    content = re.sub(r'<div class="bg-green-50 dark:bg-green-900/20 border-l-4 border-green-500 p-6 mb-8 rounded-r-lg">`', 
+                    r'<div class="bg-green-50 dark:bg-green-900/20 border-l-4 border-green-500 p-6 mb-8 rounded-r-lg">', content)
+    
+    # Fix 4: Remove any trailing backticks
+    content = STRIP_TRAILING_BACKTICK(content)
+    
+    # Fix 5: Ensure proper spacing around JSX elements
+    content = BLANK_LINE_BEFORE_DIV(content)
+    content = BLANK_LINE_AFTER_DIV(content)
+    
+    # Fix 6: Remove any invalid characters
+    content = STRIP_NON_ASCII(content)
+    
+    # Fixes 7 and 8: line endings and trailing whitespace are normalised
+    # by the final stage (see @normalized)
+    
+    return content
+
+# Fixes 6-8 on raw bytes, for --mmap
+CHARACTER_CLEANUP = ByteTransform(StripNonAscii, NormalizeNewlines, StripTrailingWhitespace)
+
+def fix_specific_mdx_errors(jobs=None, cache=None, mmap=False):
     blog_dir = "content/blog"
     
     # Get all MDX files
-    mdx_files = [f for f in os.listdir(blog_dir) if f.endswith('.mdx')]
-    
-    for filename in mdx_files:
-        filepath = os.path.join(blog_dir, filename)
-        print(f"Fixing specific errors in {filename}...")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fix 1: Remove problematic backticks that are causing JSX parsing errors
-        content = re.sub(r'`(\s*<div[^>]*>)`', r'\1', content)
-        content = re.sub(r'`(\s*</div>)`', r'\1', content)
-        
-        # Fix 2: Remove any remaining problematic backticks around JSX elements
-        content = re.sub(r'`(\s*<[^>]+>)`', r'\1', content)
-        
-        # Fix 3: Fix specific problematic patterns
-        content = re.sub(r'<div class="bg-green-50 dark:bg-green-900/20 border-l-4 border-green-500 p-6 mb-8 rounded-r-lg">`', 
-                        r'<div class="bg-green-50 dark:bg-green-900/20 border-l-4 border-green-500 p-6 mb-8 rounded-r-lg">', content)
-        
-        # Fix 4: Remove any trailing backticks
-        content = re.sub(r'`(\s*)$', r'\1', content, flags=re.MULTILINE)
-        
-        # Fix 5: Ensure proper spacing around JSX elements
-        content = re.sub(r'(\n)(<div)', r'\1\n\2', content)
-        content = re.sub(r'(</div>)(\n)', r'\1\n\n\2', content)
-        
-        # Fix 6: Remove any invalid characters
-        content = re.sub(r'[^\x00-\x7F]+', '', content)
-        
-        # Fix 7: Ensure proper line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Fix 8: Remove any trailing whitespace
-        content = re.sub(r'[ \t]+$', '', content, flags=re.MULTILINE)
-        
-        # Write the fixed content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"✅ Fixed specific errors in {filename}")
+    mdx_files = find_mdx_files(blog_dir)
+    
+    print(f"Fixing specific errors in {len(mdx_files)} files...")
+    transform = CHARACTER_CLEANUP if mmap else fix_specific_mdx_content
+    return run_corpus(mdx_files, transform, jobs=jobs, cache=cache)
 
 if __name__ == "__main__":
-    fix_specific_mdx_errors()
-    print("✅ All specific MDX errors have been fixed!") 
\ No newline at end of file
+    parser = build_parser(__doc__)
+    parser.add_argument(
+        '--mmap',
+        action='store_true',
+        help="only strip non-ASCII characters, line endings and trailing whitespace, "
+             "streaming files through mmap instead of reading them whole"
+    )
+    args = parser.parse_args()
+    fix_specific_mdx_errors(args.jobs, open_cache(args), args.mmap)
+    print("✅ All specific MDX errors have been fixed!") 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import re
-import sys
+
+from mdx_fixers.cli import add_path_arguments, build_parser, fix_files
 
 def fix_stray_brackets(content):
     """Fix stray < characters on their own lines after closing tags."""
@@ -25,20 +26,10 @@ def fix_stray_brackets(content):
     return content
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python fix-stray-brackets.py <file.mdx>")
-        sys.exit(1)
-    
-    filepath = sys.argv[1]
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    fixed_content = fix_stray_brackets(content)
-    
-    if fixed_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
-        print(f"Fixed stray brackets in {filepath}")
-    else:
-        print(f"No stray brackets found in {filepath}")
\ No newline at end of file
+    parser = add_path_arguments(build_parser("Remove stray < lines after closing tags in MDX files."))
+    fix_files(
+        parser.parse_args(),
+        fix_stray_brackets,
+        "Fixed stray brackets in {}",
+        "No stray brackets found in {}"
+    )
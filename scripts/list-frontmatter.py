@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+List frontmatter fields across the MDX corpus.
+
+Only the header of each file is read, so listing dates, categories and
+tags stays fast however large the article bodies are.
+
+Examples:
+  python scripts/list-frontmatter.py
+  python scripts/list-frontmatter.py content/knowledge --fields title,category
+"""
+
+import argparse
+import sys
+
+from mdx_fixers.frontmatter import read_frontmatter
+from mdx_fixers.runner import find_mdx_files
+
+
+def format_field(value):
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value)
+    return str(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        'directory',
+        nargs='?',
+        default='content/blog',
+        help="directory of MDX files to list (default: content/blog)"
+    )
+    parser.add_argument(
+        '--fields',
+        default='date,category,tags',
+        help="comma-separated frontmatter fields to print (default: date,category,tags)"
+    )
+    args = parser.parse_args()
+
+    fields = [field.strip() for field in args.fields.split(',') if field.strip()]
+    mdx_files = find_mdx_files(args.directory)
+    if not mdx_files:
+        print(f"❌ No MDX files found in {args.directory}")
+        sys.exit(1)
+
+    print('\t'.join(['file'] + fields))
+    for path in mdx_files:
+        frontmatter = read_frontmatter(path)
+        values = [format_field(frontmatter.get(field)) if frontmatter else '' for field in fields]
+        print('\t'.join([path.name] + values))
+
+
+if __name__ == "__main__":
+    main()
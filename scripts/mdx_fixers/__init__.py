@@ -0,0 +1,49 @@
+"""
+Shared helpers for the MDX fixer scripts in scripts/.
+
+The fix-*.py scripts import from this package so that common machinery
+(icon translation, character folding, tokenizing, code masking,
+frontmatter, shared rewrite rules, line state machines, whitespace
+normalisation, corpus runners, write layers) lives in one place.
+"""
+
+from .cache import FixerCache
+from .charmap import CharMap
+from .frontmatter import Frontmatter, HeaderTransform, read_frontmatter
+from .icons import IconTranslator
+from .lines import LineMachine
+from .masking import CodeMask
+from .normalize import Normalizer, normalized
+from .pipeline import Pipeline
+from .rules import Rule
+from .runner import FileResult, find_mdx_files, run_corpus, run_tasks
+from .scripts import ScriptTransform, load_script
+from .tokenizer import Token, match_tags, render, tokenize
+from .writer import atomic_write, write_if_changed
+
+__all__ = [
+    'CharMap',
+    'CodeMask',
+    'FileResult',
+    'FixerCache',
+    'Frontmatter',
+    'HeaderTransform',
+    'IconTranslator',
+    'LineMachine',
+    'Normalizer',
+    'Pipeline',
+    'Rule',
+    'ScriptTransform',
+    'Token',
+    'atomic_write',
+    'find_mdx_files',
+    'load_script',
+    'match_tags',
+    'normalized',
+    'read_frontmatter',
+    'render',
+    'run_corpus',
+    'run_tasks',
+    'tokenize',
+    'write_if_changed',
+]
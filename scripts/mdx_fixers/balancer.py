@@ -0,0 +1,129 @@
+"""
+Stack-based tag balancing for MDX files.
+
+The fixers used to check balance by counting re.findall('<Name') against
+re.findall('</Name>') for every component name, and to mop up the results
+of earlier scripts with one `</Name>\\s*</Name>` substitution per name.
+Counts can't say where the problem is, `<Timeline` also counts
+`<TimelineItem`, and the substitution drops legitimate nested closes.
+
+balance_tags() tokenizes the file once, pairs tags with match_tags() and
+looks only at the tags left unmatched. An orphan close tag is removed or
+moved when the intent is unambiguous:
+
+  </X> </X>            a duplicate close; the orphan is dropped
+  <X /> </X>           a close after a self-closing tag; dropped
+  <X></X> text </X>    an empty element whose content landed after its
+                       close; the content is moved inside
+
+Everything else is returned as an Issue with its line and column. The
+whole pass is linear in the size of the file, however many names are
+checked.
+"""
+
+import bisect
+from collections import namedtuple
+
+from .tokenizer import CLOSE, OPEN, SELF_CLOSING, TAG_KINDS, TEXT, match_tags, tokenize
+
+UNCLOSED = 'unclosed'
+ORPHAN = 'orphan'
+
+
+class Issue(namedtuple('Issue', ['kind', 'name', 'line', 'column'])):
+    """An unclosed open tag or an orphan close tag, at a 1-based line and column."""
+
+    def __str__(self):
+        tag = f"<{self.name}>" if self.kind == UNCLOSED else f"</{self.name}>"
+        return f"{self.kind} {tag} at line {self.line}, column {self.column}"
+
+
+def _previous_tag(tokens, i):
+    """
+    Return (index, blank) for the nearest tag before token i, where blank
+    says whether only whitespace text lies between them. index is None if
+    something other than text and tags (a code fence, frontmatter) comes first.
+    """
+    blank = True
+    j = i - 1
+    while j >= 0 and tokens[j].kind == TEXT:
+        blank = blank and not tokens[j].text.strip()
+        j -= 1
+    if j < 0 or tokens[j].kind not in TAG_KINDS:
+        return None, blank
+    return j, blank
+
+
+def _positions(content, offsets):
+    """(line, column) for each offset, from one scan for newlines."""
+    newlines = []
+    pos = content.find('\n')
+    while pos != -1:
+        newlines.append(pos)
+        pos = content.find('\n', pos + 1)
+    positions = []
+    for offset in offsets:
+        line = bisect.bisect_left(newlines, offset)
+        line_start = newlines[line - 1] + 1 if line else 0
+        positions.append((line + 1, offset - line_start + 1))
+    return positions
+
+
+def balance_tags(content, names=None, repair=True):
+    """
+    Repair the unambiguous tag imbalances in content and report the rest.
+
+    names limits both repairs and issues to those tag names (default: every
+    tag). Returns (content, issues).
+    """
+    tokens = tokenize(content)
+    pairs, unmatched = match_tags(tokens)
+
+    def wanted(token):
+        return names is None or token.name in names
+
+    drop = set()
+    replace = {}
+    resolved = set()
+
+    for i in unmatched:
+        token = tokens[i]
+        if not repair or token.kind != CLOSE or not wanted(token):
+            continue
+        j, blank = _previous_tag(tokens, i)
+        if j is None or tokens[j].name != token.name:
+            continue
+        previous = tokens[j]
+
+        if blank and (previous.kind == SELF_CLOSING
+                      or (previous.kind == CLOSE and (j in pairs or j in resolved))):
+            drop.update(range(j + 1, i + 1))
+            resolved.add(i)
+        elif not blank and previous.kind == CLOSE and j in pairs:
+            opener = pairs[j]
+            if all(tokens[k].kind == TEXT and not tokens[k].text.strip() for k in range(opener + 1, j)):
+                # <X></X> text </X>: the element was closed before its content
+                drop.update(range(opener + 1, j + 1))
+                body = ''.join(tokens[k].text for k in range(j + 1, i)).strip()
+                replace[j + 1] = '\n' + body + '\n'
+                drop.update(range(j + 2, i))
+                resolved.add(i)
+
+    issues = []
+    offsets = []
+    for i in unmatched:
+        token = tokens[i]
+        if i in resolved or i in drop or not wanted(token):
+            continue
+        issues.append((UNCLOSED if token.kind == OPEN else ORPHAN, token.name))
+        offsets.append(token.start)
+    issues = [Issue(kind, name, *position) for (kind, name), position in zip(issues, _positions(content, offsets))]
+
+    if drop or replace:
+        content = ''.join(replace.get(k, token.text) for k, token in enumerate(tokens) if k not in drop)
+    return content, issues
+
+
+def find_unbalanced(content, names=None):
+    """Report unclosed and orphan tags without changing anything."""
+    return balance_tags(content, names, repair=False)[1]
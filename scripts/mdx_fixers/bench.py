@@ -0,0 +1,87 @@
+"""
+Small timing and memory helpers shared by the fixer benchmarks.
+"""
+
+import time
+import tracemalloc
+from pathlib import Path
+
+CONTENT_DIR = Path(__file__).resolve().parent.parent.parent / 'content'
+
+
+def load_corpus(root=CONTENT_DIR, patterns=('*.mdx', '*.md')):
+    """Read every MDX/markdown file under root into a list of (path, text)."""
+    corpus = []
+    for pattern in patterns:
+        for path in sorted(Path(root).rglob(pattern)):
+            corpus.append((path, path.read_text(encoding='utf-8')))
+    return corpus
+
+
+def time_corpus(transform, texts, repeat=3):
+    """Return the best wall time in seconds for running transform over texts."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            transform(text)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def format_comparison(label, baseline, candidate):
+    """Format a one-line baseline vs candidate timing comparison."""
+    speedup = baseline / candidate if candidate else float('inf')
+    return (f"{label:<40} baseline {baseline * 1000:9.1f} ms   "
+            f"new {candidate * 1000:9.1f} ms   speedup {speedup:6.1f}x")
+
+
+def measure_throughput(transform, texts):
+    """
+    Run transform over an iterable of texts, timing only the transform.
+
+    Returns a dict with pages, bytes, seconds, mb_per_s, files_per_s and
+    the number of pages the transform raised on.
+    """
+    pages = 0
+    size = 0
+    errors = 0
+    elapsed = 0.0
+    for text in texts:
+        pages += 1
+        size += len(text.encode('utf-8'))
+        start = time.perf_counter()
+        try:
+            transform(text)
+        except Exception:
+            errors += 1
+        elapsed += time.perf_counter() - start
+
+    return {
+        'pages': pages,
+        'bytes': size,
+        'seconds': elapsed,
+        'mb_per_s': size / 1e6 / elapsed if elapsed else None,
+        'files_per_s': pages / elapsed if elapsed else None,
+        'errors': errors,
+    }
+
+
+def peak_allocations(transform, items):
+    """
+    Return the mean and the largest peak of memory (in bytes) allocated
+    while transform ran on each item, above what was allocated before.
+    """
+    peaks = []
+    tracemalloc.start()
+    try:
+        for item in items:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            transform(item)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return sum(peaks) / len(peaks) if peaks else 0, max(peaks, default=0)
@@ -0,0 +1,192 @@
+"""
+Memory-mapped, chunked byte transforms for very large files.
+
+Generated knowledge pages and exported white papers can be tens of MB.
+Reading one with f.read() and running a few re.sub passes over it keeps
+several full copies of the file alive at once. Some clean-ups don't need
+decoded text at all: in UTF-8 every byte of a non-ASCII character is
+>= 0x80, and newlines, spaces and tabs are single ASCII bytes, so
+
+    StripNonAscii            drop every non-ASCII character
+    NormalizeNewlines        \\r\\n and lone \\r to \\n
+    StripTrailingWhitespace  spaces and tabs at the end of each line
+
+can run on raw bytes. A ByteTransform chains ByteFilters and rewrite()
+maps the file with mmap, feeds it through the filters a chunk at a time
+and streams the output to a temp file (see writer.atomic_open). Each
+filter holds back only the bytes whose fate depends on the next chunk (a
+\\r that may start a \\r\\n, a run of spaces that may end a line). Pages
+of the mapping are released once their chunk is written, so peak memory
+is a small multiple of CHUNK_SIZE whatever the size of the file.
+
+A ByteTransform called on text works like any other transform, so it can
+also be part of a Pipeline. The corpus runner sees `streaming` and calls
+rewrite() instead of reading the file.
+"""
+
+import contextlib
+import hashlib
+import mmap
+import os
+import re
+
+from .cache import source_version
+from .writer import atomic_open
+
+CHUNK_SIZE = 1024 * 1024
+
+NON_ASCII_BYTES = bytes(range(0x80, 0x100))
+TRAILING_WHITESPACE_RE = re.compile(rb'[ \t]+\n')
+
+
+class ByteFilter:
+    """
+    One byte transform applied chunk by chunk. feed() returns the output
+    for a chunk and may keep a tail back; finish() returns what is left
+    at the end of the file.
+    """
+
+    def feed(self, chunk):
+        return chunk
+
+    def finish(self):
+        return b''
+
+
+class StripNonAscii(ByteFilter):
+    """Delete every non-ASCII character (the str rule [^\\x00-\\x7F]+)."""
+
+    def feed(self, chunk):
+        return chunk.translate(None, NON_ASCII_BYTES)
+
+
+class NormalizeNewlines(ByteFilter):
+    """\\r\\n and lone \\r to \\n, as universal-newline reading does."""
+
+    def __init__(self):
+        self.carriage_return = False
+
+    def feed(self, chunk):
+        if self.carriage_return:
+            chunk = b'\r' + chunk
+        # A \r at the end of the chunk may be the first half of a \r\n
+        self.carriage_return = chunk.endswith(b'\r')
+        if self.carriage_return:
+            chunk = chunk[:-1]
+        return chunk.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+    def finish(self):
+        return b'\n' if self.carriage_return else b''
+
+
+class StripTrailingWhitespace(ByteFilter):
+    """Spaces and tabs before each \\n and at the end of the file (the str rule [ \\t]+$)."""
+
+    def __init__(self):
+        self.tail = b''
+
+    def feed(self, chunk):
+        chunk = self.tail + chunk
+        body = chunk.rstrip(b' \t')
+        # Kept back until we know whether a newline follows
+        self.tail = chunk[len(body):]
+        return TRAILING_WHITESPACE_RE.sub(b'\n', body)
+
+    def finish(self):
+        return b''
+
+
+@contextlib.contextmanager
+def map_file(path):
+    """Map path read-only; an empty file (which mmap refuses) maps to b''."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield mapped
+
+
+def iter_chunks(mapped, chunk_size=CHUNK_SIZE):
+    """Yield chunk_size slices of a mapping, releasing each one's pages after it is used."""
+    # madvise needs page-aligned offsets
+    chunk_size = max(mmap.PAGESIZE, chunk_size - chunk_size % mmap.PAGESIZE)
+    release = isinstance(mapped, mmap.mmap) and hasattr(mmap, 'MADV_DONTNEED')
+    for start in range(0, len(mapped), chunk_size):
+        yield mapped[start:start + chunk_size]
+        if release:
+            # Clean, file-backed pages: dropping them only means a re-read
+            # from disk should they be touched again
+            mapped.madvise(mmap.MADV_DONTNEED, start, min(chunk_size, len(mapped) - start))
+
+
+def filter_chunks(chunks, filters):
+    """Run chunks through filters in turn, yielding the non-empty output."""
+    for chunk in chunks:
+        for f in filters:
+            chunk = f.feed(chunk)
+        if chunk:
+            yield chunk
+
+    # Whatever a filter holds back at the end still goes through the rest
+    for i, f in enumerate(filters):
+        chunk = f.finish()
+        for later in filters[i + 1:]:
+            chunk = later.feed(chunk)
+        if chunk:
+            yield chunk
+
+
+class _Unchanged(Exception):
+    pass
+
+
+class ByteTransform:
+    """
+    A transform made of ByteFilter classes, applied in order. The classes
+    are instantiated afresh for every file, so one transform can be shared
+    between files and pickled for worker processes.
+    """
+
+    streaming = True
+
+    def __init__(self, *filters, chunk_size=CHUNK_SIZE):
+        self.filters = filters
+        self.chunk_size = chunk_size
+
+    def __call__(self, content):
+        data = content.encode('utf-8', 'surrogatepass')
+        fixed = b''.join(filter_chunks([data], [f() for f in self.filters]))
+        return fixed.decode('utf-8', 'surrogatepass')
+
+    def rewrite(self, path):
+        """
+        Stream path through the filters into a temp file that replaces it
+        only if the bytes changed. Returns (changed, SHA-256 of the output).
+        """
+        before, after = hashlib.sha256(), hashlib.sha256()
+        try:
+            with map_file(path) as mapped, atomic_open(path, 'wb') as out:
+                for chunk in filter_chunks(self._hashed(mapped, before), [f() for f in self.filters]):
+                    after.update(chunk)
+                    out.write(chunk)
+                if after.digest() == before.digest():
+                    # atomic_open removes the temp file and leaves path alone
+                    raise _Unchanged
+        except _Unchanged:
+            return False, after.hexdigest()
+        return True, after.hexdigest()
+
+    def _hashed(self, mapped, digest):
+        for chunk in iter_chunks(mapped, self.chunk_size):
+            digest.update(chunk)
+            yield chunk
+
+    def cache_identity(self):
+        names = '+'.join(f.__name__ for f in self.filters)
+        return f"bytes:{names}", source_version(os.path.abspath(__file__))
+
+    def __repr__(self):
+        return f"ByteTransform({', '.join(f.__name__ for f in self.filters)})"
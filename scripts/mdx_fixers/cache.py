@@ -0,0 +1,176 @@
+"""
+Incremental cache for fixer runs.
+
+The manifest in .cache/mdx-fixers.json records, for every file a fixer has
+processed, the hash of the file's content afterwards and the version of each
+transform applied to that content. On the next run a file is skipped if its
+content (checked by size and mtime first, then by hash) and the transform's
+version are unchanged, so re-running the fixers over an untouched corpus
+does not read or parse anything.
+
+A transform's version is derived from the source of the script that defines
+it and from the sources of this package, whose rules and helpers every
+fixer uses, so editing a fixer or a shared module invalidates its cache
+entries automatically.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+from pathlib import Path
+
+from .writer import atomic_write
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = PACKAGE_DIR.parent.parent
+DEFAULT_MANIFEST = REPO_ROOT / '.cache' / 'mdx-fixers.json'
+
+# Bump to discard every manifest written by an older layout
+MANIFEST_VERSION = 1
+
+
+def content_hash(data):
+    """SHA-256 of a file's text or bytes."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _source_hash(path):
+    with open(path, 'rb') as f:
+        return content_hash(f.read())[:16]
+
+
+@functools.lru_cache(maxsize=None)
+def package_hash():
+    """Hash of every module in mdx_fixers, in name order."""
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.glob('*.py')):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def source_version(path):
+    """The version of code defined in the file at path: its source and the package's."""
+    return content_hash(_source_hash(path) + package_hash())[:16]
+
+
+def _function_source_file(func):
+    module = sys.modules.get(func.__module__)
+    path = getattr(module, '__file__', None) or inspect.getsourcefile(func)
+    return os.path.abspath(path)
+
+
+def transform_identity(transform):
+    """
+    Return (key, version) for a transform.
+
+    Pipelines and script references describe themselves; plain functions
+    are keyed by script and name and versioned by their script's source
+    and the package's.
+    """
+    if hasattr(transform, 'cache_identity'):
+        return transform.cache_identity()
+
+    if isinstance(transform, functools.partial):
+        key, version = transform_identity(transform.func)
+        args = repr((transform.args, sorted(transform.keywords.items())))
+        return f"{key}{args}", version
+
+    source = _function_source_file(transform)
+    return f"{Path(source).stem}:{transform.__qualname__}", source_version(source)
+
+
+def script_identity(path, function):
+    """(key, version) for a function defined in the script at path."""
+    path = os.path.abspath(path)
+    return f"{Path(path).stem}:{function}", source_version(path)
+
+
+class FixerCache:
+    """The manifest of content hashes and applied transform versions."""
+
+    def __init__(self, path=DEFAULT_MANIFEST):
+        self.path = Path(path)
+        self.files = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get('version') == MANIFEST_VERSION:
+            self.files = data.get('files', {})
+
+    def _key(self, path):
+        path = Path(path).resolve()
+        try:
+            return str(path.relative_to(REPO_ROOT))
+        except ValueError:
+            return str(path)
+
+    def is_current(self, path, transform_key, version):
+        """True if transform_key@version was already applied to path's current content."""
+        entry = self.files.get(self._key(path))
+        if not entry or entry['transforms'].get(transform_key) != version:
+            return False
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+
+        # Fast path: untouched since we recorded it
+        if stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime_ns']:
+            return True
+
+        with open(path, 'rb') as f:
+            if content_hash(f.read()) != entry['hash']:
+                return False
+
+        # Same content with a new mtime (e.g. a checkout); refresh the stat info
+        entry['size'] = stat.st_size
+        entry['mtime_ns'] = stat.st_mtime_ns
+        self.dirty = True
+        return True
+
+    def record(self, path, digest, transform_key, version):
+        """
+        Record that transform_key@version produced the content with hash
+        digest, or with unknown hash if digest is None.
+        """
+        key = self._key(path)
+        stat = os.stat(path)
+        entry = self.files.get(key)
+
+        # digest is None for header-only rewrites, which don't hash the
+        # body: the entry stays valid only if the file was left untouched
+        if digest is None and entry:
+            unchanged = stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime_ns']
+            digest = entry['hash'] if unchanged else None
+
+        # A transform that changed the content invalidates what came before it
+        if not entry or entry['hash'] != digest or digest is None:
+            entry = {'hash': digest, 'transforms': {}}
+            self.files[key] = entry
+
+        entry['size'] = stat.st_size
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['transforms'][transform_key] = version
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': MANIFEST_VERSION, 'files': self.files}
+        atomic_write(self.path, json.dumps(data, indent=1, sort_keys=True) + '\n')
+        self.dirty = False
@@ -0,0 +1,97 @@
+"""
+Changed-files mode: run the fixers over only the pages a change touches.
+
+Set $MDX_FIX_CHANGED (or pass --changed to any fixer) and the runner drops
+every task whose file isn't in the change before anything is read:
+
+    MDX_FIX_CHANGED=origin/main   MDX files that differ from the merge base
+                                  of origin/main and HEAD, including
+                                  uncommitted and untracked ones
+    MDX_FIX_CHANGED=-             the MDX files listed on stdin, one per line
+
+(--changed means origin/main; --changed-since REF picks another base, or
+- for stdin.) Scripts still decide which files they would fix; the change
+only narrows that down, so a PR that touches three pages costs three
+transforms rather than a pass over the whole corpus. Deleted files are
+never listed.
+"""
+
+import functools
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from .cache import REPO_ROOT
+
+CHANGED_ENV = 'MDX_FIX_CHANGED'
+DEFAULT_BASE = 'origin/main'
+STDIN = '-'
+MDX_SUFFIXES = ('.mdx', '.md')
+
+
+class ChangesetError(RuntimeError):
+    """The files of the change couldn't be worked out (an unknown ref, no git)."""
+
+
+def enabled():
+    return bool(os.environ.get(CHANGED_ENV))
+
+
+def source():
+    """The base ref to diff against, or '-' for a list on stdin."""
+    value = os.environ.get(CHANGED_ENV, '')
+    return DEFAULT_BASE if value in ('', '1') else value
+
+
+def _git(root, *args):
+    try:
+        return subprocess.run(
+            ['git', '-C', str(root), *args],
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise ChangesetError(f"git {' '.join(args)} failed: {e.stderr.strip()}") from None
+    except OSError as e:
+        raise ChangesetError(f"Couldn't run git: {e}") from None
+
+
+def git_changed_files(base=DEFAULT_BASE, root=REPO_ROOT):
+    """MDX files under root that differ from the merge base of base and HEAD, or are new."""
+    try:
+        merge_base = _git(root, 'merge-base', base, 'HEAD').strip()
+    except ChangesetError as e:
+        raise ChangesetError(f"Can't find the changes since {base} (is it fetched?): {e}") from None
+    names = _git(root, 'diff', '--name-only', '-z', '--diff-filter=d', merge_base, '--').split('\0')
+    names += _git(root, 'ls-files', '--others', '--exclude-standard', '-z').split('\0')
+    return {(Path(root) / name).resolve() for name in names if name.endswith(MDX_SUFFIXES)}
+
+
+def read_file_list(stream):
+    """MDX paths listed one per line, relative to the working directory."""
+    paths = set()
+    for line in stream:
+        line = line.strip()
+        if line.endswith(MDX_SUFFIXES):
+            paths.add(Path(line).resolve())
+    return paths
+
+
+@functools.lru_cache(maxsize=None)
+def changed_files():
+    """The files of the change, worked out once per process."""
+    value = source()
+    if value == STDIN:
+        return frozenset(read_file_list(sys.stdin))
+    return frozenset(git_changed_files(value))
+
+
+def describe():
+    value = source()
+    return "listed on stdin" if value == STDIN else f"changed since {value}"
+
+
+def is_changed(path):
+    return Path(path).resolve() in changed_files()
@@ -0,0 +1,154 @@
+"""
+Single-pass character folding: quotes, emoji and non-ASCII clean-up.
+
+fix-unicode-quotes used to run one str.replace per quote character and
+several fixers strip non-ASCII text with their own [^\\x00-\\x7F]+ rule,
+each a full scan of the document. A CharMap does all of it in one:
+
+    quotes  fold curly and prime quotes to " and ' (see QUOTES)
+    emoji   None keeps emoji; a string replaces each one ('' deletes it)
+    strip   delete the remaining non-ASCII characters
+    keep    characters to leave alone whatever the other settings say
+    letters also leave alone Unicode letters and combining marks, so
+            names like "José" or "Zürich" survive stripping
+
+The text is encoded to ASCII with the CharMap as the codec error
+handler, so the ASCII stretches are copied by the codec in C and only the
+runs of other characters reach Python, to go through str.translate. The
+translation table starts empty and fills itself in the first time it
+meets a character, so a CharMap costs nothing up front however wide its
+allow-list. (A CharMap that only folds quotes uses str.replace instead,
+which is quicker for ten characters.)
+
+    from mdx_fixers.charmap import STRIP_NON_ASCII
+
+    content = STRIP_NON_ASCII(content)
+"""
+
+import codecs
+import unicodedata
+
+QUOTES = {
+    '\u201c': '"',  # Left double quotation mark
+    '\u201d': '"',  # Right double quotation mark
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u2033': '"',  # Double prime
+    '\u2034': '"',  # Triple prime
+    '\u301d': '"',  # Reversed double prime quotation mark
+    '\u301e': '"',  # Double prime quotation mark
+    '\u201f': '"',  # Double high-reversed-9 quotation mark
+    '\u201e': '"',  # Double low-9 quotation mark
+}
+
+# Code points drawn as emoji, as (first, last) ranges
+EMOJI_RANGES = (
+    (0x2300, 0x23FF),    # Miscellaneous technical (⌛ ⏱ ...)
+    (0x2600, 0x27BF),    # Miscellaneous symbols and dingbats (✅ ❌ ⚡ ...)
+    (0x2B00, 0x2BFF),    # Miscellaneous symbols and arrows (⭐ ...)
+    (0x1F000, 0x1FAFF),  # Pictographs, emoticons, transport, flags, ...
+)
+
+# Parts of an emoji sequence that aren't drawn on their own: zero-width
+# joiner, variation selectors, keycap, skin tones and tag characters
+EMOJI_JOINERS = (
+    (0x200D, 0x200D),
+    (0x20E3, 0x20E3),
+    (0xFE0E, 0xFE0F),
+    (0x1F3FB, 0x1F3FF),
+    (0xE0020, 0xE007F),
+)
+
+
+def _in_ranges(code, ranges):
+    return any(first <= code <= last for first, last in ranges)
+
+
+class _Table(dict):
+    """A str.translate table that works out each character's entry on first use."""
+
+    def __init__(self, charmap):
+        super().__init__()
+        self.charmap = charmap
+
+    def __missing__(self, code):
+        self[code] = entry = self.charmap.entry(code)
+        return entry
+
+
+class CharMap:
+    """Fold quotes, replace emoji and strip non-ASCII characters in one pass."""
+
+    def __init__(self, quotes=True, emoji='', strip=True, keep='', letters=False):
+        self.quotes = quotes
+        self.emoji = emoji
+        self.strip = strip
+        self.keep = frozenset(keep)
+        self.letters = letters
+        # Folding quotes and nothing else touches ten known characters;
+        # str.replace finds each of them faster than the codec can hand
+        # over every non-ASCII run
+        self.replacements = None
+        if not strip and emoji is None:
+            self.replacements = [(old, new) for old, new in QUOTES.items() if quotes and old not in self.keep]
+        self._register()
+
+    def _register(self):
+        self.table = _Table(self)
+        self.errors = f"mdx-charmap-{id(self)}"
+        codecs.register_error(self.errors, self._translate)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['table'], state['errors']
+        return state
+
+    def __setstate__(self, state):
+        # Error handlers are per process; a worker registers its own
+        self.__dict__.update(state)
+        self._register()
+
+    def entry(self, code):
+        """The translation of one code point: a string, None to delete it, or itself."""
+        char = chr(code)
+        if char in self.keep:
+            return code
+        if self.quotes and char in QUOTES:
+            return QUOTES[char]
+        if self.letters and unicodedata.category(char)[0] in 'LM':
+            return code
+        if self.emoji is not None:
+            if _in_ranges(code, EMOJI_JOINERS):
+                return None
+            if _in_ranges(code, EMOJI_RANGES):
+                return self.emoji or None
+        elif _in_ranges(code, EMOJI_RANGES) or _in_ranges(code, EMOJI_JOINERS):
+            return code
+        return None if self.strip else code
+
+    def _translate(self, error):
+        # Handlers may answer with bytes, so kept characters go back as UTF-8
+        run = error.object[error.start:error.end].translate(self.table)
+        return run.encode('utf-8'), error.end
+
+    def __call__(self, content):
+        if content.isascii():
+            return content
+        if self.replacements is not None:
+            for old, new in self.replacements:
+                content = content.replace(old, new)
+            return content
+        return content.encode('ascii', self.errors).decode('utf-8')
+
+    def __repr__(self):
+        settings = [f"{name}={getattr(self, name)!r}" for name in ('quotes', 'emoji', 'strip', 'letters')]
+        if self.keep:
+            settings.append(f"keep={''.join(sorted(self.keep))!r}")
+        return f"CharMap({', '.join(settings)})"
+
+
+# The [^\x00-\x7F]+ clean-up of the older fixers: every non-ASCII character goes
+STRIP_NON_ASCII = CharMap(quotes=False)
+
+# Quotes folded to ASCII, everything else left as it is
+FOLD_QUOTES = CharMap(emoji=None, strip=False)
@@ -0,0 +1,232 @@
+"""
+Command-line options shared by the corpus-wide fixer scripts.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from pathlib import Path
+
+from . import changeset, dryrun
+from .cache import FixerCache
+from .changeset import CHANGED_ENV
+from .dryrun import DRY_RUN_ENV
+from .guard import FILE_BUDGET_ENV, RULE_BUDGET_ENV
+from .profiling import PROFILE_ENV
+from .runner import (
+    ASYNC_IO_ENV, JOBS_ENV, QUEUE_DEPTH, default_jobs, print_result, print_warnings, run_corpus,
+    summarize,
+)
+
+
+class EnvAction(argparse.Action):
+    """
+    Store an option in an environment variable, so worker processes see it too.
+
+    A flag (nargs=0) turns the setting on with its default value, '1',
+    unless a valued option has already chosen one. Values are never
+    optional: an option that may or may not take one would swallow the
+    PATH argument after it.
+    """
+
+    def __init__(self, option_strings, dest, env, **kwargs):
+        self.env = env
+        super().__init__(option_strings, dest, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if self.nargs == 0:
+            value = os.environ.get(self.env) or '1'
+        else:
+            value = str(values)
+        os.environ[self.env] = value
+        setattr(namespace, self.dest, value)
+
+
+class FixerParser(argparse.ArgumentParser):
+    """An ArgumentParser that checks the fixer options it parsed before any file is touched."""
+
+    def parse_known_args(self, args=None, namespace=None):
+        namespace, extras = super().parse_known_args(args, namespace)
+        check_dry_run()
+        check_changeset()
+        return namespace, extras
+
+
+def check_dry_run():
+    """In a dry run, make sure the report can't overwrite a page; exit with a message if it could."""
+    if not dryrun.enabled():
+        return
+    try:
+        dryrun.check_report_path(dryrun.report_path())
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+def check_changeset():
+    """In changed-files mode, work out the change now; exit with a message if it can't be."""
+    if not changeset.enabled():
+        return
+    try:
+        changeset.changed_files()
+    except changeset.ChangesetError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+def build_parser(description=None):
+    """Return an ArgumentParser with the options every fixer understands."""
+    parser = FixerParser(description=description)
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help=f"number of worker processes (default: ${JOBS_ENV} or the CPU count)"
+    )
+    parser.add_argument(
+        '--async-io',
+        nargs=0,
+        action=EnvAction,
+        env=ASYNC_IO_ENV,
+        help=f"overlap file reads and writes with the transforms (same as setting ${ASYNC_IO_ENV}=1)"
+    )
+    parser.add_argument(
+        '--queue-depth',
+        type=int,
+        action=EnvAction,
+        env=ASYNC_IO_ENV,
+        metavar='DEPTH',
+        help=f"with --async-io, queue up to DEPTH files between stages (default: {QUEUE_DEPTH}); "
+             f"implies --async-io (same as setting ${ASYNC_IO_ENV}=DEPTH)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="process every file even if the incremental cache says it is up to date"
+    )
+    parser.add_argument(
+        '--changed',
+        nargs=0,
+        action=EnvAction,
+        env=CHANGED_ENV,
+        help=f"only fix the MDX files changed since origin/main (same as setting ${CHANGED_ENV}=1)"
+    )
+    parser.add_argument(
+        '--changed-since',
+        action=EnvAction,
+        env=CHANGED_ENV,
+        metavar='REF',
+        help=f"only fix the MDX files changed since REF, or those listed on stdin if REF is -; "
+             f"implies --changed (same as setting ${CHANGED_ENV}=REF)"
+    )
+    parser.add_argument(
+        '--profile',
+        nargs=0,
+        action=EnvAction,
+        env=PROFILE_ENV,
+        help=f"record per-rule timings and write a hot-rule report and flamegraph stacks "
+             f"to .cache/profile (same as setting ${PROFILE_ENV}=1)"
+    )
+    parser.add_argument(
+        '--profile-dir',
+        action=EnvAction,
+        env=PROFILE_ENV,
+        metavar='DIR',
+        help=f"write the --profile report to DIR instead; implies --profile "
+             f"(same as setting ${PROFILE_ENV}=DIR)"
+    )
+    parser.add_argument(
+        '--dry-run',
+        nargs=0,
+        action=EnvAction,
+        env=DRY_RUN_ENV,
+        help=f"write nothing; report the diff and the rules behind each change as JSON lines "
+             f"(same as setting ${DRY_RUN_ENV}=1)"
+    )
+    parser.add_argument(
+        '--dry-run-report',
+        action=EnvAction,
+        env=DRY_RUN_ENV,
+        metavar='PATH',
+        help=f"write the --dry-run report to PATH instead of .cache/dry-run.jsonl; implies "
+             f"--dry-run (same as setting ${DRY_RUN_ENV}=PATH)"
+    )
+    parser.add_argument(
+        '--file-budget',
+        type=float,
+        action=EnvAction,
+        env=FILE_BUDGET_ENV,
+        metavar='SECONDS',
+        help=f"quarantine files whose transform takes longer than this (or ${FILE_BUDGET_ENV})"
+    )
+    parser.add_argument(
+        '--rule-budget',
+        type=float,
+        action=EnvAction,
+        env=RULE_BUDGET_ENV,
+        metavar='SECONDS',
+        help=f"quarantine files on which a single regex rule takes longer than this (or ${RULE_BUDGET_ENV})"
+    )
+    return parser
+
+
+def open_cache(args):
+    """Return the FixerCache for a run, or None if --no-cache was given."""
+    return None if args.no_cache else FixerCache()
+
+
+def add_path_arguments(parser):
+    """Add the PATH arguments of the fixers that work on the files they are given."""
+    parser.add_argument(
+        'paths',
+        nargs='+',
+        metavar='PATH',
+        help="MDX files, directories (searched recursively) or glob patterns"
+    )
+    return parser
+
+
+def expand_paths(specs, pattern='*.mdx'):
+    """The files named by PATH arguments, in the order given and without duplicates."""
+    paths = {}
+    for spec in specs:
+        if os.path.isdir(spec):
+            matches = sorted(Path(spec).rglob(pattern))
+        elif any(char in spec for char in '*?['):
+            matches = sorted(Path(match) for match in glob.glob(spec, recursive=True) if os.path.isfile(match))
+        else:
+            # Missing files are kept, so the run reports them
+            matches = [Path(spec)]
+        for path in matches:
+            paths.setdefault(path.resolve(), path)
+    return list(paths.values())
+
+
+def fix_files(args, transform, fixed, unchanged):
+    """
+    Apply transform to the files named by args.paths in one run over the
+    worker pool, printing fixed or unchanged (formatted with the path) for
+    each. Exits with status 1 if nothing matched, any file failed or, in a
+    dry run, any file would change, so a dry run can serve as a CI check.
+    """
+    paths = expand_paths(args.paths)
+    if not paths:
+        print(f"❌ No MDX files found in {' '.join(args.paths)}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = run_corpus(paths, transform, jobs=args.jobs, verbose=False, cache=open_cache(args))
+    for result in results:
+        if result.error or result.report is not None:
+            print_result(result)
+            continue
+        print((fixed if result.changed else unchanged).format(result.path))
+        print_warnings(result)
+
+    if len(results) > 1:
+        summarize(results, time.perf_counter() - start, args.jobs or default_jobs())
+    if any(r.error for r in results) or (dryrun.enabled() and any(r.changed for r in results)):
+        sys.exit(1)
+    return results
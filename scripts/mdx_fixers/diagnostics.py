@@ -0,0 +1,41 @@
+"""
+Warnings from transforms, reported with the file they are about.
+
+A transform that finds a problem it can't fix (an unclosed tag, say)
+calls warn() instead of printing. While the runner processes a file it
+collects the warnings raised for it and returns them on the file's
+FileResult, so they are printed with the file's status line by the main
+process even when the transform ran in a worker, and the fixer server can
+send them back with its response. A transform called on its own, outside
+a run, writes its warnings to stderr.
+
+    from mdx_fixers.diagnostics import warn
+
+    for issue in find_unbalanced(content):
+        warn(issue)
+"""
+
+import contextlib
+import sys
+
+# Warnings of the file being processed, or None outside a run
+_collected = None
+
+
+def warn(message):
+    """Report a problem with the file being processed."""
+    if _collected is None:
+        print(f"Warning: {message}", file=sys.stderr)
+    else:
+        _collected.append(str(message))
+
+
+@contextlib.contextmanager
+def collecting():
+    """Collect the warnings raised inside the block into the list it yields."""
+    global _collected
+    outer, _collected = _collected, []
+    try:
+        yield _collected
+    finally:
+        _collected = outer
@@ -0,0 +1,131 @@
+"""
+Dry runs: what the fixers would change, without writing anything.
+
+Set $MDX_FIX_DRY_RUN (or pass --dry-run to any fixer) and the runner
+transforms every file as usual but leaves it on disk untouched. Workers
+compute a unified diff of each file that would change and, from the
+per-rule instrumentation in profiling.py, the rules that changed it. The
+main process writes one JSON object per line to the report
+(.cache/dry-run.jsonl unless the variable, or --dry-run-report, names
+another file; never a directory or an .mdx/.md page):
+
+    {"path": ..., "changed": true, "error": null,
+     "rules": [{"rule": "fix-mdx-final:38", "function": ..., "pattern": ...,
+                "matches": 3, "changed": 42}, ...],
+     "diff": "--- a/content/blog/x.mdx\n+++ b/content/blog/x.mdx\n..."}
+
+A listed file whose transform raised warnings (see diagnostics.py) has
+them under "warnings".
+
+Rules are the scripts' own regexes; a normalised fixer's final stage (see
+normalize.py) is listed as "<function>:normalize". Changes made by other
+package helpers show up in the diff only.
+
+Only files that would change or that failed are listed, so an empty
+report means the tree is clean; a CI check can run the fixers over all of
+content/ in parallel and fail on a non-empty report.
+"""
+
+import difflib
+import json
+import os
+from pathlib import Path
+
+from .cache import REPO_ROOT
+from .writer import atomic_write
+
+DRY_RUN_ENV = 'MDX_FIX_DRY_RUN'
+DEFAULT_REPORT = REPO_ROOT / '.cache' / 'dry-run.jsonl'
+
+# Never written over by a report: these are the pages being checked
+PAGE_SUFFIXES = ('.mdx', '.md')
+
+# Follows a diff line whose file doesn't end with a newline, as in git diff
+NO_NEWLINE = '\n\\ No newline at end of file\n'
+
+
+def enabled():
+    return bool(os.environ.get(DRY_RUN_ENV))
+
+
+def report_path():
+    value = os.environ.get(DRY_RUN_ENV, '')
+    return DEFAULT_REPORT if value in ('', '1') else Path(value)
+
+
+def check_report_path(path):
+    """Raise ValueError if path is a directory or a page, which a report must not replace."""
+    path = Path(path)
+    if path.is_dir():
+        raise ValueError(f"The dry-run report path {path} is a directory")
+    if path.suffix.lower() in PAGE_SUFFIXES:
+        raise ValueError(f"Refusing to write the dry-run report over the page {path}")
+
+
+def _display_path(path):
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def unified_diff(path, before, after):
+    """A git-style unified diff of one file's text."""
+    # Paths outside the repo keep their place in the tree, minus the root
+    name = _display_path(path).lstrip('/')
+    lines = difflib.unified_diff(
+        before.splitlines(keepends=True),
+        after.splitlines(keepends=True),
+        f"a/{name}",
+        f"b/{name}",
+    )
+    # A last line without a newline gets the marker git and patch expect
+    return ''.join(line if line.endswith('\n') else line + NO_NEWLINE for line in lines)
+
+
+def changed_rules(profile):
+    """The rules of a profiler snapshot that changed the text, in the order they first ran."""
+    rules = []
+    for rule, (calls, seconds, matches, changed) in profile['rules'].items():
+        if changed:
+            function, pattern = profile['meta'][rule]
+            rules.append({
+                'rule': rule,
+                'function': function,
+                'pattern': pattern,
+                'matches': matches,
+                'changed': changed,
+            })
+    return rules
+
+
+def normalizer_stage(transform, before, after):
+    """A rules entry for the whitespace changes of a normalised fixer's final stage."""
+    return {
+        'rule': f"{transform.__qualname__}:normalize",
+        'function': transform.__qualname__,
+        'pattern': repr(transform.normalizer),
+        'matches': None,
+        'changed': len(before) - len(after),
+    }
+
+
+def write_report(results, path=None):
+    """Write the JSONL report for a dry run; returns the number of files listed."""
+    path = Path(path or report_path())
+    check_report_path(path)
+    lines = []
+    for result in results:
+        if not (result.changed or result.error):
+            continue
+        entry = {'path': _display_path(result.path), 'changed': bool(result.changed), 'error': result.error}
+        entry.update(result.report or {})
+        if result.warnings:
+            entry['warnings'] = result.warnings
+        lines.append(json.dumps(entry) + '\n')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, ''.join(lines))
+    print(f"📝 Dry run: {len(lines)} files would change or failed; report written to {path}")
+    return len(lines)
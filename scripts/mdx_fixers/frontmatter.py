@@ -0,0 +1,495 @@
+"""
+Frontmatter parsing and editing for the fixer scripts.
+
+split() separates the YAML header of an MDX file from its body. A
+Frontmatter edits the header line by line: set(), rename() and
+comment_out() touch only the lines of the fields they change, so quoting,
+comments and field order are kept and the body is never re-serialised:
+
+    fm, body = split(content)
+    if fm is not None:
+        fm.set('date', '2025-01-01', after='title')
+        content = join(fm, body)
+
+Parsed YAML is cached by the header text, so a header is parsed once no
+matter how many fixers look at it. read_frontmatter() reads only the
+header lines of a file, for scripts that list metadata across the corpus.
+
+Scripts that only change frontmatter wrap their edit in a HeaderTransform.
+The runner then rewrites just the header of each file (see
+rewrite_header), so a date or category update costs the same on a 5 MB
+article with inline images as on a short post.
+"""
+
+import datetime
+import functools
+import json
+import os
+import re
+import shutil
+
+try:
+    import yaml
+except ImportError:  # fall back to the simple parser below
+    yaml = None
+
+from .cache import transform_identity
+from .tokenizer import FRONTMATTER_RE
+from .writer import atomic_open
+
+FENCE_BYTES_RE = re.compile(rb'---[ \t]*\r?\n?$')
+
+# Body copy size when a header edit changes the header's length
+COPY_BLOCK_SIZE = 1024 * 1024
+FIELD_RE = re.compile(r'([A-Za-z_][\w-]*)[ \t]*:(?:[ \t]|$)')
+LEADING_BLANK_RE = re.compile(r'(?:[ \t]*\r?\n)*')
+
+# Strings that are safe to write unquoted, and the words YAML would not read as strings
+PLAIN_RE = re.compile(r'[A-Za-z][\w .&/()+-]*(?<! )')
+YAML_KEYWORDS = {'true', 'false', 'yes', 'no', 'on', 'off', 'y', 'n', 'null'}
+
+# Plain scalars as yaml.safe_load resolves them (YAML 1.1), for the fallback parser
+BOOL_VALUES = {
+    'yes': True, 'Yes': True, 'YES': True, 'true': True, 'True': True, 'TRUE': True,
+    'on': True, 'On': True, 'ON': True,
+    'no': False, 'No': False, 'NO': False, 'false': False, 'False': False, 'FALSE': False,
+    'off': False, 'Off': False, 'OFF': False,
+}
+NULL_VALUES = {'', '~', 'null', 'Null', 'NULL'}
+INT_RE = re.compile(r'[-+]?(?:0|[1-9][0-9_]*)')
+BASED_INT_RE = re.compile(r'([-+]?)0(b[01_]+|x[0-9a-fA-F_]+|[0-7_]+)')
+FLOAT_RE = re.compile(r'[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+][0-9]+)?|\.[0-9_]+(?:[eE][-+][0-9]+)?')
+DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+TIMESTAMP_RE = re.compile(
+    r'[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}(?:[Tt]|[ \t]+)[0-9]{1,2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]*)?'
+    r'(?:[ \t]*(?:Z|[-+][0-9]{1,2}(?::[0-9]{2})?))?'
+)
+COMMENT_RE = re.compile(r'[ \t]+#.*$')
+BLOCK_ITEM_RE = re.compile(r'[ \t]*- (.*)$|[ \t]*-$')
+BLOCK_SCALAR_RE = re.compile(r'([|>])([-+]?)[1-9]?[ \t]*(?:#.*)?$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse(yaml_text):
+    if yaml is not None:
+        try:
+            data = yaml.safe_load(yaml_text)
+        except yaml.YAMLError:
+            data = None
+        return data if isinstance(data, dict) else {}
+
+    return _parse_simple(yaml_text)
+
+
+def _parse_simple(yaml_text):
+    """
+    Parse a header without PyYAML: keys whose values are scalars, [flow]
+    or block sequences, | and > block scalars or indented mappings,
+    resolved to the same types yaml.safe_load gives them.
+    """
+    return _mapping(yaml_text.splitlines())
+
+
+def _mapping(lines):
+    data = {}
+    i = 0
+    while i < len(lines):
+        m = FIELD_RE.match(lines[i])
+        i += 1
+        if not m:
+            continue
+        key, value = m.group(1), lines[i - 1][m.end():]
+        # Indented lines after the key belong to its value
+        start = i
+        while i < len(lines) and (not lines[i].strip() or lines[i][:1] in ' \t-'):
+            i += 1
+        following = lines[start:i]
+
+        block = BLOCK_SCALAR_RE.match(value.strip())
+        items = [BLOCK_ITEM_RE.match(line) for line in following if line.strip()]
+        if block:
+            data[key] = _block_scalar(following, *block.groups())
+        elif not value.strip() and following and not all(items):
+            data[key] = _mapping(_dedent(following))
+        elif not value.strip() and items and all(items):
+            data[key] = [_scalar(item.group(1) or '') for item in items]
+        elif following and value.strip()[:1] not in ('"', "'", '['):
+            # A plain scalar that goes on over several lines is folded
+            data[key] = _plain(' '.join(line.strip() for line in [value, *following] if line.strip()))
+        else:
+            data[key] = _scalar(value)
+    return data
+
+
+def _block_scalar(lines, style, chomping):
+    """The text of a | (literal) or > (folded) block scalar."""
+    trailing = len(lines)
+    while lines and not lines[-1].strip():
+        lines = lines[:-1]
+    trailing -= len(lines)
+    lines = _dedent(lines)
+    if style == '|':
+        text = '\n'.join(lines)
+    else:
+        text = ''
+        for j, line in enumerate(lines):
+            if j == 0:
+                text = line
+            elif not line:
+                text += '\n'
+            elif not lines[j - 1] or line[:1] in ' \t' or lines[j - 1][:1] in ' \t':
+                text += ('' if not lines[j - 1] else '\n') + line
+            else:
+                text += ' ' + line
+    if not text or chomping == '-':
+        return text
+    if chomping == '+':
+        return text + '\n' * (trailing + 1)
+    return text + '\n'
+
+
+def _dedent(lines):
+    indent = min((len(line) - len(line.lstrip()) for line in lines if line.strip()), default=0)
+    return [line[indent:] for line in lines]
+
+
+def _scalar(text):
+    """One value the way yaml.safe_load reads it: quoted, a [flow, list] or a plain scalar."""
+    text = text.strip()
+    if text[:1] in ('"', "'"):
+        quote = text[0]
+        end = text.rfind(quote)
+        if end > 0:
+            body = text[1:end]
+            if quote == "'":
+                return body.replace("''", "'")
+            try:
+                return json.loads(text[:end + 1])
+            except ValueError:
+                return body
+    if text.startswith('['):
+        text = COMMENT_RE.sub('', text)
+        if text.endswith(']'):
+            return [_scalar(item) for item in _split_flow(text[1:-1])]
+    return _plain(COMMENT_RE.sub('', text).strip())
+
+
+def _split_flow(text):
+    """The items of a [flow, sequence], split on commas outside quotes."""
+    items = []
+    current = ''
+    quote = None
+    for char in text:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in ('"', "'"):
+            quote = char
+        elif char == ',':
+            items.append(current)
+            current = ''
+            continue
+        current += char
+    if current.strip() or items:
+        items.append(current)
+    return [item for item in items if item.strip()]
+
+
+def _plain(text):
+    if text in NULL_VALUES:
+        return None
+    if text in BOOL_VALUES:
+        return BOOL_VALUES[text]
+    if INT_RE.fullmatch(text):
+        return int(text.replace('_', ''))
+    based = BASED_INT_RE.fullmatch(text)
+    if based:
+        sign, digits = based.groups()
+        base = {'b': 2, 'x': 16}.get(digits[0], 8)
+        value = int(digits.lstrip('bx').replace('_', '') or '0', base)
+        return -value if sign == '-' else value
+    if FLOAT_RE.fullmatch(text):
+        return float(text.replace('_', ''))
+    if text in ('.inf', '.Inf', '.INF', '+.inf', '+.Inf', '+.INF'):
+        return float('inf')
+    if text in ('-.inf', '-.Inf', '-.INF'):
+        return float('-inf')
+    if text in ('.nan', '.NaN', '.NAN'):
+        return float('nan')
+    if DATE_RE.fullmatch(text):
+        try:
+            return datetime.date.fromisoformat(text)
+        except ValueError:
+            return text
+    if TIMESTAMP_RE.fullmatch(text):
+        try:
+            return _timestamp(text)
+        except ValueError:
+            return text
+    return text
+
+
+def _timestamp(text):
+    date, _, rest = re.split(r'([Tt]|[ \t]+)', text, maxsplit=1)
+    rest = rest.strip()
+    tz = re.search(r'[ \t]*(Z|[-+][0-9]{1,2}(?::[0-9]{2})?)$', rest)
+    time = rest[:tz.start()] if tz else rest
+    year, month, day = (int(part) for part in date.split('-'))
+    hour, minute, second = time.split(':')
+    second, _, fraction = second.partition('.')
+    value = datetime.datetime(
+        year, month, day, int(hour), int(minute), int(second), int(fraction[:6].ljust(6, '0') or 0)
+    )
+    if not tz:
+        return value
+    offset = tz.group(1)
+    if offset == 'Z':
+        return value.replace(tzinfo=datetime.timezone.utc)
+    sign = -1 if offset[0] == '-' else 1
+    hours, _, minutes = offset[1:].partition(':')
+    delta = datetime.timedelta(hours=int(hours), minutes=int(minutes or 0))
+    return value.replace(tzinfo=datetime.timezone(sign * delta))
+
+
+def parse(yaml_text):
+    """Parse a YAML header into a dict. The result is cached and shared: don't mutate it."""
+    return _parse(yaml_text)
+
+
+def format_value(value, quote='"'):
+    """
+    Format a scalar as it would be written in the header. quote is '"',
+    "'" or '' for a plain scalar, which falls back to double quotes for
+    strings YAML would read as something else.
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if value is None:
+        return 'null'
+    if isinstance(value, (int, float)):
+        return str(value)
+    value = str(value)
+    if quote == '' and PLAIN_RE.fullmatch(value) and value.lower() not in YAML_KEYWORDS:
+        return value
+    if quote == "'":
+        return "'" + value.replace("'", "''") + "'"
+    return json.dumps(value, ensure_ascii=False)
+
+
+def quote_style(value_text):
+    """The quote style of a value as written: '"', "'" or '' for plain."""
+    value_text = value_text.lstrip()
+    if value_text.startswith('- '):
+        value_text = value_text[2:].lstrip()
+    return value_text[:1] if value_text[:1] in ('"', "'") else ''
+
+
+class Frontmatter:
+    """The YAML header of an MDX file, including its --- fences."""
+
+    def __init__(self, text):
+        # Blank lines before the opening fence are kept as they are
+        self.leading = LEADING_BLANK_RE.match(text).group(0)
+        self.lines = text[len(self.leading):].splitlines(keepends=True)
+        self.newline = '\r\n' if text.endswith('\r\n') else '\n'
+
+    @property
+    def text(self):
+        return self.leading + ''.join(self.lines)
+
+    @property
+    def yaml_text(self):
+        return ''.join(self.lines[1:-1])
+
+    @property
+    def data(self):
+        return parse(self.yaml_text)
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def _find(self, key):
+        """Return the (start, end) line indexes of a top-level field, or None."""
+        for i in range(1, len(self.lines) - 1):
+            m = FIELD_RE.match(self.lines[i])
+            if m and m.group(1) == key:
+                end = i + 1
+                # Block values: indented lines and "- item" lists
+                while end < len(self.lines) - 1 and self.lines[end][:1] in (' ', '\t', '-'):
+                    end += 1
+                return i, end
+        return None
+
+    def _format_field(self, key, value, quote=None):
+        if isinstance(value, (list, tuple)):
+            quote = '' if quote is None else quote
+            items = ''.join(f'  - {format_value(item, quote)}{self.newline}' for item in value)
+            return f'{key}:{self.newline}{items}'
+        value = format_value(value, '"' if quote is None else quote)
+        return f'{key}: {value}{self.newline}'
+
+    def set(self, key, value, after=None, before=None):
+        """
+        Set a top-level field. An existing field is replaced in place and
+        keeps its quote style; a new one goes after or before the named
+        field if present, else at the end of the header.
+        """
+        span = self._find(key)
+        if span:
+            start, end = span
+            current = self.lines[start][FIELD_RE.match(self.lines[start]).end():]
+            if not current.strip() and end > start + 1:
+                current = self.lines[start + 1]
+            self.lines[start:end] = [self._format_field(key, value, quote_style(current))]
+            return
+
+        line = self._format_field(key, value)
+        anchor = self._find(after or before) if (after or before) else None
+        if anchor and after:
+            index = anchor[1]
+        elif anchor:
+            index = anchor[0]
+        else:
+            index = len(self.lines) - 1
+        self.lines.insert(index, line)
+
+    def rename(self, old, new):
+        """Rename a top-level field, keeping its value as written."""
+        span = self._find(old)
+        if span and self._find(new) is None:
+            start = span[0]
+            self.lines[start] = new + self.lines[start][len(old):]
+
+    def comment_out(self, key):
+        """Turn a top-level field and its block value into YAML comments."""
+        span = self._find(key)
+        if span:
+            start, end = span
+            self.lines[start:end] = ['# ' + line for line in self.lines[start:end]]
+
+
+def split(content):
+    """Return (Frontmatter, body), or (None, content) if there is no header."""
+    m = FRONTMATTER_RE.match(content)
+    if not m:
+        return None, content
+    return Frontmatter(m.group(0)), content[m.end():]
+
+
+def join(frontmatter, body):
+    """Put a header and body back together."""
+    if frontmatter is None:
+        return body
+    text = frontmatter.text
+    if body and not text.endswith('\n'):
+        text += frontmatter.newline
+    return text + body
+
+
+def _read_header_bytes(f):
+    """
+    Read the frontmatter block from the start of binary file f, stopping
+    at its closing ---. Returns b'' if there is none; f is left just past
+    whatever was read.
+    """
+    lines = [f.readline()]
+    while lines[-1] and not lines[-1].strip():
+        lines.append(f.readline())
+    if not FENCE_BYTES_RE.match(lines[-1]):
+        return b''
+    for line in f:
+        lines.append(line)
+        if FENCE_BYTES_RE.match(line):
+            return b''.join(lines)
+    return b''
+
+
+def _decode_header(raw, encoding):
+    header = raw.decode(encoding)
+    # Same rules as split(), e.g. for blank lines before the fence
+    m = FRONTMATTER_RE.match(header)
+    return header if m and m.end() == len(header) else ''
+
+
+def read_header(path, encoding='utf-8'):
+    """
+    Return the frontmatter block at the top of path, reading only as far
+    as its closing ---. Returns '' if the file has no frontmatter.
+    """
+    with open(path, 'rb') as f:
+        return _decode_header(_read_header_bytes(f), encoding)
+
+
+def read_frontmatter(path, encoding='utf-8'):
+    """Return the Frontmatter of path, reading only its header, or None."""
+    header = read_header(path, encoding)
+    return Frontmatter(header) if header else None
+
+
+def rewrite_header(path, edit, encoding='utf-8'):
+    """
+    Apply edit(frontmatter) to the header of path without reading the body.
+
+    If the new header is the same number of bytes it is written over the
+    old one in place. Otherwise the file is rebuilt next to the original
+    from the new header and the body copied across block by block, then
+    renamed over it. Returns True if the file changed.
+    """
+    with open(path, 'rb') as f:
+        raw = _read_header_bytes(f)
+        header = _decode_header(raw, encoding) if raw else ''
+        if not header:
+            return False
+
+        frontmatter = Frontmatter(header)
+        edit(frontmatter)
+        if frontmatter.text == header:
+            return False
+        new_raw = frontmatter.text.encode(encoding)
+
+        if len(new_raw) != len(raw):
+            with atomic_open(path, 'wb') as out:
+                out.write(new_raw)
+                shutil.copyfileobj(f, out, COPY_BLOCK_SIZE)
+            return True
+
+    with open(path, 'r+b') as out:
+        out.write(new_raw)
+        out.flush()
+        os.fsync(out.fileno())
+    return True
+
+
+class HeaderTransform:
+    """
+    A transform that only edits frontmatter.
+
+    edit is a picklable function that mutates a Frontmatter in place.
+    Called on text it works like any other transform, so it can be part
+    of a Pipeline; the corpus runner sees header_only and calls
+    rewrite_header instead, so file bodies are never read.
+    """
+
+    header_only = True
+
+    def __init__(self, edit):
+        self.edit = edit
+
+    def __call__(self, content):
+        frontmatter, body = split(content)
+        if frontmatter is None:
+            return content
+        self.edit(frontmatter)
+        return join(frontmatter, body)
+
+    def rewrite(self, path):
+        return rewrite_header(path, self.edit)
+
+    def cache_identity(self):
+        key, version = transform_identity(self.edit)
+        return f"header:{key}", version
+
+    def __repr__(self):
+        return f"HeaderTransform({getattr(self.edit, '__name__', self.edit)!r})"
@@ -0,0 +1,108 @@
+"""
+Time budgets for fixer transforms.
+
+Several fixers use lazy DOTALL patterns, such as
+<ComparisonTable\\s+(.*?)rows="{\\[(.*?)\\]}"(.*?)/>, that backtrack
+super-linearly on malformed input. One bad page can then stall a whole
+batch. With a budget set, the runner interrupts a transform that runs too
+long, quarantines the file with a diagnostic and moves on to the next one:
+
+    MDX_FIX_FILE_BUDGET   seconds one file may spend in the transform
+    MDX_FIX_RULE_BUDGET   seconds a single rule (one re call) may take
+
+(or --file-budget / --rule-budget on any fixer). Budgets use the
+instrumentation in profiling.py to know where each rule starts and ends,
+so a diagnostic names the rule that was running when time ran out.
+Every budgeted run rewrites .cache/quarantine.json with the diagnostics of
+the files it quarantined, and removes it when there were none.
+
+Budgets are enforced with SIGALRM, which CPython delivers between steps of
+a regex match, so even a runaway pattern is stopped on time. They are a
+no-op where SIGALRM is unavailable (Windows) or off the main thread.
+"""
+
+import contextlib
+import os
+import signal
+import threading
+import time
+
+FILE_BUDGET_ENV = 'MDX_FIX_FILE_BUDGET'
+RULE_BUDGET_ENV = 'MDX_FIX_RULE_BUDGET'
+
+# Active budgets: [deadline, (scope, budget, rule, pattern)], innermost last
+_deadlines = []
+_handler_installed = False
+
+
+class BudgetExceeded(BaseException):
+    """
+    Raised when a transform overruns its budget. It derives from
+    BaseException so that a fixer's own `except Exception` can't swallow it.
+    """
+
+    def __init__(self, scope, budget, rule=None, pattern=None):
+        self.scope = scope
+        self.budget = budget
+        self.rule = rule
+        self.pattern = pattern
+        where = f" in {rule}" if rule else ""
+        super().__init__(f"{scope} budget of {budget:g}s exceeded{where}")
+
+
+def _env_budget(name):
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+def file_budget():
+    return _env_budget(FILE_BUDGET_ENV)
+
+
+def rule_budget():
+    return _env_budget(RULE_BUDGET_ENV)
+
+
+def _arm():
+    if _deadlines:
+        remaining = min(deadline for deadline, _ in _deadlines) - time.monotonic()
+        signal.setitimer(signal.ITIMER_REAL, max(remaining, 1e-4))
+    else:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _on_alarm(signum, frame):
+    now = time.monotonic()
+    expired = [entry for entry in _deadlines if entry[0] <= now]
+    if not expired:
+        # Fired for a budget that has since been lifted
+        _arm()
+        return
+    raise BudgetExceeded(*min(expired)[1])
+
+
+def _can_enforce():
+    global _handler_installed
+    if not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        return False
+    if not _handler_installed:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        _handler_installed = True
+    return True
+
+
+@contextlib.contextmanager
+def budget(seconds, scope='file', rule=None, pattern=None):
+    """Raise BudgetExceeded if the with block runs for longer than seconds."""
+    if not seconds or not _can_enforce():
+        yield
+        return
+
+    entry = [time.monotonic() + seconds, (scope, seconds, rule, pattern)]
+    _deadlines.append(entry)
+    _arm()
+    try:
+        yield
+    finally:
+        _deadlines.remove(entry)
+        _arm()
@@ -0,0 +1,33 @@
+"""
+Single-pass icon component translation.
+
+The fixers used to run one re.sub per icon name, rescanning the whole
+document for every entry in the mapping. IconTranslator compiles the whole
+mapping into one alternation so each document is scanned once.
+"""
+
+import re
+
+
+class IconTranslator:
+    """Replace icon components such as <Shield className="..." /> with emoji."""
+
+    def __init__(self, mapping):
+        # Keys are matched case-insensitively, like the old per-icon patterns
+        self.mapping = {name.lower(): emoji for name, emoji in mapping.items()}
+
+        # Longest names first so <CheckCircle> beats <Check> and <XCircle> beats <X>
+        names = sorted(self.mapping, key=lambda name: (-len(name), name))
+        self.pattern = re.compile(
+            r'<(' + '|'.join(re.escape(name) for name in names) + r')[^>]*/?>',
+            re.IGNORECASE
+        )
+
+    def _replace(self, match):
+        return self.mapping[match.group(1).lower()]
+
+    def translate(self, content):
+        """Translate every icon component in content in one linear scan."""
+        return self.pattern.sub(self._replace, content)
+
+    __call__ = translate
@@ -0,0 +1,215 @@
+"""
+Streaming line state machines for the fixer scripts.
+
+Repairs that depend on the lines before them (closing a paragraph opened
+by a self-closing <p />, indenting lazy lines inside a list or blockquote)
+used to be hand-written loops over content.split('\\n') that rebuilt the
+whole file with '\\n'.join. A LineMachine describes such a repair as a
+table instead: for each state, an ordered list of transitions
+
+    Transition(test, action, target)
+
+test(line) picks the first transition that applies (None always does),
+action(line, state) returns the line or lines to emit in its place (None
+emits the line unchanged) and target is the state to move to (None
+stays). A machine with no matching transition passes the line through.
+finish maps a state to action(state), called if the input ends in it.
+
+    QUOTE_MACHINE = LineMachine({
+        TEXT: [Transition(is_quote, target='quote')],
+        'quote': [
+            Transition(is_quote),
+            Transition(is_blank, target=TEXT),
+            Transition(None, quote_lazy_line),
+        ],
+    })
+
+run() is a generator over any iterable of lines, so machines chain
+lazily and rewrite_file() streams a file through them with memory bounded
+by the longest run of held lines, not the size of the file. A fixer
+function decorated with @streamed(machine) gets the same streaming when
+the corpus runner applies it. Lines are
+handled without their newline and split and joined exactly as
+str.split('\\n') and '\\n'.join would, so a machine called on text (the
+form the runner and Pipeline use) gives the same result as one run over
+the file.
+"""
+
+import functools
+import hashlib
+from collections import namedtuple
+
+from .cache import transform_identity
+from .writer import atomic_open
+
+TEXT = 'text'
+
+Transition = namedtuple('Transition', ['test', 'action', 'target'], defaults=[None, None])
+
+
+class LineState:
+    """The state of one run: its name, held lines and any fields the actions keep."""
+
+    def __init__(self, name):
+        self.name = name
+        self.buffer = []
+
+    def flush(self):
+        """Return the held lines and clear them."""
+        lines, self.buffer = self.buffer, []
+        return lines
+
+
+def hold(line, state):
+    """Action that keeps a line back until a later action flushes it."""
+    state.buffer.append(line)
+    return ()
+
+
+def is_blank(line):
+    return not line.strip()
+
+
+def indent(line):
+    return len(line) - len(line.lstrip())
+
+
+class LineMachine:
+    """A line-by-line repair described by a table of transitions per state."""
+
+    def __init__(self, states, start=TEXT, finish=None):
+        self.states = states
+        self.start = start
+        self.finish = finish or {}
+
+    def run(self, lines):
+        """Yield the repaired lines for an iterable of lines without newlines."""
+        state = LineState(self.start)
+        for line in lines:
+            for test, action, target in self.states.get(state.name, ()):
+                if test is None or test(line):
+                    output = line if action is None else action(line, state)
+                    if isinstance(output, str):
+                        yield output
+                    else:
+                        yield from output
+                    if target is not None:
+                        state.name = target
+                    break
+            else:
+                yield line
+
+        end = self.finish.get(state.name)
+        if end is not None:
+            yield from end(state)
+        # Lines still held at the end are not lost
+        yield from state.flush()
+
+    def __call__(self, content):
+        return transform_text(content, self)
+
+
+def split_lines(stream):
+    """The lines of a text stream without newlines, as str.split('\\n') gives them."""
+    line = ''
+    for line in stream:
+        yield line[:-1] if line.endswith('\n') else line
+    if not line or line.endswith('\n'):
+        yield ''
+
+
+def join_lines(lines):
+    """Yield lines with newlines between them, as '\\n'.join would."""
+    lines = iter(lines)
+    for line in lines:
+        yield line
+        break
+    for line in lines:
+        yield '\n'
+        yield line
+
+
+def run_machines(lines, machines):
+    for machine in machines:
+        lines = machine.run(lines)
+    return lines
+
+
+def transform_text(content, *machines):
+    """Run content through machines in turn and return the repaired text."""
+    return '\n'.join(run_machines(content.split('\n'), machines))
+
+
+class _Unchanged(Exception):
+    pass
+
+
+def _hashed(stream, digest):
+    for chunk in stream:
+        digest.update(chunk.encode('utf-8', 'surrogatepass'))
+        yield chunk
+
+
+def stream_file(path, *machines, encoding='utf-8'):
+    """
+    Stream path through machines into a temp file, renamed over path only
+    if the text changed. Returns (changed, SHA-256 of the output text).
+    """
+    before, after = hashlib.sha256(), hashlib.sha256()
+    try:
+        with open(path, 'r', encoding=encoding) as source, atomic_open(path, 'w', encoding) as out:
+            for chunk in join_lines(run_machines(split_lines(_hashed(source, before)), machines)):
+                after.update(chunk.encode('utf-8', 'surrogatepass'))
+                out.write(chunk)
+            if after.digest() == before.digest():
+                # atomic_open removes the temp file and leaves path alone
+                raise _Unchanged
+    except _Unchanged:
+        return False, after.hexdigest()
+    return True, after.hexdigest()
+
+
+def rewrite_file(path, *machines, encoding='utf-8'):
+    """Stream path through machines; returns True if the file was written."""
+    return stream_file(path, *machines, encoding=encoding)[0]
+
+
+class Streamed:
+    """A fixer function whose work is done by line machines; see streamed()."""
+
+    streaming = True
+
+    def __init__(self, func, machines):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.machines = machines
+
+    def __call__(self, content):
+        return self.func(content)
+
+    def rewrite(self, path):
+        return stream_file(path, *self.machines)
+
+    def cache_identity(self):
+        key, version = transform_identity(self.func)
+        return f"lines:{key}", version
+
+    def __reduce__(self):
+        # Pickled by name, like the function it replaces in its script
+        return self.__qualname__
+
+    def __repr__(self):
+        return f"Streamed({self.__qualname__!r})"
+
+
+def streamed(*machines):
+    """
+    Decorator for a fixer function that is the same as running content
+    through machines. Called on text it is the function; the corpus
+    runner sees streaming and streams each file through the machines
+    instead, so huge files are never read whole.
+    """
+    def decorate(func):
+        return Streamed(func, machines)
+
+    return decorate
@@ -0,0 +1,213 @@
+"""
+Code-aware substitution for the fixer scripts.
+
+Fixers written as chains of re.sub calls also rewrite fenced code blocks
+and `inline code`, which corrupts samples in code-heavy articles and wastes
+time matching inside them. CodeMask finds the code spans of a file once
+and runs each substitution only over the prose between them:
+
+    mask = CodeMask(content)
+    mask = mask.sub(r'^(\\d+[^=]*=.*)$', r'`\\1`', flags=re.MULTILINE)
+    content = mask.text
+
+Prose segments are (start, end) offsets into the text, not copies.
+Fenced blocks start and end on line boundaries, so no match can cross one
+and ^ behaves as it would on the whole file. A segment without inline code
+goes straight to Pattern.subn; otherwise the pattern runs over it with
+Pattern.finditer(text, start, end) and any match that overlaps inline code
+is skipped. Code spans are copied through unchanged and their new offsets
+are carried forward, so a chain of substitutions never rescans the file.
+"""
+
+import bisect
+import functools
+import re
+
+from .tokenizer import (
+    BACKTICKS_RE, BLANK_LINE_RE, FENCE_OPEN_RE, _backtick_run_re, _fence_close_re, _line_start,
+)
+
+FENCE = 'fence'
+INLINE = 'inline'
+
+CODE_START_RE = re.compile(r'[`~]')
+
+TEMPLATE_PART_RE = re.compile(r'\\(?:([1-9][0-9]?)|g<([1-9][0-9]?|[A-Za-z_]\w*)>|([ntr\\]))')
+TEMPLATE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\'}
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_template(repl):
+    """
+    Split a re.sub replacement string into literals and group references
+    once, instead of Match.expand parsing it again for every match. Returns
+    None for templates using escapes not handled here.
+    """
+    parts = []
+    pos = 0
+    for m in TEMPLATE_PART_RE.finditer(repl):
+        literals = repl[pos:m.start()]
+        if '\\' in literals:
+            return None
+        parts.append(literals)
+        number, name, escape = m.groups()
+        if escape:
+            parts.append(TEMPLATE_ESCAPES[escape])
+        else:
+            ref = number or name
+            parts.append((int(ref) if ref.isdigit() else ref,))
+        pos = m.end()
+    if '\\' in repl[pos:]:
+        return None
+    parts.append(repl[pos:])
+    return [part for part in parts if part != '']
+
+
+def _template_expander(repl):
+    """Return a function that expands repl for a match, like re.sub would."""
+    if callable(repl):
+        return repl
+    if '\\' not in repl:
+        return lambda m: repl
+    parts = _compile_template(repl)
+    if parts is None:
+        return lambda m: m.expand(repl)
+    return lambda m: ''.join(part if isinstance(part, str) else (m.group(part[0]) or '') for part in parts)
+
+
+def find_code_spans(text):
+    """Return the sorted (start, end, kind) of every fenced block and inline code span."""
+    spans = []
+    n = len(text)
+    pos = 0
+    para_end = -1
+    unclosed_runs = set()
+
+    while pos < n:
+        m = CODE_START_RE.search(text, pos)
+        if not m:
+            break
+        pos = m.start()
+
+        line_start = _line_start(text, pos)
+        if line_start != -1:
+            fence = FENCE_OPEN_RE.match(text, line_start)
+            if fence:
+                marker = fence.group(1)
+                close = _fence_close_re(marker[0], len(marker)).search(text, fence.end())
+                end = close.end() if close else n
+                spans.append((fence.start(), end, FENCE))
+                pos = end
+                continue
+
+        if text[pos] == '~':
+            pos += 1
+            continue
+
+        # Inline code never crosses a blank line
+        run = BACKTICKS_RE.match(text, pos).end() - pos
+        if pos >= para_end:
+            blank = BLANK_LINE_RE.search(text, pos)
+            para_end = blank.start() if blank else n
+            unclosed_runs = set()
+        if run not in unclosed_runs:
+            close = _backtick_run_re(run).search(text, pos + run, para_end)
+            if close:
+                spans.append((pos, close.end(), INLINE))
+                pos = close.end()
+                continue
+            unclosed_runs.add(run)
+        pos += run
+
+    return spans
+
+
+class CodeMask:
+    """A text plus the offsets of its code spans."""
+
+    def __init__(self, text, spans=None):
+        self.text = text
+        self.spans = find_code_spans(text) if spans is None else spans
+        inline = [(start, end) for start, end, kind in self.spans if kind == INLINE]
+        self._inline_starts = [start for start, _ in inline]
+        self._inline_ends = [end for _, end in inline]
+
+    def prose_segments(self):
+        """Yield (start, end) of the text between fenced code blocks."""
+        pos = 0
+        for start, end, kind in self.spans:
+            if kind != FENCE:
+                continue
+            if start > pos:
+                yield pos, start
+            pos = end
+        if pos < len(self.text):
+            yield pos, len(self.text)
+
+    def _has_inline(self, start, end):
+        i = bisect.bisect_left(self._inline_starts, start)
+        return i < len(self._inline_starts) and self._inline_starts[i] < end
+
+    def overlaps_code(self, start, end):
+        """True if text[start:end] overlaps an inline code span."""
+        i = bisect.bisect_right(self._inline_starts, max(start, end - 1)) - 1
+        if i < 0:
+            return False
+        span_start, span_end = self._inline_starts[i], self._inline_ends[i]
+        if start == end:
+            return span_start < start < span_end
+        return start < span_end and end > span_start
+
+    def sub(self, pattern, repl, flags=0):
+        """
+        re.sub over the prose only. Returns a new CodeMask for the result,
+        so substitutions can be chained without finding the code again.
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, flags)
+        text = self.text
+        expand = _template_expander(repl)
+
+        pieces = []
+        spans = []
+        last = 0
+        delta = 0
+        pending = 0  # index of the next code span whose new offset is unknown
+
+        def shift_spans_before(pos):
+            nonlocal pending
+            while pending < len(self.spans) and self.spans[pending][1] <= pos:
+                start, end, kind = self.spans[pending]
+                spans.append((start + delta, end + delta, kind))
+                pending += 1
+
+        for seg_start, seg_end in self.prose_segments():
+            if not self._has_inline(seg_start, seg_end):
+                # Nothing to protect: let re.subn do the whole segment. It
+                # starts on a line boundary, so ^ behaves the same.
+                fixed, count = pattern.subn(repl, text[seg_start:seg_end])
+                if count:
+                    shift_spans_before(seg_start)
+                    pieces.append(text[last:seg_start])
+                    pieces.append(fixed)
+                    delta += len(fixed) - (seg_end - seg_start)
+                    last = seg_end
+                continue
+
+            for m in pattern.finditer(text, seg_start, seg_end):
+                start, end = m.span()
+                if self.overlaps_code(start, end):
+                    continue
+                shift_spans_before(start)
+                replacement = expand(m)
+                pieces.append(text[last:start])
+                pieces.append(replacement)
+                delta += len(replacement) - (end - start)
+                last = end
+
+        if not pieces:
+            return self
+
+        shift_spans_before(len(text))
+        pieces.append(text[last:])
+        return type(self)(''.join(pieces), spans)
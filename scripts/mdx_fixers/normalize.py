@@ -0,0 +1,150 @@
+"""
+Streaming whitespace normaliser, the final stage of the fixers.
+
+Most fixers ended with some mix of
+
+    content = content.replace('\\r\\n', '\\n').replace('\\r', '\\n')
+    content = re.sub(r'[ \\t]+$', '', content, flags=re.MULTILINE)
+    content = re.sub(r'\\n{3,}', '\\n\\n', content)
+
+and every step that changes something makes another full copy of the file.
+A Normalizer does the three in that order in one pass over the text in
+chunks. All three only touch runs of spaces, tabs and line breaks, so a
+chunk is cleaned up to its last non-blank character and the trailing run
+is carried over to the next one. Chunks that need nothing are passed on
+as they are, and the copies the steps make are the size of a chunk.
+
+A fixer declares it as its final stage, with the steps it wants:
+
+    @normalized(blank_lines=False)
+    def fix_mdx_content(content):
+        ...
+
+Called on text the result behaves like the plain function, so it works in
+a Pipeline. The corpus runner sees `normalizer`, calls the function itself
+and streams the normaliser's chunks straight into the file being written,
+so the normalised text is never built as a whole.
+"""
+
+import functools
+import re
+
+from .cache import transform_identity
+
+CHUNK_SIZE = 16 * 1024
+BLANK = ' \t\r\n'
+
+TRAILING_WHITESPACE_RE = re.compile(r'[ \t]+\n')
+BLANK_LINES_RE = re.compile(r'\n{3,}')
+BLANK_RUN_RE = re.compile(r'[ \t\r\n]*')
+
+
+def _run_start(text):
+    """Index where the run of blank characters at the end of text begins."""
+    i = len(text)
+    while i and text[i - 1] in BLANK:
+        i -= 1
+    return i
+
+
+class Normalizer:
+    """Line endings to \\n, trailing spaces and tabs stripped, 3+ newlines to 2."""
+
+    def __init__(self, newlines=True, trailing_whitespace=True, blank_lines=True, chunk_size=CHUNK_SIZE):
+        self.newlines = newlines
+        self.trailing_whitespace = trailing_whitespace
+        self.blank_lines = blank_lines
+        self.chunk_size = chunk_size
+
+    def needed(self, text, final=True):
+        """Whether normalising text would change it; scans without copying."""
+        if self.newlines and '\r' in text:
+            return True
+        if self.trailing_whitespace and (' \n' in text or '\t\n' in text or (final and text[-1:] in (' ', '\t'))):
+            return True
+        return self.blank_lines and '\n\n\n' in text
+
+    def clean(self, text, final=True):
+        """Normalise text that doesn't end inside a blank run (unless it is the end of the file)."""
+        if self.newlines and '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if self.trailing_whitespace:
+            text = TRAILING_WHITESPACE_RE.sub('\n', text)
+            if final:
+                text = text.rstrip(' \t')
+        if self.blank_lines:
+            text = BLANK_LINES_RE.sub('\n\n', text)
+        return text
+
+    def stream(self, chunks):
+        """Yield the normalised text of an iterable of chunks, piece by piece."""
+        held = ''
+        for chunk in chunks:
+            if held:
+                chunk = held + chunk
+            cut = _run_start(chunk)
+            held = chunk[cut:]
+            if cut < len(chunk):
+                chunk = chunk[:cut]
+            if chunk:
+                yield self.clean(chunk, False) if self.needed(chunk, False) else chunk
+        if held:
+            yield self.clean(held)
+
+    def split(self, text):
+        """
+        Slice text into pieces of about chunk_size for stream(). Each ends
+        just after a non-blank character, so nothing has to be carried
+        over, and text that fits in one piece isn't copied at all.
+        """
+        start = 0
+        while start < len(text):
+            end = start + self.chunk_size
+            if end >= len(text):
+                end = len(text)
+            elif text[end - 1] in BLANK:
+                end = min(BLANK_RUN_RE.match(text, end).end() + 1, len(text))
+            yield text if start == 0 and end == len(text) else text[start:end]
+            start = end
+
+    def __call__(self, content):
+        # The text is already in memory and the result must be too;
+        # chunking it would only add copies of the chunks
+        return self.clean(content) if self.needed(content) else content
+
+    def __repr__(self):
+        steps = [name for name in ('newlines', 'trailing_whitespace', 'blank_lines') if getattr(self, name)]
+        return f"Normalizer({', '.join(steps)})"
+
+
+class Normalized:
+    """A fixer function followed by a Normalizer; see normalized()."""
+
+    def __init__(self, func, normalizer):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.normalizer = normalizer
+
+    def __call__(self, content):
+        return self.normalizer(self.func(content))
+
+    def cache_identity(self):
+        key, version = transform_identity(self.func)
+        return f"{key}|{self.normalizer!r}", version
+
+    def __reduce__(self):
+        # Pickled by name, like the function it replaces in its script
+        return self.__qualname__
+
+    def __repr__(self):
+        return f"Normalized({self.__qualname__!r}, {self.normalizer!r})"
+
+
+def normalized(newlines=True, trailing_whitespace=True, blank_lines=True):
+    """Decorator that gives a fixer function a Normalizer as its final stage."""
+    normalizer = Normalizer(newlines, trailing_whitespace, blank_lines)
+
+    def decorate(func):
+        return Normalized(func, normalizer)
+
+    return decorate
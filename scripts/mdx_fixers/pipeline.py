@@ -0,0 +1,92 @@
+"""
+Fused fixer pipelines.
+
+Running the fix-*.py scripts one after another re-reads and rewrites every
+file once per script. A Pipeline chains the scripts' transform functions in
+memory instead, so each file is read once, passed through every step and
+written at most once. Rules the steps share (see rules.py) don't rescan
+text that no step has changed since the rule last ran on it.
+"""
+
+from . import rules
+from .cache import content_hash
+from .scripts import ScriptTransform
+
+# Named steps that can be chained, in the form step name -> (script, function)
+STEPS = {
+    # Whole-script clean-ups
+    'syntax-final': ('fix-mdx-syntax-final', 'fix_mdx_syntax_content'),
+    'remaining-errors': ('fix-remaining-mdx-errors', 'fix_remaining_mdx_content'),
+    'final-issues': ('fix-final-mdx-issues', 'fix_final_mdx_content'),
+    'specific-errors': ('fix-specific-mdx-errors', 'fix_specific_mdx_content'),
+    'jsx-expressions': ('fix-jsx-expression-errors', 'fix_jsx_expression_content'),
+    'number-prefix': ('fix-number-prefix-errors', 'fix_number_prefix_content'),
+    'hydration': ('fix-hydration-errors', 'fix_hydration_content'),
+    'lazy-lines': ('fix-lazy-line-mdx', 'fix_lazy_line_content'),
+    'parsing-errors': ('fix-mdx-parsing-errors', 'fix_mdx_content'),
+    'structure': ('fix-mdx-structure', 'fix_mdx_file'),
+    'comprehensive': ('fix-mdx-comprehensive', 'fix_mdx_issues'),
+    'final': ('fix-mdx-final', 'fix_mdx_issues'),
+    'self-closing': ('fix-mdx-self-closing', 'fix_mdx_self_closing_content'),
+    'mdx-syntax': ('fix-mdx-syntax', 'fix_mdx_syntax_content'),
+    'remaining': ('fix-mdx-remaining', 'fix_remaining_content'),
+    'structure-comprehensive': ('fix-mdx-structure-comprehensive', 'fix_mdx_structure'),
+    'blog-formatting': ('fix-mdx-blog-formatting', 'process_mdx_file'),
+    'blog-formatting-v2': ('fix-mdx-blog-formatting-v2', 'process_mdx_file_v2'),
+    'blog-components': ('fix-blog-formatting', 'fix_blog_content'),
+
+    # Individual transforms
+    'anchor-tags': ('fix-mdx-remaining', 'fix_anchor_tags'),
+    'spread-syntax': ('fix-mdx-remaining', 'fix_spread_syntax'),
+    'unclosed-tags': ('fix-mdx-remaining', 'fix_unclosed_tags'),
+    'table-separators': ('fix-mdx-remaining', 'fix_table_separators'),
+    'heading-backticks': ('fix-mdx-remaining', 'fix_backtick_in_headings'),
+    'stray-brackets': ('fix-stray-brackets', 'fix_stray_brackets'),
+    'unicode-quotes': ('fix-unicode-quotes', 'fix_unicode_quotes'),
+    'indented-content': ('fix-indented-content', 'fix_indented_content'),
+    'indented-text': ('fix-all-indented-text', 'fix_all_indented_text'),
+    'p-tag-structure': ('fix-p-tag-structure', 'fix_p_tag_structure'),
+    'self-closing-p-tags': ('fix-self-closing-p-tags', 'fix_self_closing_p_tags'),
+    'self-closing-components': ('fix-self-closing-components', 'fix_component_tags'),
+    'typos': ('fix-mdx-syntax', 'fix_typos_content'),
+}
+
+# The usual clean-up run, in the order the scripts used to be invoked
+DEFAULT_STEPS = [
+    'syntax-final',
+    'remaining-errors',
+    'final-issues',
+    'specific-errors',
+]
+
+
+def resolve_step(step):
+    """Turn a step name or a 'script:function' spec into a transform."""
+    if step in STEPS:
+        return ScriptTransform(*STEPS[step])
+    if ':' in step:
+        return ScriptTransform.parse(step)
+    raise ValueError(f"Unknown pipeline step: {step!r} (see --list)")
+
+
+class Pipeline:
+    """A chain of content transforms applied in order to one file's text."""
+
+    def __init__(self, steps=None):
+        self.names = list(steps or DEFAULT_STEPS)
+        self.transforms = [resolve_step(step) for step in self.names]
+
+    def __call__(self, content):
+        with rules.deduplicated():
+            for transform in self.transforms:
+                content = transform(content)
+        return content
+
+    def cache_identity(self):
+        """The pipeline's version changes whenever any step's version does."""
+        steps = [transform.cache_identity() for transform in self.transforms]
+        version = content_hash(repr(steps))[:16]
+        return f"pipeline[{','.join(self.names)}]", version
+
+    def __repr__(self):
+        return f"Pipeline({' -> '.join(self.names)})"
@@ -0,0 +1,361 @@
+"""
+Per-rule profiling for the fixer scripts.
+
+Most fixers are chains of re calls, so when a run is slow the question is
+which rule is to blame. Set $MDX_FIX_PROFILE (or pass --profile to any
+fixer) and every script a transform comes from is instrumented before it
+runs: its `re` module, its precompiled patterns, shared rules and CodeMask
+are swapped for proxies that time each call. A rule is identified by its
+call site, script:lineno, so the same pattern used on two lines is two
+rules.
+
+For every rule and every file the runner records the number of calls,
+wall time, matches and characters changed (removed plus inserted). At the
+end of the run it prints the hottest rules and writes to the profile
+directory (.cache/profile/ unless the variable names another one):
+
+    rules.json     per-rule totals, hottest first, and per-file breakdowns
+    rules.folded   folded stacks (function;rule self-microseconds) for
+                   flamegraph.pl, speedscope or inferno
+
+Instrumentation is only installed when profiling or a time budget (see
+guard.py) is on; normal runs call the real re functions directly.
+"""
+
+import copy
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from . import guard
+from .cache import REPO_ROOT
+from .masking import CodeMask, _template_expander
+from .rules import Chain, Rule
+from .writer import atomic_write
+
+PROFILE_ENV = 'MDX_FIX_PROFILE'
+DEFAULT_PROFILE_DIR = REPO_ROOT / '.cache' / 'profile'
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Pattern text kept in reports, per rule
+PATTERN_PREVIEW = 80
+
+
+def enabled():
+    return bool(os.environ.get(PROFILE_ENV))
+
+
+def profile_dir():
+    value = os.environ.get(PROFILE_ENV, '')
+    return DEFAULT_PROFILE_DIR if value in ('', '1') else Path(value)
+
+
+def _caller():
+    """The first frame outside this package: the script line that applied the rule."""
+    frame = sys._getframe(2)
+    while frame.f_back is not None and os.path.dirname(frame.f_code.co_filename) == PACKAGE_DIR:
+        frame = frame.f_back
+    return frame
+
+
+class RuleProfiler:
+    """Collects rule statistics for the file being processed."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.rules = {}   # rule -> [calls, seconds, matches, changed]
+        self.meta = {}    # rule -> [function, pattern]
+        self.stacks = {}  # folded stack -> self seconds
+        self._active = []  # [rule, frame label, child seconds] for nested rules
+        self.rule_budget = guard.rule_budget()
+
+    def run(self, pattern, call, measure):
+        """
+        Time call() as one application of the rule at the caller's line.
+        measure(result) returns (matches, changed) for the rule's result.
+        """
+        frame = _caller()
+        script = Path(frame.f_code.co_filename).stem
+        rule = f"{script}:{frame.f_lineno}"
+        if getattr(pattern, 'rule_name', None):
+            rule += f"[{pattern.rule_name}]"
+        # A proxied pattern handed to a proxied helper is one rule, not two
+        if self._active and self._active[-1][0] == rule:
+            return call()
+
+        entry = [rule, f"{script}:{frame.f_code.co_name};{rule}", 0.0]
+        self._active.append(entry)
+        start = time.perf_counter()
+        text = getattr(pattern, 'pattern', pattern)
+        try:
+            with guard.budget(self.rule_budget, 'rule', rule, text):
+                result = call()
+        except guard.BudgetExceeded as e:
+            # A file budget ran out: record the rule that was running
+            if e.rule is None:
+                e.rule, e.pattern = rule, text
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self._active.pop()
+            if self._active:
+                self._active[-1][2] += elapsed
+
+        matches, changed = measure(result)
+        stats = self.rules.get(rule)
+        if stats is None:
+            stats = self.rules[rule] = [0, 0.0, 0, 0]
+            self.meta[rule] = [frame.f_code.co_name, str(text)[:PATTERN_PREVIEW]]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += matches
+        stats[3] += changed
+
+        stack = ';'.join(label for _, label, _ in self._active + [entry])
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + elapsed - entry[2]
+        return result
+
+    def snapshot(self):
+        """The statistics collected since the last reset, as plain data."""
+        return {'rules': self.rules, 'meta': self.meta, 'stacks': self.stacks}
+
+
+profiler = RuleProfiler()
+
+
+class _Counter:
+    """Wraps a replacement so a sub() call counts its matches and changes."""
+
+    def __init__(self, repl):
+        self.expand = _template_expander(repl)
+        self.matches = 0
+        self.changed = 0
+
+    def __call__(self, m):
+        old = m.group(0)
+        new = self.expand(m)
+        self.matches += 1
+        if new != old:
+            self.changed += len(old) + len(new)
+        return new
+
+
+def _found(result):
+    return (0 if result is None else 1), 0
+
+
+def _counted(result):
+    return len(result), 0
+
+
+class ProfiledPattern:
+    """A compiled pattern whose matching methods are timed as rules."""
+
+    def __init__(self, pattern, rule_name=None):
+        self._pattern = pattern
+        # Set for the rules of a Chain, which share their call site
+        self.rule_name = rule_name
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def __repr__(self):
+        return repr(self._pattern)
+
+    def _sub(self, repl, string, count, n):
+        counter = _Counter(repl)
+        result = profiler.run(
+            self,
+            lambda: self._pattern.subn(counter, string, count),
+            lambda result: (counter.matches, counter.changed)
+        )
+        return result if n else result[0]
+
+    def sub(self, repl, string, count=0):
+        return self._sub(repl, string, count, False)
+
+    def subn(self, repl, string, count=0):
+        return self._sub(repl, string, count, True)
+
+    def search(self, string, *args):
+        return profiler.run(self, lambda: self._pattern.search(string, *args), _found)
+
+    def match(self, string, *args):
+        return profiler.run(self, lambda: self._pattern.match(string, *args), _found)
+
+    def fullmatch(self, string, *args):
+        return profiler.run(self, lambda: self._pattern.fullmatch(string, *args), _found)
+
+    def findall(self, string, *args):
+        return profiler.run(self, lambda: self._pattern.findall(string, *args), _counted)
+
+    def finditer(self, string, *args):
+        # Matched eagerly so the time is charged to the rule, not the loop body
+        matches = profiler.run(self, lambda: list(self._pattern.finditer(string, *args)), _counted)
+        return iter(matches)
+
+    def split(self, string, maxsplit=0):
+        return profiler.run(
+            self,
+            lambda: self._pattern.split(string, maxsplit),
+            lambda result: (len(result) - 1, 0)
+        )
+
+
+class ProfiledRe:
+    """Stands in for the re module inside an instrumented script."""
+
+    def __getattr__(self, name):
+        return getattr(re, name)
+
+    def compile(self, pattern, flags=0):
+        if isinstance(pattern, ProfiledPattern):
+            return pattern
+        return ProfiledPattern(re.compile(pattern, flags))
+
+    def sub(self, pattern, repl, string, count=0, flags=0):
+        return self.compile(pattern, flags).sub(repl, string, count)
+
+    def subn(self, pattern, repl, string, count=0, flags=0):
+        return self.compile(pattern, flags).subn(repl, string, count)
+
+    def search(self, pattern, string, flags=0):
+        return self.compile(pattern, flags).search(string)
+
+    def match(self, pattern, string, flags=0):
+        return self.compile(pattern, flags).match(string)
+
+    def fullmatch(self, pattern, string, flags=0):
+        return self.compile(pattern, flags).fullmatch(string)
+
+    def findall(self, pattern, string, flags=0):
+        return self.compile(pattern, flags).findall(string)
+
+    def finditer(self, pattern, string, flags=0):
+        return self.compile(pattern, flags).finditer(string)
+
+    def split(self, pattern, string, maxsplit=0, flags=0):
+        return self.compile(pattern, flags).split(string, maxsplit)
+
+
+profiled_re = ProfiledRe()
+
+
+class ProfiledCodeMask(CodeMask):
+    """CodeMask whose sub() calls are timed as rules."""
+
+    def sub(self, pattern, repl, flags=0):
+        counter = _Counter(repl)
+        parent = super()
+        return profiler.run(
+            pattern,
+            lambda: parent.sub(pattern, counter, flags),
+            lambda result: (counter.matches, counter.changed)
+        )
+
+
+def _profiled_rule(rule, chained=False):
+    # A private copy, so rules shared with uninstrumented code stay fast
+    profiled = copy.copy(rule)
+    profiled.pattern = ProfiledPattern(rule.pattern, rule.name if chained else None)
+    return profiled
+
+
+def instrument_module(module):
+    """Swap a script's re module, compiled patterns, rules and CodeMask for proxies."""
+    if module is None or getattr(module, '__mdx_profiled__', False):
+        return
+    for name, value in list(vars(module).items()):
+        if value is re:
+            setattr(module, name, profiled_re)
+        elif isinstance(value, re.Pattern):
+            setattr(module, name, ProfiledPattern(value))
+        elif value is CodeMask:
+            setattr(module, name, ProfiledCodeMask)
+        elif isinstance(value, Rule):
+            setattr(module, name, _profiled_rule(value))
+        elif isinstance(value, Chain):
+            setattr(module, name, Chain([_profiled_rule(item, chained=True) for item in value.rules]))
+    module.__mdx_profiled__ = True
+
+
+def instrument(transform):
+    """Instrument the scripts a transform (or each step of a pipeline) comes from."""
+    for step in getattr(transform, 'transforms', [transform]):
+        if hasattr(step, 'resolve'):
+            func = step.resolve()
+        else:
+            func = getattr(step, 'edit', step)  # HeaderTransform
+        func = getattr(func, 'func', func)  # functools.partial
+        module = sys.modules.get(getattr(func, '__module__', None))
+        path = getattr(module, '__file__', None)
+        # Only the scripts' own rules; the package itself is left alone
+        if path and os.path.dirname(os.path.abspath(path)) != PACKAGE_DIR:
+            instrument_module(module)
+
+
+def merge(profiles):
+    """Combine per-file snapshots into corpus totals: (rules, meta, stacks, files)."""
+    rules, meta, stacks, files = {}, {}, {}, {}
+    for path, profile in profiles:
+        if not profile:
+            continue
+        files[str(path)] = profile['rules']
+        meta.update(profile['meta'])
+        for rule, stats in profile['rules'].items():
+            total = rules.setdefault(rule, [0, 0.0, 0, 0, 0])
+            for i, value in enumerate(stats):
+                total[i] += value
+            total[4] += 1
+        for stack, seconds in profile['stacks'].items():
+            stacks[stack] = stacks.get(stack, 0.0) + seconds
+    return rules, meta, stacks, files
+
+
+def write_report(profiles, directory=None, top=15):
+    """
+    Write rules.json and rules.folded for a run from (path, snapshot)
+    pairs, print the hottest rules and return the report directory.
+    """
+    directory = Path(directory or profile_dir())
+    rules, meta, stacks, files = merge(profiles)
+    hot = sorted(rules.items(), key=lambda item: item[1][1], reverse=True)
+
+    report = {
+        'rules': [
+            {
+                'rule': rule,
+                'function': meta[rule][0],
+                'pattern': meta[rule][1],
+                'calls': calls,
+                'seconds': seconds,
+                'matches': matches,
+                'changed': changed,
+                'files': file_count,
+            }
+            for rule, (calls, seconds, matches, changed, file_count) in hot
+        ],
+        'files': files,
+    }
+    directory.mkdir(parents=True, exist_ok=True)
+    atomic_write(directory / 'rules.json', json.dumps(report, indent=2) + '\n')
+    folded = ''.join(
+        f"{stack} {round(seconds * 1e6)}\n"
+        for stack, seconds in sorted(stacks.items())
+        if seconds >= 0.5e-6
+    )
+    atomic_write(directory / 'rules.folded', folded)
+
+    print(f"\n🔥 Hottest rules ({len(rules)} profiled):")
+    print(f"  {'rule':<40} {'seconds':>9} {'calls':>8} {'matches':>8} {'changed':>9}  pattern")
+    for rule, (calls, seconds, matches, changed, _) in hot[:top]:
+        pattern = meta[rule][1].replace('\n', '\\n')[:40]
+        print(f"  {rule:<40} {seconds:9.3f} {calls:8} {matches:8} {changed:9}  {pattern}")
+    print(f"📝 Profile written to {directory}")
+    return directory
@@ -0,0 +1,182 @@
+"""
+Named, precompiled rewrite rules shared by the fixer scripts.
+
+Many fixers were written by copying the rules of an older one, so the same
+patterns (stripping imports and non-ASCII characters, collapsing blank
+lines, de-quoting StatsBox/Timeline arrays, ...) appear in several scripts.
+They live here instead, compiled once per process:
+
+    from mdx_fixers.rules import STRIP_IMPORTS, STRIP_TRAILING_WHITESPACE
+
+    content = STRIP_IMPORTS(content)
+
+Each Rule carries metadata:
+
+    order       the stage it belongs to (COMPONENTS, MARKUP, SPACING,
+                CLEANUP); chain() runs rules stage by stage
+    idempotent  applying it twice gives the same text as applying it once
+    scope       DOCUMENT (the whole file) or PROSE (outside code, see
+                masking.py)
+
+A Pipeline runs each file inside deduplicated(). There an idempotent rule
+remembers its output, and when a later script applies the same rule to
+text nothing has touched since, the rule hands it back without scanning it
+again. re.sub returns its input object when nothing matches, so rules that
+change nothing don't break the chain. The outputs are dropped when the
+file is done.
+"""
+
+import contextlib
+import re
+
+from .masking import CodeMask
+
+DOCUMENT = 'document'
+PROSE = 'prose'
+
+# Stages, in the order chain() applies them
+COMPONENTS = 10
+MARKUP = 30
+SPACING = 50
+CLEANUP = 90
+
+RULES = {}
+
+# Last output of each idempotent rule inside deduplicated(), or None outside
+_outputs = None
+
+# Body of a [...] array that may contain one level of nested [...]
+ARRAY_BODY = r'((?:[^][]|\[[^\]]*\])*)'
+
+
+class Rule:
+    """A named re.sub rule."""
+
+    def __init__(self, name, pattern, repl, flags=0, order=MARKUP, idempotent=True, scope=DOCUMENT):
+        self.name = name
+        self.pattern = re.compile(pattern, flags)
+        self.repl = repl
+        self.order = order
+        self.idempotent = idempotent
+        self.scope = scope
+
+    def __call__(self, content):
+        if _outputs is not None and _outputs.get(self.name) is content:
+            return content
+        if self.scope == PROSE:
+            fixed = CodeMask(content).sub(self.pattern, self.repl).text
+        else:
+            fixed = self.pattern.sub(self.repl, content)
+        if _outputs is not None and self.idempotent:
+            _outputs[self.name] = fixed
+        return fixed
+
+    def __repr__(self):
+        return f"Rule({self.name!r})"
+
+
+class Chain:
+    """Rules applied stage by stage; see chain()."""
+
+    def __init__(self, rules):
+        self.rules = rules
+
+    def __call__(self, content):
+        for item in self.rules:
+            content = item(content)
+        return content
+
+    def __repr__(self):
+        return f"Chain({', '.join(item.name for item in self.rules)})"
+
+
+def rule(name, pattern, repl, **metadata):
+    """Define a rule and add it to the registry."""
+    if name in RULES:
+        raise ValueError(f"Duplicate rule name: {name!r}")
+    RULES[name] = Rule(name, pattern, repl, **metadata)
+    return RULES[name]
+
+
+def get(name):
+    try:
+        return RULES[name]
+    except KeyError:
+        raise ValueError(f"Unknown rule: {name!r}") from None
+
+
+def chain(*rules):
+    """
+    Apply rules (Rule objects or names) stage by stage, in the given order
+    within a stage. A rule listed twice runs once.
+    """
+    unique = {}
+    for item in rules:
+        item = get(item) if isinstance(item, str) else item
+        unique.setdefault(item.name, item)
+    return Chain(sorted(unique.values(), key=lambda item: item.order))
+
+
+@contextlib.contextmanager
+def deduplicated():
+    """Skip idempotent rules given text they produced earlier in the block."""
+    global _outputs
+    outer, _outputs = _outputs, {}
+    try:
+        yield
+    finally:
+        _outputs = outer
+
+
+# Components: JSX props written as strings instead of expressions
+DEQUOTE_STATSBOX = rule(
+    'dequote-statsbox', r'<StatsBox\s+stats="{\[' + ARRAY_BODY + r'\]}"\s*/>', r'<StatsBox stats={[\1]} />',
+    flags=re.DOTALL, order=COMPONENTS
+)
+DEQUOTE_TIMELINE = rule(
+    'dequote-timeline', r'<Timeline\s+items="{\[' + ARRAY_BODY + r'\]}"\s*/>', r'<Timeline items={[\1]} />',
+    flags=re.DOTALL, order=COMPONENTS
+)
+DEQUOTE_ROWS = rule(
+    'dequote-rows', r'rows="{\[' + ARRAY_BODY + r'\]}"', r'rows={[\1]}', flags=re.DOTALL, order=COMPONENTS
+)
+DEQUOTE_COMPONENTS = chain(DEQUOTE_STATSBOX, DEQUOTE_TIMELINE, DEQUOTE_ROWS)
+
+# Markup
+# (Unwrapping can expose another backtick pair to unwrap, so these aren't idempotent)
+UNWRAP_CODE_DIV_OPEN = rule('unwrap-code-div-open', r'`(\s*<div[^>]*>)`', r'\1', idempotent=False)
+UNWRAP_CODE_DIV_CLOSE = rule('unwrap-code-div-close', r'`(\s*</div>)`', r'\1', idempotent=False)
+UNWRAP_CODE_TAG = rule('unwrap-code-tag', r'`(\s*<[^>]+>)`', r'\1', idempotent=False)
+STRIP_TRAILING_BACKTICK = rule(
+    'strip-trailing-backtick', r'`(\s*)$', r'\1', flags=re.MULTILINE, idempotent=False
+)
+CLASSNAME_TO_CLASS = rule('classname-to-class', r'className=', 'class=')
+SPACE_AFTER_CLASSNAME = rule('space-after-classname', r'className="([^"]*)"([A-Za-z])', r'className="\1" \2')
+
+# Spacing. The div rules add a newline every time they run, and the list
+# rule's matches overlap, so each run spaces out every other item.
+BLANK_LINE_BEFORE_DIV = rule(
+    'blank-line-before-div', r'(\n)(<div)', r'\1\n\2', order=SPACING, idempotent=False
+)
+BLANK_LINE_AFTER_DIV = rule(
+    'blank-line-after-div', r'(</div>)(\n)', r'\1\n\n\2', order=SPACING, idempotent=False
+)
+BLANK_LINE_AFTER_HEADING = rule(
+    'blank-line-after-heading', r'(^#{1,6} .+)$\n(?=[^\n])', r'\1\n\n', flags=re.MULTILINE, order=SPACING
+)
+BLANK_LINE_AFTER_LIST = rule(
+    'blank-line-after-list', r'(\n- .+)(\n)(?=\S)', r'\1\n\n', order=SPACING, idempotent=False
+)
+
+# Clean-up
+STRIP_IMPORTS = rule('strip-imports', r'^import\s+.*?;?\s*$', '', flags=re.MULTILINE, order=CLEANUP)
+STRIP_LEADING_BLANK_LINES = rule('strip-leading-blank-lines', r'^(\s*\n)+', '', order=CLEANUP)
+# Whole documents go through charmap.STRIP_NON_ASCII, which is quicker;
+# the rule is kept for CodeMask.sub, which needs a pattern
+STRIP_NON_ASCII = rule('strip-non-ascii', r'[^\x00-\x7F]+', '', order=CLEANUP, scope=PROSE)
+STRIP_TRAILING_WHITESPACE = rule(
+    'strip-trailing-whitespace', r'[ \t]+$', '', flags=re.MULTILINE, order=CLEANUP
+)
+COLLAPSE_BLANK_LINES = rule('collapse-blank-lines', r'\n{3,}', '\n\n', order=CLEANUP)
+# Also swallows whitespace-only lines between the newlines
+COLLAPSE_WHITESPACE_LINES = rule('collapse-whitespace-lines', r'\n\s*\n\s*\n', '\n\n', order=CLEANUP)
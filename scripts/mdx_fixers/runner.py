@@ -0,0 +1,454 @@
+"""
+Parallel corpus runner for the fixer scripts.
+
+A transform is any picklable function that takes the text of one MDX file
+and returns the fixed text. The runner fans the files out over a process
+pool, writes back only the ones that changed (atomically, see writer.py)
+and returns one FileResult per file in the same order as the input.
+
+With $MDX_FIX_ASYNC_IO set (or --async-io on any fixer) the reads and
+writes are overlapped with the transforms instead; see run_async.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from . import changeset, diagnostics, dryrun, guard, profiling
+from .cache import REPO_ROOT, content_hash, transform_identity
+from .writer import atomic_write, write_chunks_if_changed, write_if_changed
+
+FileResult = namedtuple(
+    'FileResult',
+    ['path', 'changed', 'error', 'digest', 'skipped', 'profile', 'quarantine', 'report', 'warnings'],
+    defaults=[None, False, None, None, None, None]
+)
+
+# Environment override for the default worker count
+JOBS_ENV = 'MDX_FIX_JOBS'
+
+# Overlapped I/O (see run_async): the variable's value is the queue depth
+ASYNC_IO_ENV = 'MDX_FIX_ASYNC_IO'
+QUEUE_DEPTH = 16
+IO_THREADS = 8
+
+# Diagnostics for the files the last guarded run gave up on
+QUARANTINE_REPORT = REPO_ROOT / '.cache' / 'quarantine.json'
+
+
+def default_jobs():
+    """Worker count from $MDX_FIX_JOBS, falling back to the CPU count."""
+    value = os.environ.get(JOBS_ENV)
+    if value:
+        return max(1, int(value))
+    return os.cpu_count() or 1
+
+
+def async_depth():
+    """Queue depth for overlapped I/O from $MDX_FIX_ASYNC_IO, or None if it is off."""
+    value = os.environ.get(ASYNC_IO_ENV)
+    if not value:
+        return None
+    return QUEUE_DEPTH if value == '1' else max(1, int(value))
+
+
+def find_mdx_files(directory, pattern='*.mdx'):
+    """Return the files in directory matching pattern, sorted by name."""
+    return sorted(Path(directory).glob(pattern))
+
+
+def process_file(path, transform):
+    """
+    Read and transform a single file, writing it back only if it changed.
+
+    A file whose transform overruns its time budget (see guard.py) is left
+    as it is and comes back with a quarantine diagnostic. In a dry run
+    (see dryrun.py) nothing is written and a file that would change comes
+    back with its diff and the rules that changed it. Warnings the
+    transform raises (see diagnostics.py) come back with the file too.
+    """
+    with diagnostics.collecting() as warnings:
+        result = _checked_file(path, transform)
+    return result._replace(warnings=warnings) if warnings else result
+
+
+def _checked_file(path, transform):
+    profile = profiling.enabled()
+    dry_run = dryrun.enabled()
+    if not (profile or dry_run or guard.file_budget() or guard.rule_budget()):
+        return _process_file(path, transform)
+
+    # Instrumented even for a file budget, so a diagnostic can name the rule
+    profiling.instrument(transform)
+    profiling.profiler.reset()
+    start = time.perf_counter()
+    try:
+        if dry_run:
+            result = _dry_run_file(path, transform, guard.file_budget())
+        else:
+            result = _process_file(path, transform, guard.file_budget())
+    except guard.BudgetExceeded as e:
+        result = FileResult(path, False, f"Quarantined: {e}", quarantine=quarantine_diagnostic(path, e, start))
+    if result.report is not None:
+        rules = dryrun.changed_rules(profiling.profiler.snapshot())
+        result.report['rules'] = rules + result.report.pop('stages', [])
+    return result._replace(profile=profiling.profiler.snapshot() if profile else None)
+
+
+def _process_file(path, transform, budget=None):
+    try:
+        # Frontmatter-only transforms never read the body, so there is no
+        # content hash to report
+        if getattr(transform, 'header_only', False):
+            return FileResult(path, transform.rewrite(path), None, None)
+
+        # Streaming transforms (see bytestream.py) rewrite the file in chunks
+        if getattr(transform, 'streaming', False):
+            with guard.budget(budget):
+                changed, digest = transform.rewrite(path)
+            return FileResult(path, changed, None, digest)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # A normalised fixer's final stage is streamed into the file below
+        normalizer = getattr(transform, 'normalizer', None)
+        with guard.budget(budget):
+            fixed_content = transform(content) if normalizer is None else transform.func(content)
+
+        if normalizer is not None and normalizer.needed(fixed_content):
+            digest = hashlib.sha256()
+            chunks = _hashed(normalizer.stream(normalizer.split(fixed_content)), digest)
+            changed = write_chunks_if_changed(path, chunks, original=content)
+            return FileResult(path, changed, None, digest.hexdigest())
+
+        changed = write_if_changed(path, fixed_content, original=content)
+
+        return FileResult(path, changed, None, content_hash(fixed_content))
+    except Exception as e:
+        return FileResult(path, False, f"{type(e).__name__}: {e}")
+
+
+def _dry_run_file(path, transform, budget=None):
+    """Transform a file in memory only; one that would change gets a report with its diff."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Header-only and streaming transforms work on text too; a
+        # normalised one is run in two steps to tell its final stage apart
+        normalizer = getattr(transform, 'normalizer', None)
+        with guard.budget(budget):
+            staged = transform(content) if normalizer is None else transform.func(content)
+            fixed_content = staged if normalizer is None else normalizer(staged)
+    except Exception as e:
+        return FileResult(path, False, f"{type(e).__name__}: {e}")
+
+    if fixed_content == content:
+        return FileResult(path, False, None, content_hash(content))
+    report = {'diff': dryrun.unified_diff(path, content, fixed_content)}
+    if fixed_content != staged:
+        report['stages'] = [dryrun.normalizer_stage(transform, staged, fixed_content)]
+    return FileResult(path, True, None, content_hash(fixed_content), report=report)
+
+
+def _hashed(chunks, digest):
+    for chunk in chunks:
+        digest.update(chunk.encode('utf-8'))
+        yield chunk
+
+
+def quarantine_diagnostic(path, error, start):
+    """What to record about a file that overran its budget."""
+    try:
+        size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            lines = sum(1 for _ in f)
+    except OSError:
+        size = lines = None
+    slowest = sorted(profiling.profiler.rules.items(), key=lambda item: item[1][1], reverse=True)
+    return {
+        'path': str(path),
+        'scope': error.scope,
+        'budget': error.budget,
+        'elapsed': time.perf_counter() - start,
+        'rule': error.rule,
+        'pattern': error.pattern[:profiling.PATTERN_PREVIEW] if error.pattern else None,
+        'bytes': size,
+        'lines': lines,
+        # Rules that had already run on the file, slowest first
+        'slowest_rules': [[rule, stats[1]] for rule, stats in slowest[:5]],
+    }
+
+
+def write_quarantine_report(results, path=QUARANTINE_REPORT):
+    """
+    Write the diagnostics of a run's quarantined files; returns how many
+    there were. The report only ever describes the latest budgeted run, so
+    a run that quarantines nothing removes the one an earlier run left.
+    """
+    quarantined = [r.quarantine for r in results if r.quarantine]
+    if quarantined:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(quarantined, indent=2) + '\n')
+        print(f"🚧 Quarantined {len(quarantined)} files that overran their time budget; see {path}")
+    else:
+        Path(path).unlink(missing_ok=True)
+    return len(quarantined)
+
+
+def _process_task(task):
+    path, transform = task
+    return process_file(path, transform)
+
+
+def _read_text(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _write_text(path, fixed_content, content):
+    return write_if_changed(path, fixed_content, original=content), content_hash(fixed_content)
+
+
+def _apply(transform, content):
+    with diagnostics.collecting() as warnings:
+        return transform(content), warnings or None
+
+
+def _owns_io(transform):
+    """Whether a task has to run through process_file in a worker, reading and writing there."""
+    if getattr(transform, 'header_only', False) or getattr(transform, 'streaming', False):
+        return True
+    return profiling.enabled() or dryrun.enabled() or bool(guard.file_budget() or guard.rule_budget())
+
+
+def run_async(tasks, jobs=None, depth=QUEUE_DEPTH, executor=None):
+    """
+    Run (path, transform) tasks with reads, transforms and writes overlapped.
+
+    An asyncio loop reads files in a thread pool, hands the text to the
+    transforms in a process pool and writes the results back in the
+    thread pool again, so the CPU keeps working while slow storage (a
+    network-mounted content volume) is read from or written to. The
+    queues between the stages hold at most depth files, which bounds the
+    text in flight. Transforms are called on text exactly as process_file
+    calls them; those that do their own I/O, and every task in a profiled,
+    dry or budgeted run, go through process_file in the pool as a whole.
+    Returns one FileResult per task, in task order.
+    """
+    tasks = [(Path(path), transform) for path, transform in tasks]
+    return asyncio.run(_run_async(tasks, jobs or default_jobs(), depth, executor))
+
+
+async def _run_async(tasks, jobs, depth, executor):
+    loop = asyncio.get_running_loop()
+    results = [None] * len(tasks)
+    reads = asyncio.Queue(depth)
+    writes = asyncio.Queue(depth)
+    queued = iter(enumerate(tasks))
+    io = ThreadPoolExecutor(IO_THREADS)
+    pool = executor or ProcessPoolExecutor(max_workers=jobs)
+
+    def failed(path, e):
+        return FileResult(path, False, f"{type(e).__name__}: {e}")
+
+    async def read():
+        for i, (path, transform) in queued:
+            if _owns_io(transform):
+                await reads.put((i, path, transform, None))
+                continue
+            try:
+                content = await loop.run_in_executor(io, _read_text, path)
+            except Exception as e:
+                results[i] = failed(path, e)
+                continue
+            await reads.put((i, path, transform, content))
+
+    async def fix():
+        while (item := await reads.get()) is not None:
+            i, path, transform, content = item
+            if content is None:
+                try:
+                    results[i] = await loop.run_in_executor(pool, process_file, path, transform)
+                except Exception as e:
+                    # A broken pool fails every file left, and the queues still drain
+                    results[i] = failed(path, e)
+                continue
+            try:
+                fixed_content, warnings = await loop.run_in_executor(pool, _apply, transform, content)
+            except Exception as e:
+                results[i] = failed(path, e)
+                continue
+            await writes.put((i, path, content, fixed_content, warnings))
+
+    async def write():
+        while (item := await writes.get()) is not None:
+            i, path, content, fixed_content, warnings = item
+            try:
+                changed, digest = await loop.run_in_executor(io, _write_text, path, fixed_content, content)
+            except Exception as e:
+                results[i] = failed(path, e)
+                continue
+            results[i] = FileResult(path, changed, None, digest, warnings=warnings)
+
+    try:
+        # Twice as many transforms in flight as workers keeps every worker busy
+        fixers = [asyncio.create_task(fix()) for _ in range(jobs * 2)]
+        writers = [asyncio.create_task(write()) for _ in range(IO_THREADS)]
+        await asyncio.gather(*(read() for _ in range(IO_THREADS)))
+        for _ in fixers:
+            await reads.put(None)
+        await asyncio.gather(*fixers)
+        for _ in writers:
+            await writes.put(None)
+        await asyncio.gather(*writers)
+    finally:
+        io.shutdown()
+        if pool is not executor:
+            pool.shutdown()
+    return results
+
+
+def run_tasks(tasks, jobs=None, verbose=True, cache=None, executor=None):
+    """
+    Run (path, transform) tasks across a process pool.
+
+    Results come back in task order whatever order the workers finish in.
+    With jobs=1 everything runs in this process, which is easier to debug.
+    Pass a ProcessPoolExecutor to reuse its (already warm) workers instead
+    of starting a pool for the run.
+    If a FixerCache is given, files the transform has already been applied
+    to are skipped without being read, and the manifest is updated after.
+    With profiling on (see profiling.py) every file is processed and the
+    per-rule report is written at the end; a dry run (see dryrun.py)
+    processes every file too, writes none of them and writes its change
+    report at the end. In changed-files mode (see changeset.py) only the
+    tasks whose file is part of the change are run; the rest come back
+    skipped. With overlapped I/O on the tasks are run by run_async.
+    """
+    tasks = [(Path(path), transform) for path, transform in tasks]
+    jobs = jobs or default_jobs()
+    profile = profiling.enabled()
+    dry_run = dryrun.enabled()
+    if profile or dry_run:
+        # A profile of a run that skipped most files is no use, and a dry
+        # run must not record changes it never made
+        cache = None
+    start = time.perf_counter()
+
+    results = [None] * len(tasks)
+    pending = list(range(len(tasks)))
+    if changeset.enabled():
+        # Files outside the change are skipped before anything is read
+        pending = []
+        for i, (path, _) in enumerate(tasks):
+            if changeset.is_changed(path):
+                pending.append(i)
+            else:
+                results[i] = FileResult(path, False, None, skipped=True)
+        if verbose:
+            print(f"🔍 {len(pending)} of {len(tasks)} files {changeset.describe()}")
+    if cache is not None:
+        identities = {i: transform_identity(tasks[i][1]) for i in pending}
+        candidates, pending = pending, []
+        for i in candidates:
+            path = tasks[i][0]
+            if cache.is_current(path, *identities[i]):
+                results[i] = FileResult(path, False, None, skipped=True)
+            else:
+                pending.append(i)
+
+    todo = [tasks[i] for i in pending]
+    # Hand each worker a handful of files at a time to keep IPC overhead low
+    chunksize = max(1, len(todo) // (jobs * 4))
+    if async_depth() and len(todo) > 1:
+        processed = _collect(run_async(todo, jobs, async_depth(), executor), verbose)
+    elif jobs == 1 or len(todo) <= 1:
+        processed = _collect(map(_process_task, todo), verbose)
+    elif executor is not None:
+        processed = _collect(executor.map(_process_task, todo, chunksize=chunksize), verbose)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            processed = executor.map(_process_task, todo, chunksize=chunksize)
+            processed = _collect(processed, verbose)
+
+    for i, result in zip(pending, processed):
+        results[i] = result
+        if cache is not None and not result.error:
+            cache.record(result.path, result.digest, *identities[i])
+    if cache is not None:
+        cache.save()
+
+    if verbose:
+        summarize(results, time.perf_counter() - start, jobs)
+    if profile:
+        profiling.write_report([(r.path, r.profile) for r in results])
+    if dry_run:
+        dryrun.write_report(results)
+    if guard.file_budget() or guard.rule_budget():
+        write_quarantine_report(results)
+    return results
+
+
+def run_corpus(paths, transform, jobs=None, verbose=True, cache=None):
+    """Apply one transform to every path; see run_tasks."""
+    return run_tasks([(path, transform) for path in paths], jobs, verbose, cache)
+
+
+def _collect(results, verbose):
+    collected = []
+    for result in results:
+        if verbose:
+            print_result(result)
+        collected.append(result)
+    return collected
+
+
+def print_result(result):
+    """Print the one-line status for a single file."""
+    name = result.path.name
+    if result.quarantine:
+        print(f"🚧 {result.error}: {name}")
+    elif result.error:
+        print(f"❌ Error processing {name}: {result.error}")
+    elif result.changed and result.report is not None:
+        print(f"📝 Would fix: {name}")
+    elif result.changed:
+        print(f"✅ Fixed: {name}")
+    else:
+        print(f"  No changes: {name}")
+    print_warnings(result)
+
+
+def print_warnings(result):
+    """Print the warnings the transform raised for a file, one line each."""
+    for warning in result.warnings or ():
+        print(f"  ⚠️  {result.path.name}: {warning}")
+
+
+def summarize(results, elapsed=None, jobs=None):
+    """Print a summary of a run and return the number of failed files."""
+    changed = sum(1 for r in results if r.changed)
+    errors = sum(1 for r in results if r.error)
+    skipped = sum(1 for r in results if r.skipped)
+    quarantined = sum(1 for r in results if r.quarantine)
+    unchanged = len(results) - changed - errors - skipped
+
+    line = f"\nProcessed {len(results)} files: {changed} changed, {unchanged} unchanged, {errors} errors"
+    if quarantined:
+        line += f" ({quarantined} quarantined)"
+    if skipped:
+        line += f", {skipped} skipped" if changeset.enabled() else f", {skipped} cached"
+    if elapsed is not None:
+        line += f" in {elapsed:.2f}s"
+    if jobs is not None:
+        line += f" (jobs={jobs})"
+    print(line)
+    return errors
+
@@ -0,0 +1,88 @@
+"""
+Load the hyphen-named fix-*.py scripts as modules.
+
+The scripts cannot be imported with a normal import statement because of
+the hyphens in their file names, so they are loaded by path and cached in
+sys.modules under an underscored name (fix-mdx-final -> fix_mdx_final).
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from .cache import script_identity
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+
+def module_name(script):
+    """Return the module name used for a script such as 'fix-mdx-final.py'."""
+    return Path(script).stem.replace('-', '_')
+
+
+def load_script(script):
+    """Load a script from scripts/ by name, e.g. load_script('fix-mdx-final')."""
+    name = module_name(script)
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = SCRIPTS_DIR / (Path(script).stem + '.py')
+    if not path.exists():
+        raise FileNotFoundError(f"Fixer script not found: {path}")
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+class ScriptTransform:
+    """
+    A picklable reference to a transform function defined in a fixer script.
+
+    Worker processes receive only the script and function names and load
+    the script themselves, so the reference works with any multiprocessing
+    start method.
+    """
+
+    def __init__(self, script, function):
+        self.script = Path(script).stem
+        self.function = function
+        self._func = None
+
+    def resolve(self):
+        if self._func is None:
+            self._func = getattr(load_script(self.script), self.function)
+        return self._func
+
+    def __call__(self, content):
+        return self.resolve()(content)
+
+    def cache_identity(self):
+        return script_identity(SCRIPTS_DIR / (self.script + '.py'), self.function)
+
+    def __getstate__(self):
+        return {'script': self.script, 'function': self.function, '_func': None}
+
+    def __repr__(self):
+        return f"{self.script}:{self.function}"
+
+    @classmethod
+    def parse(cls, spec):
+        """Build a reference from 'script:function', e.g. 'fix-mdx-final:fix_mdx_issues'."""
+        script, sep, function = spec.partition(':')
+        if not sep or not script or not function:
+            raise ValueError(f"Expected 'script:function', got {spec!r}")
+        return cls(script, function)
+
+
+def preload(transform):
+    """Load the scripts behind a transform (or each step of a pipeline) now, not on first use."""
+    for step in getattr(transform, 'transforms', [transform]):
+        if hasattr(step, 'resolve'):
+            step.resolve()
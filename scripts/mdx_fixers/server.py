@@ -0,0 +1,176 @@
+"""
+Fixer server: one long-lived process that fixes MDX for other programs.
+
+Calling the single-file scripts (fix-unicode-quotes.py <file> and the
+like) once per page pays for an interpreter start and a fresh compile of
+every rule each time. A FixerServer loads all the named pipeline steps
+once and then answers requests, one JSON object per line, over
+stdin/stdout or a Unix socket:
+
+    {"id": 1, "steps": ["unicode-quotes", "stray-brackets"], "paths": ["content/blog/a.mdx"]}
+    {"id": 1, "results": [{"path": "content/blog/a.mdx", "changed": true, "error": null, "warnings": []}]}
+
+    {"id": 2, "steps": ["unicode-quotes"], "content": "..."}
+    {"id": 2, "content": "...", "changed": false, "warnings": []}
+
+steps are names from pipeline.STEPS or script:function specs and default
+to the server's own list; id is optional and echoed back. Paths (relative
+to the server's working directory) are fixed in place by the corpus
+runner, so a batch of them is spread over the worker pool and the
+incremental cache and --dry-run apply as usual. Content is fixed in memory
+and sent back. Warnings the transforms raise about a file (see
+diagnostics.py) come back with it. A request that can't be served gets
+{"id": ..., "error": ...} and the server carries on with the next one.
+
+stdout belongs to the protocol, so whatever a transform prints, in this
+process or in a worker, goes to stderr.
+"""
+
+import io
+import json
+import os
+import signal
+import socketserver
+import stat
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from . import diagnostics
+from .pipeline import DEFAULT_STEPS, STEPS, Pipeline
+from .runner import default_jobs, run_tasks
+from .scripts import preload
+
+
+class FixerServer:
+    """Answers fix requests with pipelines that are built once and kept."""
+
+    def __init__(self, jobs=None, cache=None, steps=DEFAULT_STEPS):
+        self.jobs = jobs or default_jobs()
+        self.cache = cache
+        self.steps = list(steps)
+        self.pipelines = {}
+        # Requests are answered one at a time; batches of paths still fan out
+        self.lock = threading.Lock()
+
+        everything = Pipeline(list(STEPS))
+        preload(everything)
+        self.pipeline(self.steps)
+        self.executor = None
+        if self.jobs > 1:
+            self.executor = ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker, initargs=(everything,))
+
+    def pipeline(self, steps):
+        key = tuple(steps)
+        if key not in self.pipelines:
+            pipeline = Pipeline(key)
+            preload(pipeline)
+            self.pipelines[key] = pipeline
+        return self.pipelines[key]
+
+    def handle(self, request):
+        """Answer one decoded request."""
+        response = {'id': request.get('id')}
+        try:
+            steps = request.get('steps') or self.steps
+            if isinstance(steps, str):
+                steps = [step.strip() for step in steps.split(',') if step.strip()]
+            pipeline = self.pipeline(steps)
+            if 'paths' in request:
+                paths = request['paths']
+                results = run_tasks([(path, pipeline) for path in paths], self.jobs, False, self.cache, self.executor)
+                response['results'] = [
+                    {
+                        'path': path,
+                        'changed': result.changed,
+                        'error': result.error,
+                        'warnings': result.warnings or [],
+                    }
+                    for path, result in zip(paths, results)
+                ]
+            elif 'content' in request:
+                with diagnostics.collecting() as warnings:
+                    fixed_content = pipeline(request['content'])
+                response['content'] = fixed_content
+                response['changed'] = fixed_content != request['content']
+                response['warnings'] = warnings
+            else:
+                raise ValueError("A request needs 'paths' or 'content'")
+        except Exception as e:
+            response['error'] = f"{type(e).__name__}: {e}"
+        return response
+
+    def answer(self, line):
+        """The response to one line of input."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {'id': None, 'error': f"Invalid JSON: {e}"}
+        if not isinstance(request, dict):
+            return {'id': None, 'error': "Expected a JSON object"}
+        with self.lock:
+            return self.handle(request)
+
+    def serve_stream(self, reader, writer):
+        """Answer each line read from reader on writer, until reader runs out."""
+        for line in reader:
+            if line.strip():
+                writer.write(json.dumps(self.answer(line)) + '\n')
+                writer.flush()
+
+    def serve_stdio(self):
+        """Serve stdin on stdout; anything else printed goes to stderr."""
+        out = sys.stdout
+        sys.stdout = sys.stderr
+        try:
+            self.serve_stream(sys.stdin, out)
+        finally:
+            sys.stdout = out
+
+    def serve_socket(self, path):
+        """Serve every client that connects to a Unix socket at path, until interrupted."""
+        try:
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                os.unlink(path)  # left behind by a server that didn't exit cleanly
+        except FileNotFoundError:
+            pass
+
+        if threading.current_thread() is threading.main_thread():
+            # Stop the same way, socket removed, when a process manager asks
+            signal.signal(signal.SIGTERM, _interrupt)
+
+        with _UnixServer(path, _Handler) as server:
+            server.fixer = self
+            print(f"🔌 Serving the MDX fixers on {path}; press Ctrl-C to stop")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print("\n👋 Stopped serving")
+            finally:
+                os.unlink(path)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def _init_worker(transform):
+    # Workers started by spawn (the macOS default) get the real stdout,
+    # not the redirected one; keep their prints off the protocol
+    sys.stdout = sys.stderr
+    preload(transform)
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        reader = io.TextIOWrapper(self.rfile, encoding='utf-8')
+        writer = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+        self.server.fixer.serve_stream(reader, writer)
@@ -0,0 +1,176 @@
+"""
+Synthetic MDX pages for benchmarking the fixers.
+
+Pages look like the articles in content/: YAML frontmatter, headings,
+prose with inline code, lists, markdown tables, fenced code and the JSX
+components the site uses (StatsBox, Timeline, FeatureCard, AlertBox,
+ComparisonTable, icon components and Tailwind-styled divs). Page i of a
+corpus is generated from (seed, i) alone, so corpora of any size can be
+streamed without holding them in memory and are identical between runs.
+"""
+
+import random
+
+WORDS = (
+    'model security agent prompt injection defense attack data pipeline '
+    'training inference policy threat detection monitoring access control '
+    'governance compliance risk framework network latency token embedding '
+    'adversarial robustness audit incident response evaluation deployment'
+).split()
+
+CATEGORIES = ['security', 'compliance', 'machine-learning', 'ai-networking', 'infrastructure']
+TAGS = ['AI Security', 'LLM Security', 'Red Team Testing', 'MLOps', 'Governance', 'Zero Trust', 'RAG']
+ICONS = ['Shield', 'Lock', 'AlertTriangle', 'CheckCircle', 'Target', 'Brain', 'Zap']
+COLORS = ['blue', 'red', 'green', 'yellow', 'purple', 'gray']
+LANGUAGES = ['python', 'javascript', 'bash', 'yaml']
+
+
+def _sentence(rng, words=12):
+    text = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(words // 2, words)))
+    if rng.random() < 0.3:
+        text += f" using `{rng.choice(WORDS)}_{rng.choice(WORDS)}()`"
+    return text[0].upper() + text[1:] + '.'
+
+
+def _paragraph(rng):
+    return ' '.join(_sentence(rng) for _ in range(rng.randint(2, 5)))
+
+
+def _title(rng):
+    return ' '.join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(3, 7)))
+
+
+def _frontmatter(rng, index):
+    tags = ''.join(f'  - {tag}\n' for tag in rng.sample(TAGS, rng.randint(2, 4)))
+    return (
+        '---\n'
+        f'title: "{_title(rng)}"\n'
+        f'description: "{_sentence(rng, 20)}"\n'
+        f'date: "2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"\n'
+        f'category: {rng.choice(CATEGORIES)}\n'
+        f'readTime: {rng.randint(5, 40)} min read\n'
+        f'tags:\n{tags}'
+        f'featured: {"true" if index % 10 == 0 else "false"}\n'
+        '---\n'
+    )
+
+
+def _icon(rng):
+    return f'<{rng.choice(ICONS)} className="w-5 h-5 text-{rng.choice(COLORS)}-500" />'
+
+
+def _stats_box(rng):
+    stats = '\n'.join(
+        f'  <div className="text-center">\n'
+        f'    <div className="text-3xl font-bold">{rng.randint(1, 99)}%</div>\n'
+        f'    <div className="text-sm">{_title(rng)}</div>\n'
+        f'  </div>'
+        for _ in range(rng.randint(2, 4))
+    )
+    return f'<StatsBox>\n{stats}\n</StatsBox>'
+
+
+def _timeline(rng):
+    items = '\n'.join(
+        f'  <TimelineItem date="{2020 + i}" title="{_title(rng)}">\n'
+        f'    {_sentence(rng)}\n'
+        f'  </TimelineItem>'
+        for i in range(rng.randint(2, 5))
+    )
+    return f'<Timeline>\n{items}\n</Timeline>'
+
+
+def _feature_card(rng):
+    return (
+        f'<FeatureCard title="{_title(rng)}" icon="{rng.choice(ICONS)}">\n'
+        f'  {_icon(rng)}\n'
+        f'  <p className="text-gray-700 dark:text-gray-300">{_sentence(rng)}</p>\n'
+        f'</FeatureCard>'
+    )
+
+
+def _alert_box(rng):
+    kind = rng.choice(['warning', 'info', 'danger', 'success'])
+    return f'<AlertBox type="{kind}">\n  **{_title(rng)}:** {_sentence(rng)}\n</AlertBox>'
+
+
+def _comparison_table(rng):
+    rows = ', '.join(
+        f'{{ feature: "{_title(rng)}", before: "{rng.choice(WORDS)}", after: "{rng.choice(WORDS)}" }}'
+        for _ in range(rng.randint(2, 5))
+    )
+    return f'<ComparisonTable\n  headers={{["Feature", "Before", "After"]}}\n  rows={{[{rows}]}}\n/>'
+
+
+def _callout_div(rng):
+    color = rng.choice(COLORS)
+    return (
+        f'<div className="bg-{color}-50 dark:bg-{color}-900/20 border-l-4 border-{color}-500 p-6 my-6">\n'
+        f'  <div className="flex items-start gap-3">\n'
+        f'    {_icon(rng)}\n'
+        f'    <div>\n'
+        f'      <h3 className="text-lg font-bold mb-2">{_title(rng)}</h3>\n'
+        f'      <p className="leading-relaxed">{_sentence(rng)}</p>\n'
+        f'    </div>\n'
+        f'  </div>\n'
+        f'</div>'
+    )
+
+
+def _table(rng):
+    columns = rng.randint(2, 5)
+    header = '| ' + ' | '.join(_title(rng) for _ in range(columns)) + ' |'
+    separator = '|' + '|'.join('---' for _ in range(columns)) + '|'
+    rows = [
+        '| ' + ' | '.join(rng.choice(WORDS) for _ in range(columns)) + ' |'
+        for _ in range(rng.randint(2, 8))
+    ]
+    return '\n'.join([header, separator] + rows)
+
+
+def _code_fence(rng):
+    language = rng.choice(LANGUAGES)
+    lines = []
+    for i in range(rng.randint(4, 30)):
+        indent = '    ' * rng.randint(0, 2)
+        lines.append(f'{indent}{rng.choice(WORDS)}_{i} = {rng.choice(WORDS)}({rng.randint(0, 9)})  # <{rng.choice(ICONS)}>')
+    return f'```{language}\n' + '\n'.join(lines) + '\n```'
+
+
+def _list(rng):
+    if rng.random() < 0.5:
+        return '\n'.join(f'- **{_title(rng)}**: {_sentence(rng)}' for _ in range(rng.randint(2, 6)))
+    return '\n'.join(f'{i + 1}. {_sentence(rng)}' for i in range(rng.randint(2, 6)))
+
+
+BLOCKS = [
+    (_paragraph, 6),
+    (_list, 3),
+    (_table, 2),
+    (_code_fence, 2),
+    (_stats_box, 1),
+    (_timeline, 1),
+    (_feature_card, 1),
+    (_alert_box, 1),
+    (_comparison_table, 1),
+    (_callout_div, 2),
+]
+
+
+def synthetic_page(index, seed=0):
+    """Return the text of synthetic page index."""
+    rng = random.Random(f'{seed}:{index}')
+    makers, weights = zip(*BLOCKS)
+
+    parts = [_frontmatter(rng, index).rstrip('\n'), f'# {_title(rng)}', _paragraph(rng)]
+    for _ in range(rng.randint(2, 5)):
+        parts.append(f'## {_title(rng)}')
+        for maker in rng.choices(makers, weights, k=rng.randint(3, 7)):
+            parts.append(maker(rng))
+    return '\n\n'.join(parts) + '\n'
+
+
+def synthetic_corpus(pages, seed=0):
+    """Yield the text of pages synthetic pages, one at a time."""
+    for index in range(pages):
+        yield synthetic_page(index, seed)
@@ -0,0 +1,267 @@
+"""
+Linear-pass MDX/JSX tokenizer.
+
+The fixers used to find tags with patterns like <([A-Z][A-Za-z]*)\\s+([^>]*?)>,
+which backtrack on long lines, match inside code blocks and cannot tell
+which closing tag belongs to which opening tag. iter_tokens walks the text
+once and yields:
+
+  frontmatter   the leading --- YAML block (and any blank lines before it)
+  code_fence    a fenced ``` or ~~~ block, including its fences
+  open          <Name attrs>
+  close         </Name>
+  self_closing  <Name attrs />
+  text          everything else (inline `code` spans stay inside text)
+
+Concatenating the text of every token gives back the input exactly, so a
+fixer can be written as a filter over the token stream followed by render().
+"""
+
+import functools
+import re
+from collections import namedtuple
+
+FRONTMATTER = 'frontmatter'
+CODE_FENCE = 'code_fence'
+OPEN = 'open'
+CLOSE = 'close'
+SELF_CLOSING = 'self_closing'
+TEXT = 'text'
+
+TAG_KINDS = (OPEN, CLOSE, SELF_CLOSING)
+
+# attrs is the raw text between the tag name and > or />, right-stripped
+Token = namedtuple('Token', ['kind', 'start', 'end', 'text', 'name', 'attrs'], defaults=[None, None])
+
+# Blank lines before the opening --- are tolerated when the block starts
+# with a key: field, so they are not confused with a horizontal rule
+FRONTMATTER_RE = re.compile(
+    r'(?:(?:[ \t]*\r?\n)+(?=---[ \t]*\r?\n[A-Za-z_][\w-]*[ \t]*:))?'
+    r'---[ \t]*\r?\n(?:.*?\r?\n)?---[ \t]*(?:\r?\n|$)',
+    re.DOTALL
+)
+FENCE_OPEN_RE = re.compile(r'[ \t]*(`{3,}|~{3,})[^\n]*(?:\n|$)')
+TAG_NAME_RE = re.compile(r'<([A-Za-z][\w.:-]*)')
+CLOSE_TAG_RE = re.compile(r'</([A-Za-z][\w.:-]*)\s*>')
+BLANK_LINE_RE = re.compile(r'\n[ \t]*\n')
+BACKTICKS_RE = re.compile(r'`+')
+
+# Positions worth stopping at: tags, backticks and tildes that may open a
+# fence. A plain character class lets the regex engine skip prose quickly.
+INTERESTING_RE = re.compile(r'[<`~]')
+
+
+@functools.lru_cache(maxsize=None)
+def _fence_close_re(char, length):
+    return re.compile(rf'^[ \t]*{re.escape(char)}{{{length},}}[ \t]*(?:\n|$)', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _backtick_run_re(length):
+    return re.compile(rf'(?<!`)`{{{length}}}(?!`)')
+
+
+def _line_start(text, pos):
+    """
+    Return the start of pos's line if only indentation precedes pos on it,
+    else -1. Fences nested in lists and JSX are indented, and MDX has no
+    indented code blocks, so any indentation is allowed.
+    """
+    while pos > 0 and text[pos - 1] in ' \t':
+        pos -= 1
+    if pos == 0 or text[pos - 1] == '\n':
+        return pos
+    return -1
+
+
+def _scan_tag_end(text, pos):
+    """
+    Scan a tag's attributes starting at pos, skipping quoted strings and
+    {...} expressions. Return the index of the closing '>' or -1.
+
+    A tag never spans a blank line, which bounds the work for a stray '<'.
+    """
+    n = len(text)
+    depth = 0
+    while pos < n:
+        ch = text[pos]
+        if ch in '"\'' or (ch == '`' and depth):
+            close = text.find(ch, pos + 1)
+            if close == -1:
+                return -1
+            if depth == 0 and BLANK_LINE_RE.search(text, pos, close):
+                return -1
+            pos = close + 1
+            continue
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth = max(0, depth - 1)
+        elif ch == '>' and depth == 0:
+            return pos
+        elif ch == '<' and depth == 0:
+            return -1
+        elif ch == '\n' and depth == 0 and BLANK_LINE_RE.match(text, pos):
+            return -1
+        pos += 1
+    return -1
+
+
+def _match_tag(text, pos):
+    """Return a tag Token starting at pos, or None if pos is not a tag."""
+    if text.startswith('</', pos):
+        m = CLOSE_TAG_RE.match(text, pos)
+        if m:
+            return Token(CLOSE, pos, m.end(), m.group(0), m.group(1))
+        return None
+
+    m = TAG_NAME_RE.match(text, pos)
+    if not m:
+        return None
+    end = _scan_tag_end(text, m.end())
+    if end == -1:
+        return None
+
+    attrs = text[m.end():end]
+    if attrs.endswith('/'):
+        return Token(SELF_CLOSING, pos, end + 1, text[pos:end + 1], m.group(1), attrs[:-1].rstrip())
+    return Token(OPEN, pos, end + 1, text[pos:end + 1], m.group(1), attrs.rstrip())
+
+
+def iter_tokens(text):
+    """Yield the tokens of text lazily, in order, in one pass."""
+    n = len(text)
+    pos = 0
+
+    m = FRONTMATTER_RE.match(text)
+    if m:
+        yield Token(FRONTMATTER, 0, m.end(), m.group(0))
+        pos = m.end()
+
+    text_start = pos
+    # Inline code never crosses a blank line; track the current paragraph's
+    # end and the backtick run lengths known to have no closing run in it
+    para_end = -1
+    unclosed_runs = set()
+
+    while pos < n:
+        m = INTERESTING_RE.search(text, pos)
+        if not m:
+            break
+        pos = m.start()
+        ch = text[pos]
+
+        line_start = _line_start(text, pos) if ch in '`~' else -1
+        if line_start != -1:
+            fence = FENCE_OPEN_RE.match(text, line_start)
+            if fence:
+                marker = fence.group(1)
+                close = _fence_close_re(marker[0], len(marker)).search(text, fence.end())
+                end = close.end() if close else n
+                if fence.start() > text_start:
+                    yield Token(TEXT, text_start, fence.start(), text[text_start:fence.start()])
+                yield Token(CODE_FENCE, fence.start(), end, text[fence.start():end])
+                pos = text_start = end
+                continue
+
+        if ch == '`':
+            run = BACKTICKS_RE.match(text, pos).end() - pos
+            if pos >= para_end:
+                blank = BLANK_LINE_RE.search(text, pos)
+                para_end = blank.start() if blank else n
+                unclosed_runs = set()
+            if run not in unclosed_runs:
+                close = _backtick_run_re(run).search(text, pos + run, para_end)
+                if close:
+                    # Inline code is opaque: skip over it as part of the text
+                    pos = close.end()
+                    continue
+                unclosed_runs.add(run)
+            pos += run
+            continue
+
+        if ch == '<':
+            tag = _match_tag(text, pos)
+            if tag:
+                if pos > text_start:
+                    yield Token(TEXT, text_start, pos, text[text_start:pos])
+                yield tag
+                pos = text_start = tag.end
+                continue
+
+        pos += 1
+
+    if text_start < n:
+        yield Token(TEXT, text_start, n, text[text_start:])
+
+
+def tokenize(text):
+    """Return the full token list for text."""
+    return list(iter_tokens(text))
+
+
+def render(tokens):
+    """Join tokens back into text."""
+    return ''.join(token.text for token in tokens)
+
+
+def make_tag(kind, name, attrs=''):
+    """Build a new tag token (offsets are -1 because it has no source)."""
+    attrs = attrs or ''
+    if kind == OPEN:
+        text = f'<{name}{attrs}>'
+    elif kind == SELF_CLOSING:
+        text = f'<{name}{attrs} />'
+    else:
+        text = f'</{name}>'
+    return Token(kind, -1, -1, text, name, attrs if kind != CLOSE else None)
+
+
+def text_token(text):
+    """Build a new text token."""
+    return Token(TEXT, -1, -1, text)
+
+
+def match_tags(tokens):
+    """
+    Pair opening and closing tags with a stack in one pass.
+
+    Returns (pairs, unmatched) where pairs maps the index of each open tag to
+    the index of its close tag and back, and unmatched lists the indexes of
+    open and close tags that have no partner. A close tag pops back to the
+    nearest open tag with the same name; opens skipped over are unmatched.
+    """
+    pairs = {}
+    unmatched = []
+    stack = []
+    # name -> depths in stack holding an open tag of that name, so a close
+    # tag finds its partner without walking the stack
+    open_depths = {}
+
+    for i, token in enumerate(tokens):
+        if token.kind == OPEN:
+            open_depths.setdefault(token.name, []).append(len(stack))
+            stack.append(i)
+        elif token.kind == CLOSE:
+            depths = open_depths.get(token.name)
+            if not depths:
+                unmatched.append(i)
+                continue
+            depth = depths[-1]
+            # Everything opened above the partner was never closed
+            for skipped in stack[depth + 1:]:
+                open_depths[tokens[skipped].name].pop()
+                unmatched.append(skipped)
+            depths.pop()
+            pairs[stack[depth]] = i
+            pairs[i] = stack[depth]
+            del stack[depth:]
+
+    unmatched.extend(stack)
+    unmatched.sort()
+    return pairs, unmatched
+
+
+def is_component(name):
+    """JSX components are capitalised; HTML elements are not."""
+    return bool(name) and name[0].isupper()
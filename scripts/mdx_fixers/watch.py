@@ -0,0 +1,188 @@
+"""
+Watch mode: re-fix MDX pages as they are saved.
+
+watch() stays running, notices MDX files under a directory changing and
+sends just those files through a transform, usually the fused Pipeline.
+Saves that arrive in a burst (an editor writing several files, a git
+checkout) are debounced into one batch. The transform's scripts are
+loaded once up front, in this process and in a warm worker pool, so a
+batch pays only for the fixing itself; a single saved file is fixed in
+this process without any IPC.
+
+File-system events come from watchdog when it is installed; otherwise the
+directory is polled by stat. Either way a file is only fixed when its
+size or mtime differs from what was last seen, so the watcher's own
+writes don't set it off again.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # fall back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+from .runner import default_jobs, print_result, run_tasks
+from .scripts import preload
+
+# Seconds between polls of the directory, or of the event queue with watchdog
+POLL_INTERVAL = 0.2
+EVENT_INTERVAL = 0.02
+
+# Seconds without a new save before a batch is fixed
+DEBOUNCE = 0.1
+
+
+def _stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def scan(root, suffix='.mdx'):
+    """Map every file under root ending in suffix to its (mtime_ns, size)."""
+    found = {}
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    found[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+class _EventQueue(FileSystemEventHandler):
+    """Collects the paths watchdog reports, for Watcher.poll to pick up."""
+
+    def __init__(self, suffix):
+        self.suffix = suffix
+        self.paths = set()
+        self.lock = threading.Lock()
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', None)):
+            if path and path.endswith(self.suffix):
+                with self.lock:
+                    self.paths.add(path)
+
+    def drain(self):
+        with self.lock:
+            paths, self.paths = self.paths, set()
+        return paths
+
+
+class Watcher:
+    """The MDX files under a directory, and which of them changed since last asked."""
+
+    def __init__(self, root, suffix='.mdx'):
+        self.root = os.path.abspath(root)
+        self.suffix = suffix
+        self.known = scan(self.root, suffix)
+        self.observer = None
+        if Observer is not None:
+            self.queue = _EventQueue(suffix)
+            self.observer = Observer()
+            self.observer.schedule(self.queue, self.root, recursive=True)
+            self.observer.start()
+        self.backend = 'watchdog' if self.observer else 'polling'
+        self.interval = EVENT_INTERVAL if self.observer else POLL_INTERVAL
+
+    def poll(self):
+        """The files that were created or modified since the last poll."""
+        if self.observer:
+            candidates = self.queue.drain()
+        else:
+            current = scan(self.root, self.suffix)
+            for path in self.known.keys() - current.keys():
+                del self.known[path]
+            candidates = [path for path, stat in current.items() if stat != self.known.get(path)]
+
+        changed = []
+        for path in candidates:
+            stat = _stat(path)
+            if stat is None:
+                self.known.pop(path, None)
+            elif stat != self.known.get(path):
+                self.known[path] = stat
+                changed.append(path)
+        return changed
+
+    def refresh(self, paths):
+        """Take note of files written by the fixers themselves."""
+        for path in paths:
+            self.known[os.fspath(path)] = _stat(path)
+
+    def wait(self, debounce=DEBOUNCE):
+        """Block until files change, then until none has for debounce seconds; return them."""
+        batch = set()
+        last = None
+        while True:
+            changed = self.poll()
+            now = time.monotonic()
+            if changed:
+                batch.update(changed)
+                last = now
+            elif batch and now - last >= debounce:
+                return sorted(batch)
+            time.sleep(self.interval)
+
+    def close(self):
+        if self.observer:
+            self.observer.stop()
+            self.observer.join()
+
+
+def _ready(_):
+    return os.getpid()
+
+
+def watch(root, transform, jobs=None, cache=None, debounce=DEBOUNCE):
+    """Fix the MDX files under root with transform whenever they are saved, until interrupted."""
+    jobs = jobs or default_jobs()
+    preload(transform)
+    executor = None
+    if jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=preload, initargs=(transform,))
+        # Start every worker now, so the first big batch doesn't wait for them
+        list(executor.map(_ready, range(jobs)))
+
+    watcher = Watcher(root)
+    print(f"👀 Watching {len(watcher.known)} files under {root} ({watcher.backend}); press Ctrl-C to stop")
+    try:
+        while True:
+            paths = watcher.wait(debounce)
+            start = time.perf_counter()
+            results = run_tasks([(path, transform) for path in paths], jobs, False, cache, executor)
+            elapsed = time.perf_counter() - start
+
+            for result in results:
+                print_result(result)
+            watcher.refresh(r.path for r in results if r.changed)
+            print(f"⚡ Batch of {len(results)} files done in {elapsed * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+        if executor is not None:
+            executor.shutdown()
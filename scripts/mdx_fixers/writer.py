@@ -0,0 +1,102 @@
+"""
+Write layer for the fixer scripts.
+
+Files are only written when their content actually changes, so unchanged
+pages keep their mtime and Next.js incremental builds and file watchers
+are not triggered. Writes go to a temporary file in the same directory
+that is then renamed over the original, so an interrupted run never leaves
+a half-written MDX file behind.
+"""
+
+import contextlib
+import os
+import tempfile
+
+
+@contextlib.contextmanager
+def atomic_open(path, mode='w', encoding='utf-8'):
+    """
+    Open a temp file next to path for writing; on success it is synced and
+    renamed over path, on error it is removed and path is left untouched.
+    """
+    path = os.fspath(path)
+    directory, name = os.path.split(os.path.abspath(path))
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+    try:
+        if 'b' in mode:
+            f = os.fdopen(fd, mode)
+        else:
+            f = os.fdopen(fd, mode, encoding=encoding, newline='')
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        # mkstemp creates files as 0600; keep the original file's permissions
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_write(path, content, encoding='utf-8'):
+    """Write content to path via a temp file and rename."""
+    with atomic_open(path, 'w', encoding) as f:
+        f.write(content)
+
+
+def write_if_changed(path, content, original=None, encoding='utf-8'):
+    """
+    Write content to path only if it differs from what is on disk.
+
+    Pass original when the caller already holds the file's current text to
+    avoid reading it again. Returns True if the file was written.
+    """
+    if original is None:
+        try:
+            with open(path, 'r', encoding=encoding, newline='') as f:
+                original = f.read()
+        except FileNotFoundError:
+            original = None
+
+    if content == original:
+        return False
+
+    atomic_write(path, content, encoding)
+    return True
+
+
+class _Unchanged(Exception):
+    pass
+
+
+def write_chunks_if_changed(path, chunks, original, encoding='utf-8'):
+    """
+    Stream an iterable of text chunks to path, unless together they spell
+    out original. The chunks are checked against original as they are
+    written, so the new text is never held whole. Returns True if the file
+    was written.
+    """
+    pos = 0
+    same = True
+    try:
+        with atomic_open(path, 'w', encoding) as f:
+            for chunk in chunks:
+                same = same and original.startswith(chunk, pos)
+                pos += len(chunk)
+                f.write(chunk)
+            if same and pos == len(original):
+                # atomic_open removes the temp file and leaves path alone
+                raise _Unchanged
+    except _Unchanged:
+        return False
+    return True
@@ -0,0 +1,120 @@
+"""
+Tests for the options shared by the fixer scripts (mdx_fixers/cli.py).
+
+Run with: python -m pytest scripts/tests
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mdx_fixers.cli import add_path_arguments, build_parser  # noqa: E402
+from mdx_fixers.changeset import CHANGED_ENV  # noqa: E402
+from mdx_fixers.dryrun import DRY_RUN_ENV  # noqa: E402
+from mdx_fixers.profiling import PROFILE_ENV  # noqa: E402
+from mdx_fixers.runner import ASYNC_IO_ENV  # noqa: E402
+
+
+class DryRunOptionTest(unittest.TestCase):
+    def parse(self, argv):
+        with mock.patch.dict(os.environ, {DRY_RUN_ENV: ''}):
+            args = add_path_arguments(build_parser()).parse_args(argv)
+            return args, os.environ[DRY_RUN_ENV]
+
+    def test_dry_run_leaves_following_paths_alone(self):
+        args, env = self.parse(['--dry-run', 'a.mdx', 'b.mdx'])
+        self.assertEqual(args.paths, ['a.mdx', 'b.mdx'])
+        self.assertEqual(env, '1')
+
+    def test_report_path_is_a_separate_option(self):
+        args, env = self.parse(['--dry-run', '--dry-run-report', 'report.jsonl', 'a.mdx'])
+        self.assertEqual(args.paths, ['a.mdx'])
+        self.assertEqual(env, 'report.jsonl')
+
+    def test_dry_run_after_report_keeps_the_report_path(self):
+        _, env = self.parse(['--dry-run-report', 'report.jsonl', '--dry-run', 'a.mdx'])
+        self.assertEqual(env, 'report.jsonl')
+
+    def test_dry_run_of_pages_writes_nothing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            pages = [Path(directory, name) for name in ('a.mdx', 'b.mdx')]
+            for page in pages:
+                page.write_text('“quoted”\n', encoding='utf-8')
+            report = Path(directory, 'report.jsonl')
+
+            env = {key: value for key, value in os.environ.items() if not key.startswith('MDX_FIX_')}
+            run = subprocess.run(
+                [sys.executable, str(SCRIPTS_DIR / 'fix-unicode-quotes.py'), '--no-cache', '-j', '1',
+                 '--dry-run', *map(str, pages), '--dry-run-report', str(report)],
+                capture_output=True,
+                env=env
+            )
+
+            # Pending changes fail a dry run, so it works as a CI check
+            self.assertEqual(run.returncode, 1)
+            for page in pages:
+                self.assertEqual(page.read_text(encoding='utf-8'), '“quoted”\n')
+            listed = [json.loads(line)['path'] for line in report.read_text(encoding='utf-8').splitlines()]
+            self.assertEqual(len(listed), 2)
+
+    def test_clean_dry_run_succeeds(self):
+        with tempfile.TemporaryDirectory() as directory:
+            page = Path(directory, 'a.mdx')
+            page.write_text('"plain"\n', encoding='utf-8')
+            env = {key: value for key, value in os.environ.items() if not key.startswith('MDX_FIX_')}
+            run = subprocess.run(
+                [sys.executable, str(SCRIPTS_DIR / 'fix-unicode-quotes.py'), '--no-cache', '-j', '1',
+                 '--dry-run', str(page), '--dry-run-report', str(Path(directory, 'report.jsonl'))],
+                capture_output=True,
+                env=env
+            )
+            self.assertEqual(run.returncode, 0)
+
+    def test_report_over_a_page_is_refused(self):
+        with tempfile.TemporaryDirectory() as directory:
+            page = Path(directory, 'a.mdx')
+            page.write_text('text\n', encoding='utf-8')
+            with self.assertRaises(SystemExit) as raised, mock.patch('sys.stdout'):
+                self.parse(['--dry-run-report', str(page), str(page)])
+            self.assertEqual(raised.exception.code, 1)
+            self.assertEqual(page.read_text(encoding='utf-8'), 'text\n')
+
+
+class SwitchOptionTest(unittest.TestCase):
+    """--changed, --profile and --async-io are flags; their values have options of their own."""
+
+    def parse(self, argv, env):
+        with mock.patch.dict(os.environ, {env: ''}), mock.patch('mdx_fixers.changeset.changed_files'):
+            args = add_path_arguments(build_parser()).parse_args(argv)
+            return args, os.environ[env]
+
+    def test_flags_leave_following_paths_alone(self):
+        for flag, env in (('--changed', CHANGED_ENV), ('--profile', PROFILE_ENV), ('--async-io', ASYNC_IO_ENV)):
+            with self.subTest(flag=flag):
+                args, value = self.parse([flag, 'content/blog/x.mdx'], env)
+                self.assertEqual(args.paths, ['content/blog/x.mdx'])
+                self.assertEqual(value, '1')
+
+    def test_valued_options(self):
+        cases = (
+            ('--changed-since', 'HEAD~1', CHANGED_ENV),
+            ('--profile-dir', 'profile', PROFILE_ENV),
+            ('--queue-depth', '4', ASYNC_IO_ENV),
+        )
+        for option, value, env in cases:
+            with self.subTest(option=option):
+                args, stored = self.parse([option, value, 'x.mdx'], env)
+                self.assertEqual(args.paths, ['x.mdx'])
+                self.assertEqual(stored, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for the dry-run report (mdx_fixers/dryrun.py).
+
+Run with: python -m pytest scripts/tests
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mdx_fixers.dryrun import unified_diff  # noqa: E402
+
+
+class UnifiedDiffTest(unittest.TestCase):
+    CASES = (
+        ('both end with a newline', 'one\ntwo\n', 'one\n2\n'),
+        ('newline removed', 'one\ntwo\n', 'one\ntwo'),
+        ('newline added', 'one\ntwo', 'one\ntwo\n'),
+        ('neither ends with a newline', 'one\ntwo', 'one\n2'),
+    )
+
+    def test_missing_newline_is_marked(self):
+        diff = unified_diff('a.mdx', 'one\ntwo\n', 'one\ntwo')
+        self.assertTrue(diff.endswith('-two\n+two\n\\ No newline at end of file\n'))
+        self.assertNotIn('No newline', unified_diff('a.mdx', 'one\n', 'two\n'))
+
+    @unittest.skipUnless(shutil.which('git'), 'git is not installed')
+    def test_git_applies_the_diff(self):
+        for name, before, after in self.CASES:
+            with self.subTest(name), tempfile.TemporaryDirectory() as directory:
+                page = Path(directory, 'a.mdx')
+                page.write_text(before, encoding='utf-8')
+                # The diff names the page by its path under /, less the root
+                run = subprocess.run(
+                    ['git', 'apply', '-'],
+                    input=unified_diff(page, before, after),
+                    capture_output=True,
+                    text=True,
+                    cwd='/'
+                )
+                self.assertEqual(run.returncode, 0, run.stderr)
+                self.assertEqual(page.read_text(encoding='utf-8'), after)
+
+
+if __name__ == '__main__':
+    unittest.main()
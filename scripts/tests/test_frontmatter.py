@@ -0,0 +1,91 @@
+"""
+Tests for the frontmatter parser's fallback when PyYAML isn't installed.
+
+Run with: python -m pytest scripts/tests
+"""
+
+import datetime
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mdx_fixers import frontmatter  # noqa: E402
+from mdx_fixers.scripts import load_script  # noqa: E402
+
+
+HEADER = '''---
+title: "Red teaming: a primer"
+date: 2025-01-02
+toc: true
+draft: no
+image: ~
+readTime: 12
+score: 3.5
+tags: [ai, "red team", 2025]
+categories:
+  - security
+  - 'ml ops'
+author:
+  name: perfecXion Team
+  role: AI Security Experts
+description: >-
+  A first look
+  at red teaming.
+---
+'''
+
+
+class FallbackParserTest(unittest.TestCase):
+    """Without PyYAML the header must come out as yaml.safe_load would read it."""
+
+    def setUp(self):
+        patcher = mock.patch.object(frontmatter, 'yaml', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(frontmatter._parse.cache_clear)
+        frontmatter._parse.cache_clear()
+
+    def test_scalars_are_typed(self):
+        fm = frontmatter.Frontmatter(HEADER)
+        self.assertEqual(fm.data, {
+            'title': 'Red teaming: a primer',
+            'date': datetime.date(2025, 1, 2),
+            'toc': True,
+            'draft': False,
+            'image': None,
+            'readTime': 12,
+            'score': 3.5,
+            'tags': ['ai', 'red team', 2025],
+            'categories': ['security', 'ml ops'],
+            'author': {'name': 'perfecXion Team', 'role': 'AI Security Experts'},
+            'description': 'A first look at red teaming.',
+        })
+
+    def test_plain_values_that_stay_strings(self):
+        for text in ('-.5', 'v1.2', '2025-13-45', 'yes please', 'null-ish'):
+            with self.subTest(text=text):
+                self.assertEqual(frontmatter.parse(f"key: {text}"), {'key': text})
+
+    def test_numbers_in_other_bases(self):
+        self.assertEqual(frontmatter.parse('a: 0x1f\nb: 010\nc: 0b101'), {'a': 31, 'b': 8, 'c': 5})
+
+    def test_matches_pyyaml(self):
+        try:
+            import yaml
+        except ImportError:
+            self.skipTest('PyYAML is not installed')
+        text = frontmatter.Frontmatter(HEADER).yaml_text
+        self.assertEqual(frontmatter.parse(text), yaml.safe_load(text))
+
+    def test_toc_flag_adds_featured(self):
+        fm = frontmatter.Frontmatter(HEADER)
+        load_script('fix-blog-formatting').edit_frontmatter(fm)
+        self.assertIn('featured: false\ntoc: true', fm.text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for the shared rule registry (mdx_fixers/rules.py).
+
+Run with: python -m pytest scripts/tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mdx_fixers import rules  # noqa: E402
+from mdx_fixers.pipeline import Pipeline  # noqa: E402
+
+SAMPLE = '''import Foo from "./foo";
+
+# Heading
+Text with className="a"b and “quotes”.
+- one
+- two
+- three
+Next
+
+<div>
+`<div class="x">`
+</div>
+
+
+
+```python
+print("code ✓")
+```
+<StatsBox  stats="{[{ label: "A", value: [1, 2] }]}"/>
+<Timeline items="{[{ year: 2024 }]}" />
+<ComparisonTable rows="{[["a", "b"]]}" />
+'''
+
+
+class RuleMetadataTest(unittest.TestCase):
+    def test_idempotent_rules_are(self):
+        for rule in rules.RULES.values():
+            with self.subTest(rule=rule.name):
+                once = rule(SAMPLE)
+                if rule.idempotent:
+                    self.assertEqual(rule(once), once)
+
+    def test_rules_marked_otherwise_change_their_own_output(self):
+        for rule in (rules.BLANK_LINE_BEFORE_DIV, rules.BLANK_LINE_AFTER_LIST):
+            with self.subTest(rule=rule.name):
+                once = rule(SAMPLE)
+                self.assertNotEqual(rule(once), once)
+
+    def test_prose_rules_leave_code_alone(self):
+        fixed = rules.STRIP_NON_ASCII(SAMPLE)
+        self.assertIn('code ✓', fixed)
+        self.assertNotIn('“quotes”', fixed)
+
+    def test_chain_runs_stages_in_order_once_each(self):
+        chain = rules.chain('collapse-blank-lines', rules.BLANK_LINE_BEFORE_DIV, 'collapse-blank-lines')
+        self.assertEqual([rule.name for rule in chain.rules], ['blank-line-before-div', 'collapse-blank-lines'])
+        self.assertEqual(chain('a\n<div>'), 'a\n\n<div>')
+
+    def test_unknown_rule(self):
+        with self.assertRaises(ValueError):
+            rules.chain('no-such-rule')
+
+    def test_dequote_components(self):
+        fixed = rules.DEQUOTE_COMPONENTS(SAMPLE)
+        self.assertIn('<StatsBox stats={[{ label: "A", value: [1, 2] }]} />', fixed)
+        self.assertIn('<Timeline items={[{ year: 2024 }]} />', fixed)
+        self.assertIn('rows={[["a", "b"]]}', fixed)
+
+
+class DeduplicatedTest(unittest.TestCase):
+    def test_unchanged_text_is_not_scanned_again(self):
+        rule = rules.COLLAPSE_BLANK_LINES
+        with rules.deduplicated():
+            fixed = rule(SAMPLE)
+            with mock.patch.object(rule, 'pattern') as pattern:
+                self.assertIs(rule(fixed), fixed)
+                pattern.sub.assert_not_called()
+
+                # Changed text is scanned, and nothing is skipped outside the block
+                rule(fixed + '\n')
+                self.assertEqual(pattern.sub.call_count, 1)
+        with mock.patch.object(rule, 'pattern') as pattern:
+            rule(fixed)
+            pattern.sub.assert_called_once()
+
+    def test_non_idempotent_rules_always_run(self):
+        rule = rules.BLANK_LINE_BEFORE_DIV
+        with rules.deduplicated():
+            once = rule(SAMPLE)
+            self.assertNotEqual(rule(once), once)
+
+    def test_pipeline_output_is_unchanged(self):
+        pipeline = Pipeline(['final-issues', 'specific-errors', 'remaining-errors', 'syntax-final'])
+        deduplicated = pipeline(SAMPLE)
+        with mock.patch.object(rules, 'deduplicated', mock.MagicMock()):
+            self.assertEqual(pipeline(SAMPLE), deduplicated)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for the batch runner (mdx_fixers/runner.py).
+
+Run with: python -m pytest scripts/tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mdx_fixers import runner  # noqa: E402
+from mdx_fixers.guard import FILE_BUDGET_ENV  # noqa: E402
+
+
+class QuarantineReportTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.report = self.directory / 'quarantine.json'
+        self.page = self.directory / 'a.mdx'
+        self.page.write_text('text\n', encoding='utf-8')
+
+    def run_corpus(self, env):
+        # The default path is bound when the function is defined
+        write = runner.write_quarantine_report
+        with mock.patch.dict(os.environ, env), \
+                mock.patch.object(runner, 'write_quarantine_report',
+                                  side_effect=lambda results: write(results, self.report)), \
+                mock.patch('sys.stdout'):
+            return runner.run_corpus([self.page], str.upper, jobs=1)
+
+    def test_quarantined_files_are_listed(self):
+        diagnostic = {'path': 'a.mdx', 'scope': 'file'}
+        results = [runner.FileResult(self.page, False, 'Quarantined', quarantine=diagnostic)]
+        with mock.patch('sys.stdout'):
+            self.assertEqual(runner.write_quarantine_report(results, self.report), 1)
+        self.assertEqual(json.loads(self.report.read_text(encoding='utf-8')), [diagnostic])
+
+    def test_clean_budgeted_run_removes_a_stale_report(self):
+        self.report.write_text('[{"path": "old.mdx"}]\n', encoding='utf-8')
+        self.run_corpus({FILE_BUDGET_ENV: '30'})
+        self.assertFalse(self.report.exists())
+
+    def test_unbudgeted_run_leaves_the_report_alone(self):
+        self.report.write_text('[{"path": "old.mdx"}]\n', encoding='utf-8')
+        self.run_corpus({FILE_BUDGET_ENV: ''})
+        self.assertTrue(self.report.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()